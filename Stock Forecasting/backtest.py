@@ -0,0 +1,188 @@
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from itertools import product
+from multiprocessing import shared_memory
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from utility import Config
+
+@dataclass(frozen = True)
+class SignalRule:
+    column: str
+    entry_threshold: float
+    exit_threshold: float
+    direction: int = 1
+
+@dataclass
+class BacktestResult:
+    column: str
+    entry_threshold: float
+    exit_threshold: float
+    direction: int
+    num_symbols: int
+    num_trades: int
+    hit_rate: float
+    mean_net_returns: float
+    median_net_returns: float
+    mean_max_drawdown: float
+    exposure: float
+
+SIGNAL_GRIDS = {
+    "MA-S (1-15-15)": (np.round(np.linspace(-0.9, 0.9, 19), 2), 1),
+    "MA-S (5-100-20)": (np.round(np.linspace(-0.9, 0.9, 19), 2), 1),
+    "% Change from 15 MA": (np.arange(-10, 10.5, 1.0), 1),
+    "% Change from 50 MA": (np.arange(-20, 21, 2.0), 1),
+    "% Change from 200 MA": (np.arange(-30, 31, 3.0), 1),
+}
+
+def expand_grid(
+    column: str,
+    thresholds: np.ndarray,
+    direction: int = 1
+) -> list[SignalRule]:
+    return [
+        SignalRule(column, float(entry), float(exit), direction)
+        for entry, exit in product(thresholds, thresholds)
+        if (entry - exit) * direction > 0
+    ]
+
+def load_matrices(
+    all_consolidated_path: Path,
+    columns: list[str]
+) -> dict[str, np.ndarray]:
+    stock_dfs = pd.read_parquet(
+        all_consolidated_path,
+        columns = ['Date', 'Symbol', 'Prev Close', 'Close'] + columns
+    )
+    stock_dfs['Returns'] = (stock_dfs['Close'] / stock_dfs['Prev Close']) - 1
+
+    return {
+        col: stock_dfs.pivot(
+            index = 'Date',
+            columns = 'Symbol',
+            values = col
+        ).sort_index().to_numpy(dtype = np.float64)
+        for col in ['Returns'] + columns
+    }
+
+def evaluate_rule(
+    rule: SignalRule,
+    feature: np.ndarray,
+    returns: np.ndarray
+) -> BacktestResult:
+    is_listed = ~np.isnan(returns)
+    signal = np.full(feature.shape, np.nan)
+    signal[(feature - rule.entry_threshold) * rule.direction >= 0] = 1
+    signal[(feature - rule.exit_threshold) * rule.direction <= 0] = 0
+
+    rows = np.arange(signal.shape[0])[:, np.newaxis]
+    last_signal = np.maximum.accumulate(np.where(np.isnan(signal), 0, rows), axis = 0)
+    position = np.nan_to_num(np.take_along_axis(signal, last_signal, axis = 0))
+
+    held = np.zeros_like(position, dtype = bool)
+    held[1:] = (position[:-1] == 1) & is_listed[1:]
+    log_returns = np.where(held, np.log1p(np.nan_to_num(returns)), 0.0)
+
+    equity = np.exp(np.cumsum(log_returns, axis = 0))
+    max_drawdown = (equity / np.maximum.accumulate(equity, axis = 0) - 1).min(axis = 0)
+
+    trade_starts = held.copy()
+    trade_starts[1:] &= ~held[:-1]
+    trade_ids = np.cumsum(trade_starts.ravel(order = 'F')).reshape(held.shape, order = 'F')
+    trade_returns = np.bincount(
+        trade_ids[held],
+        weights = log_returns[held],
+        minlength = trade_ids.max() + 1
+    )[1:]
+
+    has_data = is_listed.any(axis = 0)
+    net_returns = equity[-1, has_data] - 1
+
+    return BacktestResult(
+        rule.column,
+        rule.entry_threshold,
+        rule.exit_threshold,
+        rule.direction,
+        int(has_data.sum()),
+        int(trade_returns.size),
+        float((trade_returns > 0).mean()) if trade_returns.size else np.nan,
+        float(net_returns.mean()),
+        float(np.median(net_returns)),
+        float(max_drawdown[has_data].mean()),
+        float(held[:, has_data].sum() / is_listed[:, has_data].sum())
+    )
+
+_shared_blocks: dict[str, shared_memory.SharedMemory] = {}
+_shared_arrays: dict[str, np.ndarray] = {}
+
+def _attach_shared_arrays(specs: dict[str, tuple[str, tuple[int, ...]]]):
+    for col, (shm_name, shape) in specs.items():
+        _shared_blocks[col] = shared_memory.SharedMemory(name = shm_name)
+        _shared_arrays[col] = np.ndarray(shape, dtype = np.float64, buffer = _shared_blocks[col].buf)
+
+def _evaluate_rules(rules: list[SignalRule]) -> list[BacktestResult]:
+    return [
+        evaluate_rule(rule, _shared_arrays[rule.column], _shared_arrays['Returns'])
+        for rule in rules
+    ]
+
+def run_backtests(
+    matrices: dict[str, np.ndarray],
+    rules: list[SignalRule],
+    max_workers: int | None = None,
+    chunk_size: int = 25
+) -> pd.DataFrame:
+    blocks = []
+    specs = {}
+
+    try:
+        for col, matrix in matrices.items():
+            block = shared_memory.SharedMemory(create = True, size = max(matrix.nbytes, 1))
+            np.ndarray(matrix.shape, dtype = np.float64, buffer = block.buf)[:] = matrix
+            blocks.append(block)
+            specs[col] = (block.name, matrix.shape)
+
+        chunks = [rules[i : i + chunk_size] for i in range(0, len(rules), chunk_size)]
+
+        with ProcessPoolExecutor(
+            max_workers = max_workers,
+            initializer = _attach_shared_arrays,
+            initargs = (specs,)
+        ) as executor:
+            results = [res for chunk_res in executor.map(_evaluate_rules, chunks) for res in chunk_res]
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    return pd.DataFrame([asdict(res) for res in results])
+
+if __name__ == "__main__":
+    parser = ArgumentParser(prog = "Signal Backtest")
+    parser.add_argument("-c", "--columns", nargs = "+", choices = list(SIGNAL_GRIDS), default = list(SIGNAL_GRIDS))
+    parser.add_argument("-w", "--workers", type = int, default = None)
+    parser.add_argument("-t", "--top", type = int, default = 10)
+    parser.add_argument("-o", "--out", type = Path, default = None)
+    args = parser.parse_args()
+
+    CONFIG = Config(Path("config.json"))
+
+    start_time = perf_counter()
+    matrices = load_matrices(CONFIG.NSE_DATA_DIR.joinpath("all_consolidated.parquet"), args.columns)
+    rules = [
+        rule for col in args.columns
+        for rule in expand_grid(col, *SIGNAL_GRIDS[col])
+    ]
+    results = run_backtests(matrices, rules, args.workers)
+    print(f"> Evaluated {len(rules)} signal rules over {matrices['Returns'].shape[1]} symbols in {perf_counter() - start_time:.2f}s.")
+
+    results = results.sort_values('mean_net_returns', ascending = False)
+    print(results.head(args.top).to_string(index = False))
+
+    if args.out is not None:
+        results.to_csv(args.out, index = False)
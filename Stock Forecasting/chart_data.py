@@ -0,0 +1,188 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+
+from output_writer import OutputWriter
+
+CHART_MODES = ("png", "client")
+DEFAULT_COLOR = "steelblue"
+
+def _filled(values: np.ndarray) -> np.ndarray:
+    return pd.DataFrame(values.T).interpolate(limit_direction = 'both').fillna(0).to_numpy().T
+
+def lttb_indices(values: pd.Series | np.ndarray, max_points: int) -> np.ndarray:
+    values = _filled(np.atleast_2d(np.asarray(values, dtype = np.float64)))
+    num_points = values.shape[1]
+
+    if num_points <= max_points or max_points < 3:
+        return np.arange(num_points)
+
+    # Largest-Triangle-Three-Buckets: keep the first and last points and, from
+    # each bucket in between, the point forming the largest triangle with the
+    # previously kept point and the mean of the next bucket. With several
+    # series the triangle areas are summed, so one set of points serves all.
+    edges = np.linspace(1, num_points - 1, max_points - 1).astype(np.int64)
+    keep = np.empty(max_points, dtype = np.int64)
+    keep[0] = 0
+    keep[-1] = num_points - 1
+
+    for b in range(max_points - 2):
+        start, end = edges[b], edges[b + 1]
+        next_end = edges[b + 2] if b + 2 < edges.size else num_points
+        next_x = (end + next_end - 1) / 2
+        next_y = values[:, end:next_end].mean(axis = 1)
+
+        prev = keep[b]
+        x = np.arange(start, end)
+        areas = np.abs(
+            (prev - next_x) * (values[:, start:end] - values[:, [prev]]) -
+            (prev - x) * (next_y - values[:, prev])[:, None]
+        ).sum(axis = 0)
+        keep[b + 1] = start + np.argmax(areas)
+
+    return keep
+
+def downsample_indices(
+    num_points: int,
+    max_points: int,
+    series: list[pd.Series | np.ndarray] = ()
+) -> np.ndarray:
+    if num_points <= max_points:
+        return np.arange(num_points)
+
+    if len(series) == 0:
+        return np.unique(np.linspace(0, num_points - 1, max_points).round().astype(np.int64))
+
+    # Series are scaled to a common range so each counts equally towards the
+    # shared selection, which keeps the output within max_points.
+    values = _filled(np.vstack([np.asarray(values, dtype = np.float64) for values in series]))
+    low = values.min(axis = 1, keepdims = True)
+    spread = values.max(axis = 1, keepdims = True) - low
+    return lttb_indices((values - low) / np.where(spread > 0, spread, 1), max_points)
+
+def _to_list(values, decimals: int) -> list:
+    values = np.asarray(values, dtype = np.float64).round(decimals)
+    return [None if np.isnan(v) else v.item() for v in values]
+
+def line_chart(
+    title: str,
+    x_label: str,
+    y_label: str,
+    x: pd.Series | np.ndarray | list,
+    series: list[tuple[str, pd.Series | np.ndarray, str]],
+    hlines: list[tuple[float, str, str]] = (),
+    vlines: list[float] = (),
+    bands: list[tuple[str, np.ndarray, np.ndarray, str, float]] = (),
+    y_range: tuple[float, float] | None = None,
+    max_points: int = 250,
+    decimals: int = 3
+) -> dict:
+    keep = downsample_indices(len(x), max_points, [y for _, y, _ in series])
+    x = pd.Series(x).iloc[keep]
+
+    if pd.api.types.is_datetime64_any_dtype(x):
+        x_type = "date"
+        x_values = (x.to_numpy(dtype = 'datetime64[D]').astype(np.int64)).tolist()
+    elif pd.api.types.is_numeric_dtype(x):
+        x_type = "number"
+        x_values = _to_list(x, decimals)
+    else:
+        x_type = "category"
+        x_values = x.astype(str).tolist()
+
+    chart = {
+        "title": title,
+        "x_label": x_label,
+        "y_label": y_label,
+        "x_type": x_type,
+        "x": x_values,
+        "series": [
+            {"label": label, "color": color, "y": _to_list(np.asarray(y)[keep], decimals)}
+            for label, y, color in series
+        ]
+    }
+
+    if hlines:
+        chart["hlines"] = [
+            {"y": round(float(y), decimals), "label": label, "color": color} for y, label, color in hlines
+        ]
+
+    if vlines:
+        chart["vlines"] = [float(v) for v in vlines]
+
+    if bands:
+        chart["bands"] = [
+            {
+                "label": label,
+                "lower": _to_list(np.asarray(lower)[keep], decimals),
+                "upper": _to_list(np.asarray(upper)[keep], decimals),
+                "color": color,
+                "opacity": opacity
+            }
+            for label, lower, upper, color, opacity in bands
+        ]
+
+    if y_range is not None:
+        chart["y_range"] = list(y_range)
+
+    return chart
+
+def draw_line_chart(
+    title: str,
+    x_label: str,
+    y_label: str,
+    x: pd.Series | np.ndarray | list,
+    series: list[tuple[str, pd.Series | np.ndarray, str]],
+    hlines: list[tuple[float, str, str]] = (),
+    vlines: list[float] = (),
+    bands: list[tuple[str, np.ndarray, np.ndarray, str, float]] = (),
+    y_range: tuple[float, float] | None = None,
+    max_points: int = 250
+) -> Figure:
+    keep = downsample_indices(len(x), max_points, [y for _, y, _ in series])
+    x = pd.Series(x).iloc[keep]
+    is_category = not (pd.api.types.is_datetime64_any_dtype(x) or pd.api.types.is_numeric_dtype(x))
+    x_values = np.arange(len(x)) if is_category else x.to_numpy()
+
+    figure, ax = plt.subplots(figsize = (10, 5), dpi = 125)
+
+    for label, lower, upper, color, opacity in bands:
+        ax.fill_between(
+            x_values, np.asarray(lower)[keep], np.asarray(upper)[keep],
+            color = color, alpha = opacity, label = label
+        )
+
+    for y, label, color in hlines:
+        ax.axhline(y = y, linestyle = "dashdot", linewidth = 1.5, color = color, label = label or "_nolegend_")
+
+    for v in vlines:
+        ax.axvline(x = v, linestyle = "dotted", color = "grey", linewidth = 1)
+
+    for label, y, color in series:
+        y = np.asarray(y, dtype = np.float64)[keep]
+        ax.plot(
+            x_values, y,
+            c = color,
+            label = label if np.isfinite(y).any() else "_nolegend_",
+            marker = 'o' if is_category else None
+        )
+
+    if is_category:
+        ax.set_xticks(x_values, x.astype(str), rotation = 45, fontsize = 8)
+
+    if y_range is not None:
+        ax.set_ylim(y_range)
+
+    ax.legend()
+    ax.set_xlabel(x_label, fontsize = 12)
+    ax.set_ylabel(y_label, fontsize = 12)
+    ax.set_title(title, fontsize = 14)
+    return figure
+
+def save_chart_data(out_path: Path, symbol: str, charts: dict[str, dict], writer: OutputWriter):
+    payload = json.dumps({"symbol": symbol, "charts": charts}, separators = (',', ':'))
+    writer.write_text(out_path.joinpath(f"{symbol}.js"), f"registerChartData({payload});\n")
@@ -0,0 +1,123 @@
+from collections.abc import Iterator
+
+import numpy as np
+import pandas as pd
+
+def returns_matrix(stock_dfs: pd.DataFrame) -> pd.DataFrame:
+    stock_dfs = stock_dfs[['Date', 'Symbol', 'Prev Close', 'Close']]
+
+    return stock_dfs.assign(
+        Returns = (stock_dfs['Close'] / stock_dfs['Prev Close']) - 1
+    ).pivot(
+        index = 'Date',
+        columns = 'Symbol',
+        values = 'Returns'
+    ).sort_index()
+
+class RollingCovariance:
+    def __init__(self, num_symbols: int) -> None:
+        self.counts = np.zeros((num_symbols, num_symbols))
+        self.sums = np.zeros((num_symbols, num_symbols))
+        self.squared_sums = np.zeros((num_symbols, num_symbols))
+        self.product_sums = np.zeros((num_symbols, num_symbols))
+
+    def update(self, rows: np.ndarray, signs: np.ndarray):
+        rows = np.atleast_2d(rows)
+        is_valid = (~np.isnan(rows)).astype(np.float64)
+        values = np.nan_to_num(rows)
+        signed_valid = is_valid * signs[:, None]
+
+        self.counts += is_valid.T @ signed_valid
+        self.sums += values.T @ signed_valid
+        self.squared_sums += (values ** 2).T @ signed_valid
+        self.product_sums += values.T @ (values * signs[:, None])
+
+    def add(self, rows: np.ndarray):
+        rows = np.atleast_2d(rows)
+        self.update(rows, np.ones(len(rows)))
+
+    def remove(self, rows: np.ndarray):
+        rows = np.atleast_2d(rows)
+        self.update(rows, -np.ones(len(rows)))
+
+    def reset(self, rows: np.ndarray):
+        for matrix in (self.counts, self.sums, self.squared_sums, self.product_sums):
+            matrix.fill(0)
+        self.add(rows)
+
+    def covariance(self, min_periods: int = 2) -> np.ndarray:
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            cov = (self.product_sums - self.sums * self.sums.T / self.counts) / (self.counts - 1)
+        cov[self.counts < min_periods] = np.nan
+        return cov
+
+    def correlation(self, min_periods: int = 2) -> np.ndarray:
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            variances = self.squared_sums - self.sums ** 2 / self.counts
+            corr = (
+                self.product_sums - self.sums * self.sums.T / self.counts
+            ) / np.sqrt(variances * variances.T)
+        corr[self.counts < min_periods] = np.nan
+        return np.clip(corr, -1, 1)
+
+def rolling_correlations(
+    returns: pd.DataFrame,
+    window: int,
+    refresh_every: int | None = None
+) -> Iterator[tuple[pd.Timestamp, RollingCovariance]]:
+    values = returns.to_numpy(dtype = np.float64)
+    refresh_every = window if refresh_every is None else refresh_every
+    rolling_cov = RollingCovariance(values.shape[1])
+
+    for i, row_date in enumerate(returns.index):
+        if (i + 1) % refresh_every == 0:
+            rolling_cov.reset(values[max(0, i + 1 - window) : i + 1])
+        elif i >= window:
+            rolling_cov.update(values[[i, i - window]], np.array([1.0, -1.0]))
+        else:
+            rolling_cov.add(values[i])
+
+        yield row_date, rolling_cov
+
+def mean_pairwise_correlation(
+    returns: pd.DataFrame,
+    window: int,
+    min_periods: int | None = None
+) -> pd.Series:
+    upper = np.triu_indices(returns.shape[1], k = 1)
+    min_periods = window // 2 if min_periods is None else min_periods
+    mean_corr = {}
+
+    for row_date, rolling_cov in rolling_correlations(returns, window):
+        pair_corr = rolling_cov.correlation(min_periods)[upper]
+
+        if not np.isnan(pair_corr).all():
+            mean_corr[row_date] = np.nanmean(pair_corr)
+
+    return pd.Series(mean_corr, name = 'Mean Correlation')
+
+def latest_correlation(
+    returns: pd.DataFrame,
+    window: int,
+    min_periods: int | None = None
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    rolling_cov = RollingCovariance(returns.shape[1])
+    rolling_cov.add(returns.iloc[-window:].to_numpy(dtype = np.float64))
+    min_periods = window // 2 if min_periods is None else min_periods
+
+    return (
+        pd.DataFrame(rolling_cov.correlation(min_periods), index = returns.columns, columns = returns.columns),
+        pd.DataFrame(rolling_cov.covariance(min_periods), index = returns.columns, columns = returns.columns)
+    )
+
+def top_peers(corr: pd.DataFrame, count: int = 3) -> dict[str, list[tuple[str, float]]]:
+    values = corr.to_numpy(copy = True)
+    np.fill_diagonal(values, np.nan)
+    order = np.argsort(np.where(np.isnan(values), np.inf, -values), axis = 1)[:, :count]
+
+    return {
+        symbol: [
+            (corr.columns[j], values[i, j]) for j in order[i] if not np.isnan(values[i, j])
+        ]
+        for i, symbol in enumerate(corr.index)
+    }
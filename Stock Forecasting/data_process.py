@@ -7,8 +7,48 @@ import pandas as pd
 import seaborn as sns
 from matplotlib import pyplot as plt
 
+from chart_data import DEFAULT_COLOR, downsample_indices, draw_line_chart, line_chart
+from drawdowns import drawdown_episodes
+from feature_graph import FeatureGraph
+from intraday import INTRADAY_DIR, OPEN_MINUTES, MinuteBarStore, intraday_summary, intraday_vwap
 from metrics import spearman_over_ma
-from utility import PerfPeriods, PLOT_PERIOD
+from output_writer import OutputWriter
+from range_index import DrawdownIndex, FenwickTree, PrefixMoments, PrefixSum, SparseTable, WaveletMatrix
+from risk import (
+    TRADING_DAYS, rolling_volatility, rolling_sharpe, rolling_sortino,
+    rolling_max_drawdown, rolling_beta
+)
+from rolling import calendar_window_starts, rolling_max, rolling_min, rolling_quantiles
+from runs import run_length_encode
+from seasonality import seasonality_stats
+from simulation import PROJECTION_PERCENTILES, project_prices
+from trading_calendar import TradingCalendar
+from utility import PerfPeriods, PLOT_PERIOD, PLOT_POINTS
+from validation import concat_issues, drop_duplicate_dates, summarize_issues, unvalidated_issues, validate_history
+from volume_profile import PROFILE_WINDOWS, VolumeProfile
+
+FEATURES = FeatureGraph()
+
+def ma_columns(ma_periods: list[int]) -> list[str]:
+    return [
+        col_name
+        for period in ma_periods
+        for col_name in (f'MA {period} days', f'% Change from {period} MA')
+    ]
+
+def risk_columns(risk_windows: list[int], has_benchmark: bool = False) -> list[str]:
+    return [
+        col_name
+        for window in risk_windows
+        for col_name in (
+            f'% Rolling Volatility {window} days', f'Rolling Sharpe {window} days',
+            f'Rolling Sortino {window} days', f'% Rolling Max Drawdown {window} days',
+            *([f'Rolling Beta {window} days'] if has_benchmark else [])
+        )
+    ]
+
+def sp_ma_column(sp_wins: list[int]) -> str:
+    return f"MA-S ({min(sp_wins)}-{max(sp_wins)}-{len(sp_wins)})"
 
 @dataclass
 class StockSummary:
@@ -31,6 +71,11 @@ class PerformanceReport:
     lowest_close: float
     hightest_close: float
     mean_value: float
+    volatility: float = np.nan
+    sharpe_ratio: float = np.nan
+    sortino_ratio: float = np.nan
+    max_drawdown: float = np.nan
+    beta: float = np.nan
 
 class StockData:
     def __init__(
@@ -39,22 +84,44 @@ class StockData:
         stock_data_dir: Path,
         company_data_dir: Path,
         image_out_path: Path,
-        reload_data: bool = False
+        reload_data: bool = False,
+        chart_mode: str = "png",
+        writer: OutputWriter | None = None
     ) -> None:
         self.symbol = symbol
+        self.chart_mode = chart_mode
+        self.writer = writer if writer is not None else OutputWriter(background = False)
+        self.charts: dict[str, dict] = {}
+        self.chart_names: list[str] = []
         self.image_out_path = image_out_path.joinpath(symbol)
         self.image_out_path.mkdir(exist_ok = True, parents = True)
         self.consolidated_data_path = stock_data_dir.joinpath(symbol, "consolidated.parquet")
+        self.data_issues_path = stock_data_dir.joinpath(symbol, "data_issues.parquet")
+
+        is_validated = self.data_issues_path.is_file()
+        has_history = any(stock_data_dir.joinpath(symbol).glob(f"*{symbol}*.json"))
 
-        if reload_data or (not (self.consolidated_data_path.exists() and self.consolidated_data_path.is_file())):
+        if reload_data or (not self.consolidated_data_path.is_file()):
             self.raw_data = self.consolidate_data(
                 stock_data_dir,
                 company_data_dir
             )
-            self.raw_data.to_parquet(self.consolidated_data_path, index = False)
+            self.writer.write_parquet(self.consolidated_data_path, self.raw_data, index = False)
+            self.writer.write_parquet(self.data_issues_path, self.data_issues, index = False)
         else:
             self.raw_data = pd.read_parquet(self.consolidated_data_path)
 
+            if is_validated:
+                self.data_issues = pd.read_parquet(self.data_issues_path)
+            elif has_history:
+                # History saved without its issues is consolidated again only to
+                # validate it, so the saved history itself is left untouched.
+                self.consolidate_data(stock_data_dir, company_data_dir)
+                self.writer.write_parquet(self.data_issues_path, self.data_issues, index = False)
+            else:
+                print(f"> Could not validate '{symbol}' as no data issues were saved and its source files are missing.")
+                self.data_issues = unvalidated_issues(symbol)
+
         self.last_close = self.raw_data['Close'].iloc[-1]
 
         self.summary = StockSummary(
@@ -67,6 +134,8 @@ class StockData:
         )
         self.perf_reports: list[PerformanceReport] = []
         self.highlights: list[str] = []
+        self.intermediates: dict[str, np.ndarray] = {}
+        self._build_performance_index()
 
     def consolidate_data(
             self,
@@ -75,7 +144,7 @@ class StockData:
         ) -> pd.DataFrame:
 
         hist_dfs = []
-        files = list(stock_data_dir.joinpath(self.symbol).glob(f"*{self.symbol}*.json"))
+        files = sorted(stock_data_dir.joinpath(self.symbol).glob(f"*{self.symbol}*.json"))
         col_names = [
             "Date", "Open", "High", "Low", "Prev Close", "LTP", "Close",
             "VWAP", "52W H", "52W L", "Volume", "Value", "Num Trades"
@@ -97,20 +166,26 @@ class StockData:
         
         if len(hist_dfs) > 0:
             hist_df: pd.DataFrame = pd.concat(hist_dfs, axis = 'index', ignore_index = True)
-            
-            hist_df = hist_df.sort_values(
-                "Date"
-            ).drop_duplicates(
-                keep = 'first'
-            ).reset_index(
-                drop = True
-            )
+            hist_df, duplicate_issues = drop_duplicate_dates(hist_df, self.symbol)
 
             stock_split_file = company_data_dir.joinpath("StockSplit", f"{self.symbol}.csv")
+            stock_split_df = pd.read_csv(stock_split_file) if stock_split_file.exists() else None
+            price_multiplier = pd.Series(1.0, index = hist_df.index)
+
+            self.data_issues = concat_issues([
+                duplicate_issues,
+                validate_history(
+                    hist_df,
+                    self.symbol,
+                    TradingCalendar.observed(stock_data_dir, hist_df['Date']),
+                    () if stock_split_df is None else stock_split_df['StockMultiplier']
+                )
+            ])
 
-            if stock_split_file.exists():
-                stock_split_df = pd.read_csv(stock_split_file)
+            if len(self.data_issues):
+                print(f"> Found {len(self.data_issues)} data issues: {summarize_issues(self.data_issues)}.")
 
+            if stock_split_df is not None:
                 stock_split_df["RecordDate"] = pd.to_datetime(
                     stock_split_df["RecordDate"],
                     format = "%d-%m-%Y"
@@ -128,10 +203,24 @@ class StockData:
                 price_multiplier_df['StockMultiplier'] = price_multiplier_df['StockMultiplier'].bfill().fillna(1)
                 hist_df['Prev Close'] = hist_df['Prev Close'] * price_multiplier_df['StockMultiplier']
 
-                price_multiplier_df['StockMultiplier'] = price_multiplier_df['StockMultiplier'].shift(-1).fillna(1)
+                price_multiplier = price_multiplier_df['StockMultiplier'].shift(-1).fillna(1)
 
                 for col in ["Open", "High", "Low", "LTP", "Close", "VWAP"]:
-                    hist_df[col] = hist_df[col] * price_multiplier_df['StockMultiplier']
+                    hist_df[col] = hist_df[col] * price_multiplier
+
+            # The reported 52 week range is not split adjusted, so it is only
+            # kept for the first year where the loaded history is incomplete.
+            year_starts = calendar_window_starts(hist_df['Date'], pd.Timedelta(weeks = 52))
+            is_partial_year = (hist_df['Date'] - pd.Timedelta(weeks = 52)) < hist_df['Date'].iloc[0]
+            high_52w = rolling_max(hist_df['High'], year_starts)
+            low_52w = rolling_min(hist_df['Low'], year_starts)
+
+            hist_df['52W H'] = np.where(
+                is_partial_year, np.fmax(high_52w, hist_df['52W H'] * price_multiplier), high_52w
+            )
+            hist_df['52W L'] = np.where(
+                is_partial_year, np.fmin(low_52w, hist_df['52W L'] * price_multiplier), low_52w
+            )
 
             print(f"> Loaded {hist_df.shape[0]} records from {len(files)} files with data from {hist_df['Date'].min().date()} to {hist_df['Date'].max().date()}.")
             return hist_df
@@ -142,65 +231,198 @@ class StockData:
         self, 
         performance_periods: list[int],
         ma_periods: list[int],
-        sp_ma_periods: list[list[int]]
+        sp_ma_periods: list[list[int]],
+        projection_horizons: list[int],
+        risk_windows: list[int],
+        benchmark_returns: pd.Series | None = None,
+        random_state: int | None = None,
+        outputs: list[str] | None = None,
+        max_workers: int = 1,
+        reports: bool = True
     ):
-        self._create_performance_features(performance_periods)
-        self._create_ma_features(ma_periods)
-        self._create_rolling_features()
-        self._create_historical_features()
-        self._create_daily_quarterly_features()
-        self._create_streak_features()
-        self._create_sp_ma_features(sp_ma_periods)
-        self._create_ath_features()
-        self._create_intraday_features()
-
-    def _create_performance_features(self, performance_periods: list[int]):
-        for period in performance_periods:
-            period_df = self.raw_data.iloc[-period :]
-            period_size = len(period_df)
-            net_returns = (period_df['Close'].iloc[-1] / period_df['Prev Close'].iloc[0])
-
-            self.perf_reports.append(
-                PerformanceReport(
-                    period_size,
-                    period_df['Date'].min().date(),
-                    net_returns - 1,
-                    (net_returns ** (1 / period_size)) - 1,
-                    period_df['Close'].median(),
-                    period_df['Close'].min(),
-                    period_df['Close'].max(),
-                    period_df['Value'].mean(),
+        if benchmark_returns is not None:
+            self._build_performance_index(benchmark_returns)
+            self.session_gaps = self.calendar.gaps(TradingCalendar(benchmark_returns.index))
+
+            if len(self.session_gaps):
+                print(f"> Missing {self.session_gaps['Missing Sessions'].sum()} sessions in {len(self.session_gaps)} gaps compared to the benchmark.")
+
+        FEATURES.run(
+            self,
+            {
+                'performance_periods': performance_periods,
+                'ma_periods': ma_periods,
+                'sp_ma_periods': sp_ma_periods,
+                'projection_horizons': projection_horizons,
+                'risk_windows': risk_windows,
+                'has_benchmark': self._benchmark_returns is not None,
+                'random_state': random_state
+            },
+            outputs,
+            max_workers,
+            reports
+        )
+
+    @property
+    def daily_returns(self) -> pd.Series:
+        return pd.Series(self._returns, index = self.raw_data['Date'])
+
+    def _plot_rows(self, columns: list[str]) -> pd.DataFrame:
+        return self.raw_data.iloc[downsample_indices(
+            self.summary.num_records,
+            PLOT_POINTS,
+            [self.raw_data[col_name] for col_name in columns]
+        )]
+
+    def _save_line_chart(self, name: str, **spec):
+        chart_name = f"{self.symbol}_{name}"
+        image_path = self.image_out_path.joinpath(f"{chart_name}.png")
+        self.chart_names.append(name)
+
+        if self.chart_mode == "client":
+            self.charts[chart_name] = line_chart(**spec)
+            self.writer.remove(image_path)
+            return
+
+        with sns.axes_style('dark'):
+            figure = draw_line_chart(**{'max_points': PLOT_POINTS, **spec})
+            self.writer.savefig(image_path, figure, bbox_inches = "tight")
+            plt.close(figure)
+
+    def _build_performance_index(self, benchmark_returns: pd.Series | None = None):
+        self.calendar = TradingCalendar(self.raw_data['Date'])
+        self._close = self.raw_data['Close'].to_numpy()
+        self._prev_close = self.raw_data['Prev Close'].to_numpy()
+        self._value_sums = PrefixSum(self.raw_data['Value'].to_numpy())
+        self._lowest_close = SparseTable(self._close, np.fmin)
+        self._highest_close = SparseTable(self._close, np.fmax)
+        self._close_ranks = WaveletMatrix(self._close)
+        self._close_drawdowns = DrawdownIndex(self._close)
+
+        self._returns = (self._close / self._prev_close) - 1
+        self._return_sums = PrefixSum(self._returns)
+        self._return_moments = PrefixMoments(self._returns)
+        self._downside_sums = PrefixSum(np.minimum(self._returns, 0) ** 2)
+
+        if benchmark_returns is None:
+            self._benchmark_returns = None
+        else:
+            self._benchmark_returns = benchmark_returns.reindex(self.raw_data['Date']).to_numpy()
+            is_joint = ~(np.isnan(self._benchmark_returns) | np.isnan(self._returns))
+
+            self._joint_moments = PrefixMoments(self._returns, self._benchmark_returns)
+            self._joint_benchmark_moments = PrefixMoments(np.where(is_joint, self._benchmark_returns, np.nan))
+
+    def _risk_report(self, start: int, end: int) -> tuple[float, float, float, float, float]:
+        mean_returns = self._return_sums.mean(start, end)
+
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            volatility = np.sqrt(self._return_moments.variance(start, end) * TRADING_DAYS)
+            downside_deviation = np.sqrt(self._downside_sums.mean(start, end) * TRADING_DAYS)
+            beta = np.nan
+
+            if self._benchmark_returns is not None:
+                beta = (
+                    self._joint_moments.covariance(start, end) /
+                    self._joint_benchmark_moments.variance(start, end)
                 )
+
+            return (
+                volatility,
+                mean_returns * TRADING_DAYS / volatility,
+                mean_returns * TRADING_DAYS / downside_deviation,
+                self._close_drawdowns.query(start, end),
+                beta
             )
 
-    def _create_ma_features(self, ma_periods: list[int]):
+    def performance_report(self, start: int, end: int) -> PerformanceReport:
+        start, end = max(start, 0), min(end, self.summary.num_records)
+
+        if start >= end:
+            raise ValueError(f"Empty performance period [{start}, {end}) for '{self.symbol}'")
+
+        period_size = end - start
+        net_returns = self._close[end - 1] / self._prev_close[start]
+
+        return PerformanceReport(
+            period_size,
+            self.calendar.sessions[start].date(),
+            net_returns - 1,
+            (net_returns ** (1 / period_size)) - 1,
+            self._close_ranks.median(start, end),
+            self._lowest_close.query(start, end),
+            self._highest_close.query(start, end),
+            self._value_sums.mean(start, end),
+            *self._risk_report(start, end)
+        )
+
+    def performance_report_between(self, start_date: date, end_date: date) -> PerformanceReport:
+        return self.performance_report(*self.calendar.session_range(start_date, end_date))
+
+    def performance_reports(self, performance_periods: list[int]) -> list[PerformanceReport]:
+        return [
+            self.performance_report(self.summary.num_records - period, self.summary.num_records)
+            for period in performance_periods
+        ]
+
+    @FEATURES.report(
+        inputs = ('Close', 'Prev Close'),
+        params = ('performance_periods',)
+    )
+    def _report_performance(self, performance_periods: list[int]):
+        self.perf_reports = self.performance_reports(performance_periods)
+
+    @FEATURES.feature(
+        outputs = (f'Close P10 {PerfPeriods.LONG} days', f'Close P90 {PerfPeriods.LONG} days'),
+        inputs = ('Close',)
+    )
+    def _create_quantile_features(self) -> dict[str, np.ndarray]:
+        lower, upper = rolling_quantiles(self._close, PerfPeriods.LONG, [0.1, 0.9])
+
+        return {
+            f'Close P10 {PerfPeriods.LONG} days': lower,
+            f'Close P90 {PerfPeriods.LONG} days': upper
+        }
+
+    @FEATURES.feature(
+        outputs = ma_columns,
+        inputs = ('Close',),
+        params = ('ma_periods',)
+    )
+    def _create_ma_features(self, ma_periods: list[int]) -> dict[str, pd.Series]:
+        columns = {}
+
         for period in ma_periods:
             col_name = f'MA {period} days'
 
-            self.raw_data[col_name] = self.raw_data['Close'].rolling(
+            columns[col_name] = self.raw_data['Close'].rolling(
                 window = period,
                 min_periods = 1
             ).mean()
-            self.raw_data[f'% Change from {period} MA'] = (
-                (self.raw_data['Close'] - self.raw_data[col_name]) /
-                self.raw_data[col_name]
+            columns[f'% Change from {period} MA'] = (
+                (self.raw_data['Close'] - columns[col_name]) /
+                columns[col_name]
             ).round(5) * 100
-        
-        is_above_200_MA = self.raw_data['Close'] >= self.raw_data['MA 200 days']
-        is_above_200_MA_si = (
-            is_above_200_MA != is_above_200_MA.shift(1)
-        ).cumsum()
-        is_above_200_MA_streak = (is_above_200_MA.groupby(
-            is_above_200_MA_si
-        ).cumcount() + 1).iloc[-1]
+
+        return columns
+
+    @FEATURES.report(
+        inputs = lambda ma_periods: [
+            'Date', 'Close', 'Prev Close', *ma_columns(ma_periods),
+            f'Close P10 {PerfPeriods.LONG} days', f'Close P90 {PerfPeriods.LONG} days'
+        ],
+        params = ('ma_periods',)
+    )
+    def _report_ma_features(self, ma_periods: list[int]):
+        is_above_200_MA = run_length_encode(self.raw_data['Close'] >= self.raw_data['MA 200 days'])
+        is_above_200_MA_streak = is_above_200_MA.lengths[-1]
 
         if is_above_200_MA_streak >= 200:
-            streak_start_date = self.raw_data['Date'][is_above_200_MA_si == is_above_200_MA_si.iloc[-1]].iloc[0].date()
-            streak_returns = ((
-                self.last_close / self.raw_data[self.raw_data['Date'].dt.date == streak_start_date]['Prev Close']
-            ) - 1).values[0]
+            streak_start = is_above_200_MA.starts[-1]
+            streak_start_date = self.raw_data['Date'].iloc[streak_start].date()
+            streak_returns = (self.last_close / self.raw_data['Prev Close'].iloc[streak_start]) - 1
 
-            if is_above_200_MA.iloc[-1]:
+            if is_above_200_MA.values[-1]:
                 self.highlights.append(
                     f'<li>This stock has closed above its 200 day moving average since <span class="metric">{streak_start_date:%B %d, %Y}</span> which is <span class="metric color-green">{is_above_200_MA_streak}</span> trading days in a row for a net return of <span class="metric color-green">{streak_returns:.2%}</span>.</li>'
                 )
@@ -212,217 +434,181 @@ class StockData:
         self._save_ma_plots(ma_periods)
 
     def _save_ma_plots(self, ma_periods: list[int]):
-        with sns.axes_style('dark'):
-            plot_data = self.raw_data.iloc[-PerfPeriods.VERY_LONG:]
-
-            plt.figure(figsize = (10, 5), dpi = 125)
-            plt.axhline(y = self.last_close, linestyle = "dashdot", label = "Latest Close price")
-
-            for period, color in zip(
-                ma_periods,
-                ['mediumseagreen', 'goldenrod', 'indianred']
-            ):
-                sns.lineplot(
-                    plot_data,
-                    x = 'Date',
-                    y = f'MA {period} days',
-                    label = f'MA {period}-D',
-                    c = color
-                )
+        colors = ['mediumseagreen', 'goldenrod', 'indianred']
+
+        self._save_line_chart(
+            "MA_Close_Price",
+            title = f"{self.symbol} - Moving averages of Close price",
+            x_label = "Date",
+            y_label = "Close Price",
+            x = self.raw_data['Date'],
+            series = [
+                (f'MA {period}-D', self.raw_data[f'MA {period} days'], color)
+                for period, color in zip(ma_periods, colors)
+            ],
+            hlines = [(self.last_close, "Latest Close price", DEFAULT_COLOR)],
+            bands = [(
+                f"10-90th percentile {PerfPeriods.LONG}-D",
+                self.raw_data[f'Close P10 {PerfPeriods.LONG} days'],
+                self.raw_data[f'Close P90 {PerfPeriods.LONG} days'],
+                "lightsteelblue",
+                0.4
+            )]
+        )
 
-            plt.legend()
-            plt.xlabel("Date", fontsize = 12)
-            plt.ylabel("Close Price", fontsize = 12)
-            plt.title(f"{self.symbol} - Moving averages of Close price", fontsize = 14)
-            plt.savefig(
-                self.image_out_path.joinpath(f"{self.symbol}_MA_Close_Price.png"), 
-                bbox_inches = "tight"
+        for period, color in zip(ma_periods, colors):
+            pcnt_change = self.raw_data[f'% Change from {period} MA']
+            self._save_line_chart(
+                f"Pcnt_Change_MA_{period}",
+                title = f"{self.symbol} - Change from {period}-D MA",
+                x_label = "Date",
+                y_label = f"Change from {period}-D MA (%)",
+                x = self.raw_data['Date'],
+                series = [(f"Latest: {pcnt_change.iloc[-1]:.1f}%", pcnt_change, DEFAULT_COLOR)],
+                hlines = [(0, f'MA {period}-D', color)]
             )
-            plt.close()
-
-            for period, color in zip(
-                ma_periods,
-                ['mediumseagreen', 'goldenrod', 'indianred']
-            ):
-                plt.figure(figsize = (10, 5), dpi = 125)
-                plt.axhline(y = 0, linestyle = "dashdot", color = color, label = f'MA {period}-D')
-
-                sns.lineplot(
-                    plot_data,
-                    x = 'Date',
-                    y = f'% Change from {period} MA',
-                    label = f"Latest: {plot_data[f'% Change from {period} MA'].iloc[-1]:.1f}%"
-                )
 
-                plt.legend()
-                plt.xlabel("Date", fontsize = 12)
-                plt.ylabel(f"Change from {period}-D MA (%)", fontsize = 12)
-                plt.title(f"{self.symbol} - Change from {period}-D MA", fontsize = 14)
-                plt.savefig(
-                    self.image_out_path.joinpath(f"{self.symbol}_Pcnt_Change_MA_{period}.png"), 
-                    bbox_inches = "tight"
-                )
-                plt.close()
-    
-    def _create_rolling_features(self):
-        self.raw_data['% Rolling Returns 200 days'] = (
-            self.raw_data['Close'] / 
-            self.raw_data['Prev Close'].rolling(
-                window = 200, 
+    @FEATURES.feature(
+        outputs = (
+            'Window Start 200 days', 'Window Count 200 days',
+            'Window Start 1000 days', 'Window Count 1000 days'
+        ),
+        inputs = ('Prev Close',),
+        intermediate = True
+    )
+    def _create_window_features(self) -> dict[str, np.ndarray]:
+        intermediates = {}
+        prev_close = self.raw_data['Prev Close']
+
+        for window in [200, 1000]:
+            window_starts = np.maximum(np.arange(self.summary.num_records) - window + 1, 0)
+            intermediates[f'Window Start {window} days'] = prev_close.to_numpy()[window_starts]
+            intermediates[f'Window Count {window} days'] = prev_close.rolling(
+                window = window,
                 min_periods = 1
-            ).agg(lambda rows: rows.iloc[0])
-        )
+            ).count().to_numpy()
 
-        self.raw_data['% Rolling Returns 1000 days'] = (
-            self.raw_data['Close'] / 
-            self.raw_data['Prev Close'].rolling(
-                window = 1000, 
-                min_periods = 1
-            ).agg(lambda rows: rows.iloc[0])
+        return intermediates
+
+    @FEATURES.feature(
+        outputs = ('% Rolling Returns 200 days', '% Rolling Returns 1000 days'),
+        inputs = (
+            'Close',
+            'Window Start 200 days', 'Window Count 200 days',
+            'Window Start 1000 days', 'Window Count 1000 days'
         )
+    )
+    def _create_rolling_features(self) -> dict[str, pd.Series]:
+        columns = {}
+
+        for window in [200, 1000]:
+            columns[f'% Rolling Returns {window} days'] = (
+                (
+                    (self.raw_data['Close'] / self.intermediates[f'Window Start {window} days']) **
+                    (1 / self.intermediates[f'Window Count {window} days'])
+                ) - 1
+            ).round(5) * 100
 
-        self.raw_data['% Rolling Returns 200 days'] = (
-            (self.raw_data['% Rolling Returns 200 days'] ** (
-                1 / self.raw_data['Prev Close'].rolling(
-                    window = 200, 
-                    min_periods = 1
-                ).count()
-            )) - 1
-        ).round(5) * 100
-        self.raw_data['% Rolling Returns 1000 days'] = (
-            (self.raw_data['% Rolling Returns 1000 days'] ** (
-                1 / self.raw_data['Prev Close'].rolling(
-                    window = 1000, 
-                    min_periods = 1
-                ).count()
-            )) - 1
-        ).round(5) * 100
-
-        self._save_rolling_plots()
+        return columns
     
+    @FEATURES.report(inputs = ('Date', '% Rolling Returns 200 days', '% Rolling Returns 1000 days'))
     def _save_rolling_plots(self):
-        with sns.axes_style('dark'):
-            plot_data = self.raw_data[
-                ['Date', '% Rolling Returns 200 days', '% Rolling Returns 1000 days']
-            ].iloc[-PLOT_PERIOD:]
-
-            plt.figure(figsize = (10, 5), dpi = 125)
-
-            plt.axhline(y = 0, linestyle = "dashdot", color = "indianred", label = "No change")
-            plt.axhline(
-                y = self.raw_data['% Rolling Returns 200 days'].median(), 
-                linestyle = "dashdot",
-                linewidth = 1.5,
-                color = "goldenrod", 
-                label = f"Overall median ({self.raw_data['% Rolling Returns 200 days'].median():.3f}%)"
-            )
-            plt.axhline(
-                y = plot_data['% Rolling Returns 200 days'].median(), 
-                linestyle = "dashdot",
-                linewidth = 1.5,
-                color = "mediumseagreen", 
-                label = f"Last 500-D median ({plot_data['% Rolling Returns 200 days'].median():.3f}%)"
+        for period in (200, 1000):
+            rolling_returns = self.raw_data[f'% Rolling Returns {period} days']
+            overall_median = rolling_returns.median()
+            recent_median = rolling_returns.iloc[-PLOT_PERIOD:].median()
+
+            self._save_line_chart(
+                f"Avg_Rolling_Returns_{period}",
+                title = f"{self.symbol} - Average daily {period} days rolling returns",
+                x_label = "End date",
+                y_label = "Average Daily Return (%)",
+                x = self.raw_data['Date'],
+                series = [(f"Latest: {rolling_returns.iloc[-1]:.3f}%", rolling_returns, DEFAULT_COLOR)],
+                hlines = [
+                    (0, "No change", "indianred"),
+                    (overall_median, f"Overall median ({overall_median:.3f}%)", "goldenrod"),
+                    (recent_median, f"Last {PLOT_PERIOD}-D median ({recent_median:.3f}%)", "mediumseagreen")
+                ]
             )
 
-            sns.lineplot(
-                plot_data,
-                x = 'Date',
-                y = '% Rolling Returns 200 days',
-                label = f"Latest: {plot_data['% Rolling Returns 200 days'].iloc[-1]:.3f}%"
-            )
+    @FEATURES.feature(
+        outputs = (
+            'Total hits of Close', 'First hit of Close', 'Last hit of Close',
+            'Pcnt hits of Close', 'Days of no return'
+        ),
+        inputs = ('Date', 'Close')
+    )
+    def _create_historical_features(self) -> dict[str, np.ndarray]:
+        return self._get_first_hit_of_last_close()
+
+    @FEATURES.report(inputs = ('Date', 'Close', 'VWAP', 'Volume', 'Days of no return'))
+    def _report_historical_features(self):
+        self._create_volume_profiles()
+        self._save_historical_plots()
 
-            plt.legend(fontsize = 'small')
-            plt.xlabel("End date", fontsize = 12)
-            plt.ylabel("Average Daily Return (%)", fontsize = 12)
-            plt.title(f"{self.symbol} - Average daily 200 days rolling returns", fontsize = 14)
-            plt.savefig(
-                self.image_out_path.joinpath(f"{self.symbol}_Avg_Rolling_Returns_200.png"), 
-                bbox_inches = "tight"
+    def _create_volume_profiles(self):
+        self.volume_profile = VolumeProfile(
+            self.raw_data['VWAP'].to_numpy(),
+            self.raw_data['Volume'].to_numpy()
+        )
+        self.volume_profiles: dict[str, tuple[float, float, float]] = {}
+        end = self.summary.num_records
+
+        for window_name, window in PROFILE_WINDOWS.items():
+            start = 0 if window is None else max(end - window, 0)
+            self.volume_profiles[window_name] = (
+                self.volume_profile.point_of_control(start, end),
+                *self.volume_profile.value_area(start, end)
             )
-            plt.close()
 
-            plt.figure(figsize = (10, 5), dpi = 125)
+    def _get_first_hit_of_last_close(self) -> dict[str, np.ndarray]:
+        first_hits = np.searchsorted(np.maximum.accumulate(self._close), self._close, side = 'left')
+        last_hits = np.empty_like(first_hits)
+        total_hits = np.empty_like(first_hits)
 
-            plt.axhline(y = 0, linestyle = "dashdot", color = "indianred", label = "No change")
-            plt.axhline(
-                y = self.raw_data['% Rolling Returns 1000 days'].median(), 
-                linestyle = "dashdot",
-                linewidth = 1.5,
-                color = "goldenrod", 
-                label = f"Overall median ({self.raw_data['% Rolling Returns 1000 days'].median():.3f}%)"
-            )
-            plt.axhline(
-                y = plot_data['% Rolling Returns 1000 days'].median(), 
-                linestyle = "dashdot",
-                linewidth = 1.5,
-                color = "mediumseagreen", 
-                label = f"Last 500-D median ({plot_data['% Rolling Returns 1000 days'].median():.3f}%)"
-            )
+        close_levels = np.unique(self._close)
+        reversed_ranks = close_levels.size - np.searchsorted(close_levels, self._close)
+        hits_by_rank = FenwickTree(close_levels.size)
+        higher_closes = []
 
-            sns.lineplot(
-                plot_data[['Date', '% Rolling Returns 1000 days']],
-                x = 'Date',
-                y = '% Rolling Returns 1000 days',
-                label = f"Latest: {plot_data['% Rolling Returns 1000 days'].iloc[-1]:.3f}%"
-            )
+        for i, close in enumerate(self._close):
+            while higher_closes and self._close[higher_closes[-1]] < close:
+                higher_closes.pop()
 
-            plt.legend(fontsize = 'small')
-            plt.xlabel("End date", fontsize = 12)
-            plt.ylabel("Average Daily Return (%)", fontsize = 12)
-            plt.title(f"{self.symbol} - Average daily 1000 days rolling returns", fontsize = 14)
-            plt.savefig(
-                self.image_out_path.joinpath(f"{self.symbol}_Avg_Rolling_Returns_1000.png"), 
-                bbox_inches = "tight"
-            )
-            plt.close()
+            last_hits[i] = higher_closes[-1] if higher_closes else first_hits[i]
+            higher_closes.append(i)
 
-    def _create_historical_features(self):
-        self._get_first_hit_of_last_close()
-        self._save_historical_plots()
+            hits_by_rank.add(reversed_ranks[i] - 1)
+            total_hits[i] = hits_by_rank.prefix_sum(reversed_ranks[i])
 
-    def _get_first_hit_of_last_close(self):        
-        total_hits = []
-        first_hits = []
-        last_hits = []
-        pcnt_hits = []
-
-        for row in self.raw_data.itertuples():
-            row_df = self.raw_data[self.raw_data['Date'] <= row.Date]
-            all_hits = row_df["Date"][row_df["Close"] >= row.Close]
-            total_hit = len(all_hits)
-            first_hit = all_hits.min().date()
-            last_hit = all_hits.iloc[-2].date() if total_hit > 1 else first_hit
-            pcnt_hit = total_hit / len(row_df[row_df['Date'].dt.date >= first_hit])
-            
-            total_hits.append(total_hit)
-            first_hits.append(first_hit)
-            last_hits.append(last_hit)
-            pcnt_hits.append(pcnt_hit)
-        
-        self.raw_data['Total hits of Close'] = total_hits
-        self.raw_data['First hit of Close'] = first_hits
-        self.raw_data['Last hit of Close'] = last_hits
-        self.raw_data['Pcnt hits of Close'] = pcnt_hits
-        self.raw_data['Days of no return'] = pd.to_timedelta(
-            self.raw_data['Date'].dt.date - self.raw_data['First hit of Close']
+        session_dates = self.calendar.sessions.date
+        days_of_no_return = pd.to_timedelta(
+            self.raw_data['Date'].dt.date - session_dates[first_hits]
         ).dt.days
-        max_no_return = self.raw_data.iloc[self.raw_data['Days of no return'].idxmax()]
+        max_no_return = days_of_no_return.idxmax()
         self.max_period_no_return = (
-            max_no_return['First hit of Close'],
-            max_no_return['Date'].date(),
-            max_no_return['Days of no return']
+            session_dates[first_hits[max_no_return]],
+            self.raw_data['Date'].iloc[max_no_return].date(),
+            days_of_no_return.iloc[max_no_return]
         )
+
+        return {
+            'Total hits of Close': total_hits,
+            'First hit of Close': session_dates[first_hits],
+            'Last hit of Close': session_dates[last_hits],
+            'Pcnt hits of Close': total_hits / (np.arange(total_hits.size) - first_hits + 1),
+            'Days of no return': days_of_no_return
+        }
     
     def _save_historical_plots(self):
         with sns.axes_style('dark'):
             plt.figure(figsize = (10, 5), dpi = 125)
-            plot_data = self.raw_data.iloc[-PLOT_PERIOD:]
+            plot_data = self._plot_rows(['Days of no return'])
 
             sns.lineplot(
                 x = plot_data['Date'],
-                y = pd.to_timedelta(
-                    plot_data['Date'].dt.date - plot_data['First hit of Close']
-                ).dt.days,
+                y = plot_data['Days of no return'],
                 label = "Max period by date"
             )
 
@@ -437,27 +623,43 @@ class StockData:
             plt.xlabel("Date", fontsize = 12)
             plt.ylabel("Calendar days", fontsize = 12)
             plt.title(f"{self.symbol} - Max period of non positive return", fontsize = 14)
-            plt.savefig(
+            self.writer.savefig(
                 self.image_out_path.joinpath(f"{self.symbol}_Max_Period_of_No_Return.png"), 
                 bbox_inches = "tight"
             )
             plt.close()
             
             plt.figure(figsize = (10, 5), dpi = 125)
-            
-            sns.histplot(
-                data = self.raw_data.iloc[-PLOT_PERIOD:],
-                x = "VWAP",
-                weights = "Volume",
-                bins = 25
-            )
+
+            start = max(self.summary.num_records - PLOT_PERIOD, 0)
+            edges, volume = self.volume_profile.histogram(start, self.summary.num_records)
+
+            # A window without any traded volume only shows the last close.
+            if volume.any():
+                value_area_low, value_area_high = self.volume_profile.value_area(start, self.summary.num_records)
+
+                plt.bar(
+                    (edges[:-1] + edges[1:]) / 2,
+                    volume,
+                    width = np.diff(edges)[0],
+                    color = "steelblue",
+                    alpha = 0.8
+                )
+                plt.axvspan(value_area_low, value_area_high, color = "mediumseagreen", alpha = 0.15, label = "Value area (70%)")
+                plt.axvline(
+                    x = self.volume_profile.point_of_control(start, self.summary.num_records),
+                    linestyle = "solid",
+                    color = "indianred",
+                    label = 'Point of control'
+                )
+
             plt.axvline(x = self.last_close, linestyle = "dashdot", color = "goldenrod", label = 'Last Close')
 
             plt.legend()
             plt.xlabel("VWAP", fontsize = 12)
             plt.ylabel("Volume", fontsize = 12)
-            plt.title(f"{self.symbol} - Volume by VWAP", fontsize = 14)
-            plt.savefig(
+            plt.title(f"{self.symbol} - Volume by VWAP over last {PLOT_PERIOD} days", fontsize = 14)
+            self.writer.savefig(
                 self.image_out_path.joinpath(f"{self.symbol}_Volume_by_VWAP.png"), 
                 bbox_inches = "tight"
             )
@@ -494,26 +696,27 @@ class StockData:
             plt.xlabel("Close Price", fontsize = 12)
             plt.ylabel("Density", fontsize = 12)
             plt.title(f"{self.symbol} - CDF and quantiles of Close price", fontsize = 14)
-            plt.savefig(
+            self.writer.savefig(
                 self.image_out_path.joinpath(f"{self.symbol}_CDF_Close_Price.png"), 
                 bbox_inches = "tight"
             )
             plt.close()
 
-    def _create_daily_quarterly_features(self):
-        self.raw_data['Range'] = self.raw_data['High'] - self.raw_data['Low']
-        self.raw_data['Is Green'] = (
-            self.raw_data['Close'] >= self.raw_data['Prev Close']
-        ).astype(np.int8)
-        self.last_candle = self.raw_data['Is Green'].iloc[-1]
-        self.last_candle_overall_pcnt = len(
-            self.raw_data[
-                self.raw_data['Is Green'] == self.last_candle
-            ]['Is Green']
-        ) / self.summary.num_records
-
-        self._save_quarterly_plots()
+    @FEATURES.feature(
+        outputs = ('Range', 'Is Green'),
+        inputs = ('High', 'Low', 'Close', 'Prev Close')
+    )
+    def _create_daily_quarterly_features(self) -> dict[str, pd.Series]:
+        is_green = (self.raw_data['Close'] >= self.raw_data['Prev Close']).astype(np.int8)
+        self.last_candle = is_green.iloc[-1]
+        self.last_candle_overall_pcnt = (is_green == self.last_candle).sum() / self.summary.num_records
+
+        return {
+            'Range': self.raw_data['High'] - self.raw_data['Low'],
+            'Is Green': is_green
+        }
     
+    @FEATURES.report(inputs = ('Date', 'Close', 'Prev Close', 'Is Green'))
     def _save_quarterly_plots(self):
         quarterly_results = self.raw_data.groupby(
             [
@@ -543,10 +746,7 @@ class StockData:
             quarterly_results['Close'] / quarterly_results['Prev Close']
         ) - 1) * 100
 
-        is_quarter_green = quarterly_results['Returns'] >= 0
-        quarterly_results['Streak'] = quarterly_results.groupby((
-            is_quarter_green != is_quarter_green.shift(1)
-        ).cumsum()).cumcount() + 1
+        quarterly_results['Streak'] = run_length_encode(quarterly_results['Returns'] >= 0).positions
 
         if quarterly_results['Streak'].iloc[-1] >= 4:
             if quarterly_results['Returns'].iloc[-1] >= 0:
@@ -558,95 +758,68 @@ class StockData:
                     f'<li>Including the ongoing quarter, this stock has given negative returns for <span class="metric color-red">{quarterly_results["Streak"].iloc[-1]}</span> quarters in a row.</li>'
                 )
 
-        with sns.axes_style('dark'):
-            plt.figure(figsize = (10, 5), dpi = 125)
-            sns.lineplot(
-                data = quarterly_results,
-                x = "Quarter Name",
-                y = "Is Green",
-                marker = 'o'
-            )
-            plt.axhline(
-                y = 50,
-                linestyle = "dashdot",
-                linewidth = 1.5,
-                color = "goldenrod"
-            )
-
-            plt.ylim((0, 100))
-            plt.xticks(
-                quarterly_results['Quarter Name'],
-                rotation = 45,
-                fontsize = 8
-            )
-            plt.xlabel("Calendar quarter", fontsize = 12)
-            plt.ylabel("Percentage", fontsize = 12)
-            plt.title(f"{self.symbol} - Percentage of green candles by calendar quarter", fontsize = 14)
-            plt.savefig(
-                self.image_out_path.joinpath(f"{self.symbol}_Pcnt_Green_Candles_Quarter.png"), 
-                bbox_inches = "tight"
-            )
-            plt.close()
-
-            plt.figure(figsize = (10, 5), dpi = 125)
-            sns.lineplot(
-                data = quarterly_results,
-                x = "Quarter Name",
-                y = "Returns",
-                marker = 'o'
-            )
-            plt.axhline(
-                y = 0,
-                linestyle = "dashdot",
-                linewidth = 1.5,
-                color = "goldenrod"
-            )
+        self._save_line_chart(
+            "Pcnt_Green_Candles_Quarter",
+            title = f"{self.symbol} - Percentage of green candles by calendar quarter",
+            x_label = "Calendar quarter",
+            y_label = "Percentage",
+            x = quarterly_results['Quarter Name'],
+            series = [("Green candles", quarterly_results['Is Green'], DEFAULT_COLOR)],
+            hlines = [(50, "", "goldenrod")],
+            y_range = (0, 100)
+        )
+        self._save_line_chart(
+            "Net_Returns_Candles_Quarter",
+            title = f"{self.symbol} - Net returns by calendar quarter",
+            x_label = "Calendar quarter",
+            y_label = "Net return (%)",
+            x = quarterly_results['Quarter Name'],
+            series = [("Net return", quarterly_results['Returns'], DEFAULT_COLOR)],
+            hlines = [(0, "", "goldenrod")]
+        )
 
-            plt.xticks(
-                quarterly_results['Quarter Name'],
-                rotation = 45,
-                fontsize = 8
-            )
-            plt.xlabel("Calendar quarter", fontsize = 12)
-            plt.ylabel("Net return (%)", fontsize = 12)
-            plt.title(f"{self.symbol} - Net returns by calendar quarter", fontsize = 14)
-            plt.savefig(
-                self.image_out_path.joinpath(f"{self.symbol}_Net_Returns_Candles_Quarter.png"), 
-                bbox_inches = "tight"
-            )
-            plt.close()
+    @FEATURES.report(inputs = ('Date', 'Close', 'Prev Close'))
+    def _report_seasonality(self):
+        self.seasonality = seasonality_stats(pd.DataFrame({
+            'Symbol': self.symbol,
+            'Date': self.raw_data['Date'],
+            'Return': self._returns
+        }))
     
-    def _create_streak_features(self):
-        self.raw_data["Streak Index"] = (self.raw_data["Is Green"] != self.raw_data["Is Green"].shift(1)).cumsum()
-        self.raw_data["Streak"] = self.raw_data.groupby("Streak Index").cumcount() + 1
-        self.summary.candle_streak = self.raw_data['Streak'].iloc[-1]
-        si = self.raw_data['Streak Index'].iloc[-1]
-        curr_si = self.raw_data.loc[self.raw_data['Streak Index'] == si, ['Prev Close', 'Close']]
-        self.summary.curr_streak_returns = (curr_si['Close'].iloc[-1] / curr_si['Prev Close'].iloc[0]) - 1
-
-        max_streaks = self.raw_data.groupby(
-            ['Streak Index', 'Is Green'], 
-            as_index = False
-        )['Streak'].max()
-
-        last_candle_streaks = max_streaks[max_streaks['Is Green'] == self.last_candle]
-
-        self.streak_cont_prob = last_candle_streaks[
-            last_candle_streaks['Streak'] > self.summary.candle_streak
-        ].shape[0] / last_candle_streaks[
-            last_candle_streaks['Streak'] >= self.summary.candle_streak
-        ].shape[0]
-
-        longest_candle_streak = last_candle_streaks['Streak'].max()
-        longest_candle_si = last_candle_streaks[
-            last_candle_streaks['Streak'] == longest_candle_streak
-        ]['Streak Index'].iloc[-1]
+    @FEATURES.feature(
+        outputs = ('Streak Index', 'Streak'),
+        inputs = ('Date', 'Close', 'Prev Close', 'Is Green')
+    )
+    def _create_streak_features(self) -> dict[str, np.ndarray]:
+        streaks = run_length_encode(self.raw_data['Is Green'])
+        self.summary.candle_streak = streaks.lengths[-1]
+        self.summary.curr_streak_returns = (
+            self.raw_data['Close'].iloc[-1] / self.raw_data['Prev Close'].iloc[streaks.starts[-1]]
+        ) - 1
+        self.streak_cont_prob = streaks.continuation_prob()
+
+        longest_candle_streak, longest_start, longest_end = streaks.span(
+            streaks.longest(),
+            self.raw_data['Date']
+        )
         self.longest_candle_streak: tuple[int, date, date] = (
             longest_candle_streak,
-            self.raw_data['Date'][self.raw_data['Streak Index'] == longest_candle_si].min().date(),
-            self.raw_data['Date'][self.raw_data['Streak Index'] == longest_candle_si].max().date()
+            longest_start.date(),
+            longest_end.date()
         )
 
+        self.max_streaks = pd.DataFrame({
+            'Is Green': streaks.values,
+            'Streak': streaks.lengths
+        })
+
+        return {
+            'Streak Index': streaks.run_ids + 1,
+            'Streak': streaks.positions
+        }
+
+    @FEATURES.report(inputs = ('Close', 'Is Green', 'Streak'))
+    def _report_streak_features(self):
         if self.summary.candle_streak >= 5:
             last_candle = "Green" if self.last_candle == 1 else "Red"
             self.highlights.append(
@@ -656,15 +829,14 @@ class StockData:
         consolidation = ((self.last_close - self.raw_data['Close']).abs() / self.last_close) < 0.1
         
         if consolidation.iloc[-1]:
-            consolidation_streak = (consolidation != consolidation.shift(1)).cumsum()
-            consolidation_length = (consolidation_streak == consolidation_streak.iloc[-1]).sum()
+            consolidation_length = run_length_encode(consolidation).lengths[-1]
             
             if consolidation_length > PerfPeriods.MEDIUM:
                 self.highlights.append(
                     f'<li>This stock has been consolidating within <span class="metric">10%</span> of its last close price for <span class="metric">{consolidation_length}</span> trading days.</li>'
                 )
 
-        self._save_streak_plots(max_streaks)
+        self._save_streak_plots(self.max_streaks)
     
     def _save_streak_plots(self, max_streaks: pd.DataFrame):
         with sns.axes_style('dark'):
@@ -684,86 +856,90 @@ class StockData:
             plt.ylabel("Percentage", fontsize = 12)
             plt.title(f"{self.symbol} - Percentage of streak lengths by candle type", fontsize = 14)
             plt.yticks(np.linspace(-1, 1, 9), labels = np.abs(np.linspace(-100, 100, 9, dtype = np.int8)))
-            plt.savefig(
+            self.writer.savefig(
                 self.image_out_path.joinpath(f"{self.symbol}_Pcnt_Streak_Length.png"), 
                 bbox_inches = "tight"
             )
             plt.close()
 
-    def _create_sp_ma_features(self, sp_ma_periods: list[list[int]]):
-        sp_col_names = []
-
-        for sp_wins in sp_ma_periods:
-            col_name = f"MA-S ({min(sp_wins)}-{max(sp_wins)}-{len(sp_wins)})"
-            self.raw_data[col_name] = spearman_over_ma(
-                self.raw_data['Close'],
-                sp_wins
-            )
-            sp_col_names.append(col_name)
-
-        self._save_sp_ma_plts(sp_col_names)
+    @FEATURES.feature(
+        outputs = lambda sp_ma_periods: [sp_ma_column(sp_wins) for sp_wins in sp_ma_periods],
+        inputs = ('Close',),
+        params = ('sp_ma_periods',)
+    )
+    def _create_sp_ma_features(self, sp_ma_periods: list[list[int]]) -> dict[str, pd.Series]:
+        return {
+            sp_ma_column(sp_wins): spearman_over_ma(self.raw_data['Close'], sp_wins)
+            for sp_wins in sp_ma_periods
+        }
     
-    def _save_sp_ma_plts(self, sp_col_names: list[str]):
+    @FEATURES.report(
+        inputs = lambda sp_ma_periods: ['Date', 'Close', *(sp_ma_column(sp_wins) for sp_wins in sp_ma_periods)],
+        params = ('sp_ma_periods',)
+    )
+    def _save_sp_ma_plts(self, sp_ma_periods: list[list[int]]):
+        sp_col_names = [sp_ma_column(sp_wins) for sp_wins in sp_ma_periods]
         bins = [-1, -0.3, 0.3, 1]
         plot_data = self.raw_data[
             ['Date', 'Close'] + sp_col_names
         ].iloc[-PLOT_PERIOD:]
 
         for c_i, col_name in enumerate(sp_col_names, start = 1):
-            with sns.axes_style('dark'):
-                plt.figure(figsize = (10, 5), dpi = 125)
-                colors = pd.cut(
-                    plot_data[col_name], 
-                    bins = bins, 
-                    labels = ['indianred', 'goldenrod', 'mediumseagreen'], 
-                    include_lowest = True
-                ).values
-
-                labels = pd.cut(
-                    plot_data[col_name], 
-                    bins = bins, 
-                    labels = ['Weak', 'Neutral', 'Strong'], 
-                    include_lowest = True
-                ).values
-
-                for i in range(1, len(plot_data)):
-                    plt.plot(
-                        plot_data['Date'].iloc[i - 1 : i + 1],
-                        plot_data['Close'].iloc[i - 1 : i + 1],
-                        c = colors[i],
-                        label = labels[i],
-                        linewidth = 1.5
-                    )
+            labels = pd.cut(
+                plot_data[col_name], 
+                bins = bins, 
+                labels = ['Weak', 'Neutral', 'Strong'], 
+                include_lowest = True
+            )
+            series = []
+
+            # Each segment takes the label of its end point, so a series also
+            # keeps the point before each of its runs.
+            for label, color in (
+                ('Weak', 'indianred'),
+                ('Neutral', 'goldenrod'),
+                ('Strong', 'mediumseagreen')
+            ):
+                is_label = (labels == label).to_numpy()
+                is_segment = is_label | np.append(is_label[1:], False)
+                series.append((label, plot_data['Close'].where(is_segment), color))
+
+            self._save_line_chart(
+                f"Close_Price_MA_S_{c_i}",
+                title = f"{self.symbol} - Close price highlighted by {col_name}",
+                x_label = "Date",
+                y_label = "Close Price",
+                x = plot_data['Date'],
+                series = series,
+                max_points = len(plot_data)
+            )
 
-                handles, hand_labels = plt.gca().get_legend_handles_labels()
-                by_label = dict(zip(hand_labels, handles))
-                plt.legend(by_label.values(), by_label.keys())
-                plt.xlabel("Date", fontsize = 12)
-                plt.ylabel("Close Price", fontsize = 12)
-                plt.title(f"{self.symbol} - Close price highlighted by {col_name}", fontsize = 14)
-                plt.savefig(
-                    self.image_out_path.joinpath(f"{self.symbol}_Close_Price_MA_S_{c_i}.png"), 
-                    bbox_inches = "tight"
-                )
-                plt.close()
+    @FEATURES.feature(
+        outputs = ('ATH', '% Down from ATH'),
+        inputs = ('Close',)
+    )
+    def _create_ath_features(self) -> dict[str, pd.Series]:
+        ath = self.raw_data['Close'].cummax()
+        down_from_ath = ((self.raw_data['Close'] - ath) / ath).round(5) * 100
+
+        self.ath_hits_1000_days = (down_from_ath.iloc[-1000:] == 0).sum()
+        self.drawdown_episodes = drawdown_episodes(self.raw_data['Date'], down_from_ath, self.symbol)
+        self.last_ath_date = self.calendar.sessions[
+            self._close.size - 1 - np.argmax(self._close[::-1])
+        ]
 
-    def _create_ath_features(self):
-        self.raw_data['ATH'] = self.raw_data['Close'].cummax()
-        self.raw_data['% Down from ATH'] = (
-            (self.raw_data['Close'] - self.raw_data['ATH']) /
-            self.raw_data['ATH']
-        ).round(5) * 100
+        return {
+            'ATH': ath,
+            '% Down from ATH': down_from_ath
+        }
 
-        self.ath_hits_1000_days = (self.raw_data['% Down from ATH'].iloc[-1000:] == 0).sum()
+    @FEATURES.report(inputs = ('Date', '% Down from ATH'))
+    def _report_ath_features(self):
         if self.ath_hits_1000_days < 1:
             self.highlights.append(
                 f'<li>The last time this stock was at an all time high was over <span class="metric">1000</span> trading days ago.</li>'
             )
 
-        self.last_ath_date = self.raw_data.loc[
-            self.raw_data['% Down from ATH'] == 0, 'Date'
-        ].iloc[-1]
-
         if (self.raw_data['% Down from ATH'].iloc[-1] >= -2) or (self.raw_data['% Down from ATH'].iloc[-1] <= -50):
             self.highlights.append(
                 f'<li>Currently, this stock is <span class="metric">{abs(self.raw_data["% Down from ATH"].iloc[-1]):.2f}%</span> away from its all time high.</li>'
@@ -772,86 +948,176 @@ class StockData:
         self._save_ath_plots()
 
     def _save_ath_plots(self):
-        with sns.axes_style('dark'):
-            plot_data = self.raw_data[['Date', '% Down from ATH']].iloc[-PerfPeriods.VERY_LONG:]
+        self._save_line_chart(
+            "Pcnt_Drawdown_ATH",
+            title = f"{self.symbol} - Drawdown from ATH",
+            x_label = "Date",
+            y_label = "Down from ATH (%)",
+            x = self.raw_data['Date'],
+            series = [("Down from ATH", self.raw_data['% Down from ATH'], DEFAULT_COLOR)],
+            hlines = [(0, "ATH", "indianred")]
+        )
 
-            plt.figure(figsize = (10, 5), dpi = 125)
-            plt.axhline(y = 0, linestyle = "dashdot", color = "indianred", label = "ATH")
-            
-            sns.lineplot(
-                plot_data,
-                x = 'Date',
-                y = '% Down from ATH'
-            )
+    @FEATURES.report(inputs = ('Date', 'Open', 'High', 'Low', 'Prev Close', 'LTP', 'Close', 'VWAP'))
+    def _report_intraday_features(self):
+        store = MinuteBarStore(self.consolidated_data_path.parent.joinpath(INTRADAY_DIR))
+        months = store.months()
+        self.intraday_sessions, self.volume_curve = (
+            intraday_summary(store.iter_months()) if months else (None, None)
+        )
+        self.last_session_bars = None
 
-            plt.legend()
-            plt.xlabel("Date", fontsize = 12)
-            plt.ylabel("Down from ATH (%)", fontsize = 12)
-            plt.title(f"{self.symbol} - Drawdown from ATH", fontsize = 14)
-            plt.savefig(
-                self.image_out_path.joinpath(f"{self.symbol}_Pcnt_Drawdown_ATH.png"), 
-                bbox_inches = "tight"
+        if months:
+            bars = store.read_month(months[-1])
+            self.last_session_bars = bars[bars['Datetime'] >= bars['Datetime'].iloc[-1].normalize()]
+            self.last_session_bars = self.last_session_bars.assign(VWAP = intraday_vwap(self.last_session_bars))
+
+        if self.intraday_sessions is not None and len(self.intraday_sessions):
+            breakouts = self.intraday_sessions['Breakout'].value_counts(normalize = True)
+            self.highlights.append(
+                f'<li>Over <span class="metric">{len(self.intraday_sessions)}</span> sessions of minute data, this stock broke out of its 15 minute opening range upwards first on <span class="metric color-green">{breakouts.get("Up", 0):.2%}</span> and downwards first on <span class="metric color-red">{breakouts.get("Down", 0):.2%}</span> of sessions.</li>'
             )
-            plt.close()
-    
-    def _create_intraday_features(self):
+
         self._save_intraday_plots()
-    
+
     def _save_intraday_plots(self):
         plot_data = self.raw_data[
             ["Date", "Open", "High", "Low", "Prev Close", "LTP", "Close", "VWAP"]
         ].iloc[-PerfPeriods.SHORT:]
 
-        with sns.axes_style('dark'):
-            plt.figure(figsize = (10, 5), dpi = 125)
-            plt.axhline(y = 0, linestyle = "dashdot", label = "Prev Close Price")
-
-            for metric, color in (
-                ("High", "mediumseagreen"),
-                ("Open", "goldenrod"),
-                ("Low", "indianred")
-            ):
-
-                sns.lineplot(
-                    x = plot_data['Date'],
-                    y = ((plot_data[metric] / plot_data["Prev Close"]) - 1) * 100,
-                    label = metric,
-                    c = color
-                )
-
-            plt.legend()
-            plt.xticks(rotation = 45, fontsize = 8)
-            plt.xlabel("Date", fontsize = 12)
-            plt.ylabel("Change from previous Close price (%)", fontsize = 12)
-            plt.title(f"{self.symbol} - Metrics w.r.t. previous Close price", fontsize = 14)
-            plt.savefig(
-                self.image_out_path.joinpath(f"{self.symbol}_Intraday_Open_High_Low.png"), 
-                bbox_inches = "tight"
+        for name, title, y_label, base, base_label, metrics in (
+            (
+                "Intraday_Open_High_Low", "Metrics w.r.t. previous Close price",
+                "Change from previous Close price (%)", "Prev Close", "Prev Close Price",
+                (("High", "mediumseagreen"), ("Open", "goldenrod"), ("Low", "indianred"))
+            ),
+            (
+                "Intraday_VWAP_LTP", "Metrics w.r.t. Close price",
+                "Change from Close price (%)", "Close", "Close price",
+                (("VWAP", "mediumseagreen"), ("LTP", "indianred"))
+            )
+        ):
+            self._save_line_chart(
+                name,
+                title = f"{self.symbol} - {title}",
+                x_label = "Date",
+                y_label = y_label,
+                x = plot_data['Date'],
+                series = [
+                    (metric, ((plot_data[metric] / plot_data[base]) - 1) * 100, color)
+                    for metric, color in metrics
+                ],
+                hlines = [(0, base_label, DEFAULT_COLOR)]
             )
-            plt.close()
 
-            plt.figure(figsize = (10, 5), dpi = 125)
-            plt.axhline(y = 0, linestyle = "dashdot", label = "Close price")
+        if self.last_session_bars is None:
+            return
 
-            for metric, color in (
-                ("VWAP", "mediumseagreen"),
-                ("LTP", "indianred")
-            ):
+        self._save_line_chart(
+            "Intraday_Volume_Curve",
+            title = f"{self.symbol} - Average share of session volume by bar",
+            x_label = "Bar start",
+            y_label = "Share of session volume (%)",
+            x = self.volume_curve.index,
+            series = [("Volume share", self.volume_curve['Volume Share'].to_numpy() * 100, DEFAULT_COLOR)]
+        )
+        self._save_line_chart(
+            "Intraday_Session_VWAP",
+            title = f"{self.symbol} - Session VWAP on {self.last_session_bars['Datetime'].iloc[-1]:%B %d, %Y}",
+            x_label = "Minutes from open",
+            y_label = "Price",
+            x = (self.last_session_bars['Datetime'] - self.last_session_bars['Datetime'].dt.normalize()).dt.total_seconds() / 60 - OPEN_MINUTES,
+            series = [
+                ("Close", self.last_session_bars['Close'].to_numpy(np.float64), DEFAULT_COLOR),
+                ("VWAP", self.last_session_bars['VWAP'].to_numpy(), "goldenrod")
+            ]
+        )
 
-                sns.lineplot(
-                    x = plot_data['Date'],
-                    y = ((plot_data[metric] / plot_data["Close"]) - 1) * 100,
-                    label = metric,
-                    c = color
-                )
+    @FEATURES.report(
+        inputs = ('Close', 'Prev Close'),
+        params = ('projection_horizons', 'random_state')
+    )
+    def _report_projections(self, projection_horizons: list[int], random_state: int | None):
+        self.projection_fan = project_prices(
+            self.last_close,
+            self._returns,
+            max(projection_horizons),
+            random_state = random_state
+        )
+        self.projections = {
+            horizon: self.projection_fan[:, horizon - 1] for horizon in projection_horizons
+        }
+        self._save_projection_plots(projection_horizons)
+
+    def _save_projection_plots(self, projection_horizons: list[int]):
+        low, lower_mid, median, upper_mid, high = self.projection_fan
+
+        self._save_line_chart(
+            "Projected_Close_Price",
+            title = f"{self.symbol} - Projected Close price by bootstrapped returns",
+            x_label = "Trading days ahead",
+            y_label = "Close Price",
+            x = np.arange(1, self.projection_fan.shape[1] + 1),
+            series = [("Median", median, "goldenrod")],
+            hlines = [(self.last_close, "Latest Close price", "indianred")],
+            vlines = projection_horizons,
+            bands = [
+                (f"P{PROJECTION_PERCENTILES[0]} - P{PROJECTION_PERCENTILES[-1]}", low, high, "mediumseagreen", 0.2),
+                (f"P{PROJECTION_PERCENTILES[1]} - P{PROJECTION_PERCENTILES[-2]}", lower_mid, upper_mid, "mediumseagreen", 0.4)
+            ]
+        )
 
-            plt.legend()
-            plt.xticks(rotation = 45, fontsize = 8)
-            plt.xlabel("Date", fontsize = 12)
-            plt.ylabel("Change from Close price (%)", fontsize = 12)
-            plt.title(f"{self.symbol} - Metrics w.r.t. Close price", fontsize = 14)
-            plt.savefig(
-                self.image_out_path.joinpath(f"{self.symbol}_Intraday_VWAP_LTP.png"), 
-                bbox_inches = "tight"
+    @FEATURES.feature(
+        outputs = risk_columns,
+        inputs = ('Close', 'Prev Close'),
+        params = ('risk_windows', 'has_benchmark')
+    )
+    def _create_risk_features(self, risk_windows: list[int], has_benchmark: bool) -> dict[str, pd.Series]:
+        returns = self.daily_returns.reset_index(drop = True)
+        columns = {}
+
+        for window in risk_windows:
+            columns[f'% Rolling Volatility {window} days'] = (
+                rolling_volatility(returns, window) * 100
+            ).round(5)
+            columns[f'Rolling Sharpe {window} days'] = rolling_sharpe(returns, window).round(5)
+            columns[f'Rolling Sortino {window} days'] = rolling_sortino(returns, window).round(5)
+            columns[f'% Rolling Max Drawdown {window} days'] = rolling_max_drawdown(
+                self._close, window
+            ).round(5)
+
+            if has_benchmark:
+                columns[f'Rolling Beta {window} days'] = rolling_beta(
+                    returns,
+                    pd.Series(self._benchmark_returns),
+                    window
+                ).round(5)
+
+        return columns
+
+    @FEATURES.report(
+        inputs = lambda risk_windows: ['Date', *risk_columns(risk_windows)],
+        params = ('risk_windows',)
+    )
+    def _save_risk_plots(self, risk_windows: list[int]):
+        plot_data = self.raw_data.iloc[-PLOT_PERIOD:]
+
+        for metric, y_label, title, name in (
+            ('% Rolling Volatility', 'Annualized volatility (%)', 'Rolling annualized volatility', 'Rolling_Volatility'),
+            ('% Rolling Max Drawdown', 'Max drawdown (%)', 'Rolling max drawdown', 'Rolling_Max_Drawdown')
+        ):
+            self._save_line_chart(
+                name,
+                title = f"{self.symbol} - {title}",
+                x_label = "Date",
+                y_label = y_label,
+                x = plot_data['Date'],
+                series = [
+                    (
+                        f"{window}-D (Latest: {plot_data[f'{metric} {window} days'].iloc[-1]:.2f}%)",
+                        plot_data[f'{metric} {window} days'],
+                        color
+                    )
+                    for window, color in zip(risk_windows, ['mediumseagreen', 'goldenrod', 'indianred'])
+                ]
             )
-            plt.close()
\ No newline at end of file
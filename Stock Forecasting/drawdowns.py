@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+from runs import run_length_encode
+
+EPISODE_COLUMNS = [
+    'Symbol', 'Peak', 'Trough', 'Recovery', 'Depth',
+    'Days to Trough', 'Days to Recover', 'Days Underwater', 'Is Open'
+]
+
+def drawdown_episodes(
+    dates: pd.Series,
+    down_from_ath: pd.Series | np.ndarray,
+    symbols: pd.Series | str
+) -> pd.DataFrame:
+    dates = np.asarray(dates, dtype = 'datetime64[ns]')
+    down_from_ath = np.asarray(down_from_ath, dtype = np.float64)
+    n = down_from_ath.size
+
+    if n == 0:
+        return pd.DataFrame(columns = EPISODE_COLUMNS)
+
+    symbols = np.full(n, symbols, dtype = object) if isinstance(symbols, str) else np.asarray(symbols)
+    _, symbol_codes = np.unique(symbols, return_inverse = True)
+
+    # Runs break on both the underwater flag and the symbol, so a single pass
+    # over a symbol-partitioned frame yields the episodes of every symbol.
+    runs = run_length_encode(symbol_codes * 2 + (down_from_ath < 0))
+    is_underwater_run = runs.values % 2 == 1
+    episode_runs = np.flatnonzero(is_underwater_run)
+
+    starts = runs.starts[episode_runs]
+    ends = runs.ends[episode_runs]
+    depths = np.fmin.reduceat(down_from_ath, runs.starts)[episode_runs]
+
+    # The trough is the first session of an episode at its deepest level.
+    episode_ids = (np.cumsum(is_underwater_run) - 1)[runs.run_ids]
+    trough_positions = np.flatnonzero(
+        is_underwater_run[runs.run_ids] & (down_from_ath == depths[episode_ids])
+    )
+    troughs = trough_positions[np.searchsorted(trough_positions, starts)]
+
+    is_open = (ends == n - 1) | (symbol_codes[np.minimum(ends + 1, n - 1)] != symbol_codes[ends])
+    peaks = starts - 1
+    recoveries = np.minimum(ends + 1, n - 1)
+
+    return pd.DataFrame({
+        'Symbol': symbols[starts],
+        'Peak': dates[peaks],
+        'Trough': dates[troughs],
+        'Recovery': np.where(is_open, np.datetime64('NaT'), dates[recoveries]),
+        'Depth': depths,
+        'Days to Trough': troughs - peaks,
+        'Days to Recover': np.where(is_open, np.nan, recoveries - troughs),
+        'Days Underwater': runs.lengths[episode_runs],
+        'Is Open': is_open
+    })
+
+def worst_episodes(episodes: pd.DataFrame, count: int) -> pd.DataFrame:
+    return episodes.sort_values('Depth', kind = 'stable').head(count)
+
+def underwater_summary(
+    episodes: pd.DataFrame,
+    num_sessions: pd.Series,
+    min_depth: float = -10
+) -> pd.DataFrame:
+    by_symbol = episodes.groupby('Symbol')
+    deep_episodes = episodes[episodes['Depth'] <= min_depth].groupby('Symbol')
+    open_episodes = episodes[episodes['Is Open']].set_index('Symbol')
+
+    return pd.DataFrame({
+        'Episodes': by_symbol.size(),
+        'Pcnt Underwater': by_symbol['Days Underwater'].sum() / num_sessions,
+        'Median Depth': by_symbol['Depth'].median(),
+        'Median Days to Recover': deep_episodes['Days to Recover'].median(),
+        'Current Depth': open_episodes['Depth'],
+        'Current Days Underwater': open_episodes['Days Underwater']
+    }, index = num_sessions.index).fillna({
+        'Episodes': 0, 'Pcnt Underwater': 0, 'Current Depth': 0, 'Current Days Underwater': 0
+    })
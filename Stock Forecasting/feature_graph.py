@@ -0,0 +1,192 @@
+import heapq
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from graphlib import TopologicalSorter
+
+Names = tuple[str, ...] | Callable[..., Iterable[str]]
+
+def _names(names: Names, arguments: dict) -> list[str]:
+    return list(names(**arguments) if callable(names) else names)
+
+@dataclass(frozen = True)
+class Feature:
+    name: str
+    compute: Callable
+    outputs: Names
+    inputs: Names = ()
+    params: tuple[str, ...] = ()
+    intermediate: bool = False
+
+    def arguments(self, params: dict) -> dict:
+        return {param: params[param] for param in self.params}
+
+    def output_names(self, params: dict) -> list[str]:
+        return _names(self.outputs, self.arguments(params))
+
+    def input_names(self, params: dict) -> list[str]:
+        return _names(self.inputs, self.arguments(params))
+
+@dataclass(frozen = True)
+class Report:
+    name: str
+    render: Callable
+    inputs: Names = ()
+    params: tuple[str, ...] = ()
+
+    def arguments(self, params: dict) -> dict:
+        return {param: params[param] for param in self.params}
+
+    def input_names(self, params: dict) -> list[str]:
+        return _names(self.inputs, self.arguments(params))
+
+class FeatureGraph:
+    def __init__(self) -> None:
+        self.features: dict[str, Feature] = {}
+        self.reports: dict[str, Report] = {}
+
+    def feature(
+        self,
+        outputs: Names,
+        inputs: Names = (),
+        params: tuple[str, ...] = (),
+        intermediate: bool = False
+    ) -> Callable:
+        def register(compute: Callable) -> Callable:
+            self.features[compute.__name__] = Feature(
+                compute.__name__, compute, outputs, inputs, params, intermediate
+            )
+            return compute
+
+        return register
+
+    def report(self, inputs: Names = (), params: tuple[str, ...] = ()) -> Callable:
+        def register(render: Callable) -> Callable:
+            self.reports[render.__name__] = Report(render.__name__, render, inputs, params)
+            return render
+
+        return register
+
+    def _producers(self, params: dict) -> dict[str, Feature]:
+        producers = {}
+
+        for feature in self.features.values():
+            for output in feature.output_names(params):
+                if output in producers:
+                    raise ValueError(f"'{output}' is produced by both {producers[output].name} and {feature.name}")
+
+                producers[output] = feature
+
+        return producers
+
+    def dependencies(
+        self,
+        params: dict,
+        sources: Iterable[str],
+        outputs: Iterable[str] | None = None
+    ) -> dict[str, set[str]]:
+        producers = self._producers(params)
+        sources = set(sources)
+        pending = list(producers) if outputs is None else list(outputs)
+        dependencies: dict[str, set[str]] = {}
+
+        # A producer whose outputs are all present is not run again, and its
+        # outputs are read from the sources like any other column.
+        producers = {
+            output: feature for output, feature in producers.items()
+            if not sources.issuperset(feature.output_names(params))
+        }
+
+        while pending:
+            key = pending.pop()
+
+            if key in producers:
+                feature = producers[key]
+
+                if feature.name not in dependencies:
+                    inputs = feature.input_names(params)
+                    dependencies[feature.name] = {producers[i].name for i in inputs if i in producers}
+                    pending.extend(inputs)
+            elif key not in sources:
+                raise ValueError(f"No feature produces '{key}' and it is not in the source data")
+
+        return dependencies
+
+    def resolve(
+        self,
+        params: dict,
+        sources: Iterable[str],
+        outputs: Iterable[str] | None = None
+    ) -> list[Feature]:
+        sorter = TopologicalSorter(self.dependencies(params, sources, outputs))
+        sorter.prepare()
+        registration_order = {name: i for i, name in enumerate(self.features)}
+        ready = []
+        resolved = []
+
+        while sorter.is_active():
+            for name in sorter.get_ready():
+                heapq.heappush(ready, (registration_order[name], name))
+
+            _, name = heapq.heappop(ready)
+            resolved.append(self.features[name])
+            sorter.done(name)
+
+        return resolved
+
+    def _commit(self, target, feature: Feature, columns: dict | None):
+        if not columns:
+            return
+
+        if feature.intermediate:
+            target.intermediates.update(columns)
+        else:
+            for col_name, values in columns.items():
+                target.raw_data[col_name] = values
+
+    def run(
+        self,
+        target,
+        params: dict,
+        outputs: Iterable[str] | None = None,
+        max_workers: int = 1,
+        reports: bool = True
+    ) -> list[Feature]:
+        sources = set(target.raw_data.columns) | set(target.intermediates)
+        selected = list(self.reports.values()) if reports else []
+
+        # Reports read their inputs, so those are produced along with the outputs.
+        if outputs is not None:
+            outputs = [*outputs, *(name for report in selected for name in report.input_names(params))]
+
+        resolved = self.resolve(params, sources, outputs)
+
+        if max_workers <= 1:
+            for feature in resolved:
+                self._commit(target, feature, feature.compute(target, **feature.arguments(params)))
+        else:
+            # Features in a wave only read columns committed by earlier waves, so
+            # the frame is never written while a worker is reading it.
+            sorter = TopologicalSorter(self.dependencies(params, sources, outputs))
+            sorter.prepare()
+
+            with ThreadPoolExecutor(max_workers = max_workers) as executor:
+                while sorter.is_active():
+                    wave = [self.features[name] for name in sorter.get_ready()]
+                    futures = [
+                        executor.submit(feature.compute, target, **feature.arguments(params))
+                        for feature in wave
+                    ]
+
+                    results = [future.result() for future in futures]
+
+                    for feature, columns in zip(wave, results):
+                        self._commit(target, feature, columns)
+                        sorter.done(feature.name)
+
+        # Reports draw with pyplot, which is not thread safe, so they always
+        # run one at a time once every feature is committed.
+        for report in selected:
+            report.render(target, **report.arguments(params))
+
+        return resolved
@@ -0,0 +1,178 @@
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import Ridge
+from sklearn.model_selection import TimeSeriesSplit
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from utility import Config, PerfPeriods
+
+FEATURE_COLUMNS = [
+    '% Change from 15 MA',
+    '% Change from 50 MA',
+    '% Change from 200 MA',
+    '% Rolling Returns 200 days',
+    '% Rolling Returns 1000 days',
+    'Pcnt hits of Close',
+    'Days of no return',
+    'Streak',
+    'Is Green',
+    'MA-S (1-15-15)',
+    'MA-S (5-100-20)',
+    '% Down from ATH'
+]
+
+MODELS = {
+    "ridge": lambda random_state: make_pipeline(StandardScaler(), Ridge(alpha = 1.0)),
+    "random_forest": lambda random_state: RandomForestRegressor(
+        n_estimators = 100,
+        max_depth = 6,
+        min_samples_leaf = 20,
+        random_state = random_state
+    )
+}
+
+def build_feature_matrix(stock_df: pd.DataFrame, horizon: int) -> pd.DataFrame:
+    feature_df = stock_df[['Date'] + FEATURE_COLUMNS].copy()
+    feature_df['Streak'] = np.where(stock_df['Is Green'] == 1, 1, -1) * stock_df['Streak']
+    feature_df['Range'] = stock_df['Range'] / stock_df['Prev Close']
+    feature_df['Daily Returns'] = (stock_df['Close'] / stock_df['Prev Close']) - 1
+    feature_df['Log Volume Change'] = np.log(
+        stock_df['Volume'] / stock_df['Volume'].rolling(window = PerfPeriods.SHORT, min_periods = 1).mean()
+    )
+    feature_df['Target'] = (stock_df['Close'].shift(-horizon) / stock_df['Close']) - 1
+
+    return feature_df.dropna().reset_index(drop = True)
+
+def load_feature_matrices(
+    all_consolidated_path: Path,
+    cache_dir: Path,
+    horizon: int
+) -> dict[str, pd.DataFrame]:
+    cache_dir.mkdir(exist_ok = True, parents = True)
+    stock_dfs = pd.read_parquet(all_consolidated_path)
+    feature_matrices = {}
+    cache_hits = 0
+
+    for symbol, stock_df in stock_dfs.groupby('Symbol', sort = True):
+        data_hash = pd.util.hash_pandas_object(
+            stock_df[['Date', 'Prev Close', 'Close', 'Volume', 'Range'] + FEATURE_COLUMNS],
+            index = False
+        ).sum()
+        cache_path = cache_dir.joinpath(f"{symbol}_{horizon}_{data_hash:016x}.parquet")
+
+        if cache_path.exists():
+            feature_matrices[symbol] = pd.read_parquet(cache_path)
+            cache_hits += 1
+        else:
+            for stale_path in cache_dir.glob(f"{symbol}_{horizon}_*.parquet"):
+                stale_path.unlink()
+
+            feature_matrices[symbol] = build_feature_matrix(stock_df.reset_index(drop = True), horizon)
+            feature_matrices[symbol].to_parquet(cache_path, index = False)
+
+    print(f"> Loaded feature matrices for {len(feature_matrices)} symbols ({cache_hits} from cache).")
+    return feature_matrices
+
+def _fit_fold(task: tuple) -> dict:
+    symbol, model_name, fold, x_train, y_train, x_test, y_test, random_state = task
+
+    start_time = perf_counter()
+    model = MODELS[model_name](random_state).fit(x_train, y_train)
+    fit_time = perf_counter() - start_time
+
+    start_time = perf_counter()
+    y_pred = model.predict(x_test)
+    predict_time = perf_counter() - start_time
+
+    return {
+        'Symbol': symbol,
+        'Model': model_name,
+        'Fold': fold,
+        'Train Size': len(y_train),
+        'Test Size': len(y_test),
+        'MAE': np.abs(y_pred - y_test).mean(),
+        'Direction Accuracy': (np.sign(y_pred) == np.sign(y_test)).mean(),
+        'IC': pd.Series(y_pred).corr(pd.Series(y_test), method = "spearman"),
+        'Fit Time': fit_time,
+        'Predict Time': predict_time
+    }
+
+def walk_forward(
+    feature_matrices: dict[str, pd.DataFrame],
+    model_names: list[str],
+    horizon: int,
+    n_splits: int = 5,
+    max_train_size: int | None = 750,
+    random_state: int | None = None,
+    max_workers: int | None = None
+) -> pd.DataFrame:
+    splitter = TimeSeriesSplit(
+        n_splits = n_splits,
+        max_train_size = max_train_size,
+        gap = horizon
+    )
+    feature_cols = [c for c in next(iter(feature_matrices.values())).columns if c not in ('Date', 'Target')]
+    tasks = []
+
+    for symbol, feature_df in feature_matrices.items():
+        if len(feature_df) <= (n_splits + 1) * horizon:
+            print(f"> Skipping {symbol} with only {len(feature_df)} usable records.")
+            continue
+
+        x = feature_df[feature_cols].to_numpy(dtype = np.float64)
+        y = feature_df['Target'].to_numpy(dtype = np.float64)
+
+        for fold, (train_idx, test_idx) in enumerate(splitter.split(x), start = 1):
+            for model_name in model_names:
+                tasks.append((
+                    symbol, model_name, fold,
+                    x[train_idx], y[train_idx], x[test_idx], y[test_idx],
+                    random_state
+                ))
+
+    with ProcessPoolExecutor(max_workers = max_workers) as executor:
+        return pd.DataFrame(list(executor.map(_fit_fold, tasks, chunksize = 4)))
+
+if __name__ == "__main__":
+    parser = ArgumentParser(prog = "Walk-forward Forecasting")
+    parser.add_argument("-n", "--horizon", type = int, default = PerfPeriods.VERY_SHORT)
+    parser.add_argument("-m", "--models", nargs = "+", choices = list(MODELS), default = list(MODELS))
+    parser.add_argument("-s", "--splits", type = int, default = 5)
+    parser.add_argument("--max-train-size", type = int, default = 750)
+    parser.add_argument("-w", "--workers", type = int, default = None)
+    parser.add_argument("-o", "--out", type = Path, default = None)
+    args = parser.parse_args()
+
+    CONFIG = Config(Path("config.json"))
+
+    feature_matrices = load_feature_matrices(
+        CONFIG.NSE_DATA_DIR.joinpath("all_consolidated.parquet"),
+        CONFIG.CACHE_DIR.joinpath("features"),
+        args.horizon
+    )
+
+    start_time = perf_counter()
+    fold_results = walk_forward(
+        feature_matrices,
+        args.models,
+        args.horizon,
+        args.splits,
+        args.max_train_size,
+        CONFIG.RANDOM_STATE,
+        args.workers
+    )
+    print(f"> Trained {len(fold_results)} folds in {perf_counter() - start_time:.2f}s.")
+
+    print(fold_results.groupby('Model')[
+        ['MAE', 'Direction Accuracy', 'IC', 'Fit Time', 'Predict Time']
+    ].agg(['mean', 'max']).to_string())
+
+    if args.out is not None:
+        fold_results.to_csv(args.out, index = False)
@@ -0,0 +1,279 @@
+import hashlib
+import json
+from argparse import ArgumentParser
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from runs import run_length_encode
+from store import frame_bytes
+from utility import Config
+
+MINUTE_DIR = "minute"
+INTRADAY_DIR = "intraday"
+INGESTED_FILE = "ingested.json"
+OPEN_MINUTES = 9 * 60 + 15
+MARKET_OPEN = np.timedelta64(OPEN_MINUTES, 'm')
+BAR_DTYPES = {
+    'Open': np.float32,
+    'High': np.float32,
+    'Low': np.float32,
+    'Close': np.float32,
+    'Volume': np.int64
+}
+BAR_COLUMNS = ['Datetime', *BAR_DTYPES]
+
+def read_minute_file(path: Path) -> pd.DataFrame:
+    bars = pd.read_csv(path)
+    bars.columns = [c.strip().title() for c in bars.columns]
+
+    if 'Datetime' not in bars.columns:
+        bars['Datetime'] = bars.pop('Date').astype(str) + " " + bars.pop('Time').astype(str)
+
+    bars['Datetime'] = pd.to_datetime(bars['Datetime']).astype('datetime64[ns]')
+    return bars[BAR_COLUMNS].astype(BAR_DTYPES)
+
+class MinuteBarStore:
+    def __init__(self, root: Path, memory_budget: int = 2 ** 28) -> None:
+        self.root = root
+        self.memory_budget = memory_budget
+        self._pending: list[pd.DataFrame] = []
+        self._pending_bytes = 0
+
+    def _month_path(self, month: str) -> Path:
+        return self.root.joinpath(f"Month={month}", "part.parquet")
+
+    def months(self) -> list[str]:
+        return sorted(
+            p.name.removeprefix("Month=") for p in self.root.glob("Month=*") if p.is_dir()
+        )
+
+    def ingested(self) -> dict[str, str]:
+        ingested_path = self.root.joinpath(INGESTED_FILE)
+        return json.loads(ingested_path.read_text(encoding = "utf-8")) if ingested_path.is_file() else {}
+
+    def append(self, bars: pd.DataFrame):
+        self._pending.append(bars)
+        self._pending_bytes += frame_bytes(bars)
+
+        if self._pending_bytes > self.memory_budget:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+
+        bars = pd.concat(self._pending, ignore_index = True)
+        self._pending = []
+        self._pending_bytes = 0
+        months = bars['Datetime'].to_numpy().astype('datetime64[M]')
+
+        for month in np.unique(months):
+            month_path = self._month_path(str(month))
+            month_bars = bars[months == month]
+
+            # Bars from later files replace the same minute from earlier ones.
+            if month_path.exists():
+                month_bars = pd.concat([pd.read_parquet(month_path), month_bars], ignore_index = True)
+
+            month_path.parent.mkdir(exist_ok = True, parents = True)
+            month_bars.drop_duplicates('Datetime', keep = 'last').sort_values('Datetime').to_parquet(
+                month_path, index = False, compression = "zstd"
+            )
+
+    # Files are keyed on a hash of their content, so a corrected file is read
+    # again whatever its modification time.
+    def ingest(self, minute_dir: Path) -> int:
+        ingested = self.ingested()
+        digests = {f.name: hashlib.sha256(f.read_bytes()).hexdigest() for f in sorted(minute_dir.glob("*.csv"))}
+        files = [name for name, digest in digests.items() if ingested.get(name) != digest]
+
+        for name in files:
+            self.append(read_minute_file(minute_dir.joinpath(name)))
+
+        self.flush()
+        self.root.mkdir(exist_ok = True, parents = True)
+        self.root.joinpath(INGESTED_FILE).write_text(json.dumps({**ingested, **digests}, indent = 2), encoding = "utf-8")
+        return len(files)
+
+    def read_month(self, month: str, columns: list[str] | None = None) -> pd.DataFrame:
+        return pd.read_parquet(self._month_path(month), columns = columns)
+
+    def iter_months(self, start: str | None = None, columns: list[str] | None = None) -> Iterator[pd.DataFrame]:
+        for month in self.months():
+            if start is None or month >= start:
+                yield self.read_month(month, columns)
+
+def _minutes_from_open(datetimes: np.ndarray) -> np.ndarray:
+    return (datetimes - datetimes.astype('datetime64[D]') - MARKET_OPEN) // np.timedelta64(1, 'm')
+
+def _typical_value(bars: pd.DataFrame) -> np.ndarray:
+    typical_price = (
+        bars['High'].to_numpy(np.float64) + bars['Low'].to_numpy(np.float64) + bars['Close'].to_numpy(np.float64)
+    ) / 3
+    return typical_price * bars['Volume'].to_numpy(np.float64)
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    return np.divide(
+        numerator, denominator, out = np.full(numerator.shape, np.nan), where = denominator > 0
+    )
+
+def resample_bars(bars: pd.DataFrame, bar_minutes: int) -> pd.DataFrame:
+    if bars.empty:
+        return pd.DataFrame(columns = [*BAR_COLUMNS, 'VWAP'])
+
+    datetimes = bars['Datetime'].to_numpy(dtype = 'datetime64[ns]')
+    bar_offsets = (_minutes_from_open(datetimes) // bar_minutes) * bar_minutes
+    bar_starts = datetimes.astype('datetime64[D]') + MARKET_OPEN + bar_offsets.astype('timedelta64[m]')
+
+    # Bars are sorted, so every output bar is one run of equal bar starts.
+    runs = run_length_encode(bar_starts)
+    volumes = np.add.reduceat(bars['Volume'].to_numpy(), runs.starts, dtype = np.int64)
+
+    return pd.DataFrame({
+        'Datetime': runs.values.astype('datetime64[ns]'),
+        'Open': bars['Open'].to_numpy()[runs.starts],
+        'High': np.maximum.reduceat(bars['High'].to_numpy(), runs.starts),
+        'Low': np.minimum.reduceat(bars['Low'].to_numpy(), runs.starts),
+        'Close': bars['Close'].to_numpy()[runs.ends],
+        'Volume': volumes,
+        'VWAP': _safe_divide(np.add.reduceat(_typical_value(bars), runs.starts), volumes)
+    })
+
+def intraday_vwap(bars: pd.DataFrame) -> np.ndarray:
+    sessions = run_length_encode(bars['Datetime'].to_numpy(dtype = 'datetime64[ns]').astype('datetime64[D]'))
+    values = _typical_value(bars)
+    volumes = bars['Volume'].to_numpy(np.float64)
+
+    cum_values = np.cumsum(values)
+    cum_volumes = np.cumsum(volumes)
+    session_offsets = sessions.starts[sessions.run_ids]
+
+    return _safe_divide(
+        cum_values - (cum_values - values)[session_offsets],
+        cum_volumes - (cum_volumes - volumes)[session_offsets]
+    )
+
+def opening_ranges(bars: pd.DataFrame, opening_minutes: int = 15) -> pd.DataFrame:
+    if bars.empty:
+        return pd.DataFrame()
+
+    datetimes = bars['Datetime'].to_numpy(dtype = 'datetime64[ns]')
+    sessions = run_length_encode(datetimes.astype('datetime64[D]'))
+    minutes_from_open = _minutes_from_open(datetimes)
+    high = bars['High'].to_numpy(np.float64)
+    low = bars['Low'].to_numpy(np.float64)
+
+    is_opening = (minutes_from_open >= 0) & (minutes_from_open < opening_minutes)
+    range_high = np.maximum.reduceat(np.where(is_opening, high, -np.inf), sessions.starts)
+    range_low = np.minimum.reduceat(np.where(is_opening, low, np.inf), sessions.starts)
+    range_high[np.isinf(range_high)] = np.nan
+    range_low[np.isinf(range_low)] = np.nan
+
+    # The first bar past either side of the range decides the breakout.
+    n = len(bars)
+    positions = np.arange(n)
+    is_after = minutes_from_open >= opening_minutes
+    first_up = np.minimum.reduceat(
+        np.where(is_after & (high > range_high[sessions.run_ids]), positions, n), sessions.starts
+    )
+    first_down = np.minimum.reduceat(
+        np.where(is_after & (low < range_low[sessions.run_ids]), positions, n), sessions.starts
+    )
+    first_breakout = np.minimum(first_up, first_down)
+    volumes = np.add.reduceat(bars['Volume'].to_numpy(), sessions.starts, dtype = np.int64)
+
+    return pd.DataFrame({
+        'Date': sessions.values.astype('datetime64[ns]'),
+        'Open': bars['Open'].to_numpy(np.float64)[sessions.starts],
+        'High': np.maximum.reduceat(high, sessions.starts),
+        'Low': np.minimum.reduceat(low, sessions.starts),
+        'Close': bars['Close'].to_numpy(np.float64)[sessions.ends],
+        'Volume': volumes,
+        'VWAP': _safe_divide(np.add.reduceat(_typical_value(bars), sessions.starts), volumes),
+        'Opening Range High': range_high,
+        'Opening Range Low': range_low,
+        '% Opening Range': ((range_high / range_low) - 1) * 100,
+        'Breakout': np.select(
+            [first_up < first_down, first_down < first_up, first_up < n],
+            ['Up', 'Down', 'Both'],
+            'None'
+        ),
+        'Minutes to Breakout': np.where(
+            first_breakout < n, minutes_from_open[np.minimum(first_breakout, n - 1)], np.nan
+        )
+    })
+
+def volume_shares(bars: pd.DataFrame) -> pd.Series:
+    datetimes = bars['Datetime'].to_numpy(dtype = 'datetime64[ns]')
+    sessions = run_length_encode(datetimes.astype('datetime64[D]'))
+    volumes = bars['Volume'].to_numpy(np.float64)
+    session_volumes = np.add.reduceat(volumes, sessions.starts)
+
+    return pd.Series(
+        _safe_divide(volumes, session_volumes[sessions.run_ids]),
+        index = pd.Index(_minutes_from_open(datetimes), name = 'Minutes from Open')
+    )
+
+def intraday_summary(
+    months: Iterable[pd.DataFrame],
+    bar_minutes: int = 15,
+    opening_minutes: int = 15
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    sessions = []
+    share_sums = pd.Series(dtype = np.float64)
+
+    # Sessions never span months, so a month of bars is held at a time.
+    for bars in months:
+        sessions.append(opening_ranges(bars, opening_minutes))
+        shares = volume_shares(resample_bars(bars, bar_minutes))
+        share_sums = share_sums.add(shares.groupby(level = 0).sum(), fill_value = 0)
+
+    sessions = pd.concat(sessions, ignore_index = True) if sessions else pd.DataFrame()
+    volume_curve = pd.DataFrame({'Volume Share': share_sums.sort_index() / max(len(sessions), 1)})
+    volume_curve['Cumulative Volume Share'] = volume_curve['Volume Share'].cumsum()
+    volume_curve.index = [
+        f"{(OPEN_MINUTES + minutes) // 60:02d}:{(OPEN_MINUTES + minutes) % 60:02d}" for minutes in volume_curve.index
+    ]
+
+    return sessions, volume_curve
+
+if __name__ == "__main__":
+    parser = ArgumentParser(prog = "Intraday Bars")
+    parser.add_argument("symbol")
+    parser.add_argument("-i", "--ingest", action = "store_true")
+    parser.add_argument("-b", "--bar", type = int, default = 15)
+    parser.add_argument("-or", "--opening-range", type = int, default = 15)
+    parser.add_argument("-s", "--start", default = None)
+    parser.add_argument("-o", "--out", type = Path, default = None)
+    args = parser.parse_args()
+
+    CONFIG = Config(Path("config.json"))
+    symbol_dir = CONFIG.NSE_DATA_DIR.joinpath(args.symbol)
+    store = MinuteBarStore(symbol_dir.joinpath(INTRADAY_DIR), CONFIG.MEMORY_BUDGET)
+
+    if args.ingest:
+        num_files = store.ingest(symbol_dir.joinpath(MINUTE_DIR))
+        print(f"> Ingested {num_files} minute bar files into {len(store.months())} months at {store.root}")
+
+    if args.out is not None:
+        writer = None
+
+        for bars in store.iter_months(args.start):
+            table = pa.Table.from_pandas(resample_bars(bars, args.bar), preserve_index = False)
+            writer = writer or pq.ParquetWriter(args.out, table.schema, compression = "zstd")
+            writer.write_table(table)
+
+        if writer is not None:
+            writer.close()
+            print(f"> Saved {args.bar} minute bars to {args.out}")
+
+    sessions, volume_curve = intraday_summary(store.iter_months(args.start), args.bar, args.opening_range)
+    print(f"> {len(sessions)} sessions from {len(store.months())} months of minute bars.")
+    print(sessions.tail(10).to_string(index = False, float_format = "{:.2f}".format))
+    print(sessions['Breakout'].value_counts(normalize = True).round(4).to_string())
+    print(volume_curve.round(4).to_string())
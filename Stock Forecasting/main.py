@@ -5,9 +5,14 @@ import templates
 from utility import PerfPeriods, Config
 from data_download import update_hist_eq_data
 from data_process import StockData
+from output_writer import OutputWriter
+from screener import LATEST_FEATURES_FILE, Screener
+from store import FeatureStore
+from validation import DATA_ISSUES_FILE, concat_issues
 
 parser = ArgumentParser(prog = "Financial Modelling")
 parser.add_argument("-nu", "--no-update", action = "store_true")
+parser.add_argument("-ooc", "--out-of-core", action = "store_true")
 args = parser.parse_args()
 
 CONFIG = Config(Path("config.json"))
@@ -15,43 +20,99 @@ STOCK_SYMBOLS = CONFIG.get_all_stock_symbols()
 
 summaries = []
 perf_reports = []
-stock_dfs = []
+seasonality = []
+screener = Screener()
+data_issues = []
 
-for i, symbol in enumerate(STOCK_SYMBOLS, start = 1):
-    print(f"\n#{i} {symbol}")
+if args.out_of_core:
+    stock_dfs = FeatureStore(CONFIG.CACHE_DIR.joinpath("store"), CONFIG.MEMORY_BUDGET)
+    stock_dfs.clear()
+else:
+    stock_dfs = []
 
-    is_data_updated = False if args.no_update else update_hist_eq_data(symbol, CONFIG.NSE_DATA_DIR)
+with OutputWriter() as writer:
+    num_stale = sum([
+        writer.remove_stale(CONFIG.INDEX_PATH.parent, recursive = False),
+        writer.remove_stale(CONFIG.INDEX_PATH.parent.joinpath("web")),
+        writer.remove_stale(CONFIG.NSE_DATA_DIR)
+    ])
 
-    stock_data = StockData(
-        symbol, 
-        CONFIG.NSE_DATA_DIR, 
+    if num_stale:
+        print(f"> Removed {num_stale} temporary files left by an interrupted run")
+
+    benchmark_data = StockData(
+        CONFIG.BENCHMARK_SYMBOL,
+        CONFIG.NSE_DATA_DIR,
         CONFIG.COMPANY_DATA_DIR,
         CONFIG.IMAGES_OUT_DIR,
-        is_data_updated
-    )
-    stock_data.create_features(
-        performance_periods = list(PerfPeriods),
-        ma_periods = [PerfPeriods.SHORT, PerfPeriods.MEDIUM, PerfPeriods.LONG],
-        sp_ma_periods = [list(range(1, 16)), list(range(5, 101, 5))]
-    )
-    templates.create_stock_report(
-        CONFIG.STOCK_REPORT_TEMPLATE, 
-        CONFIG.PAGES_OUT_DIR, 
-        stock_data,
-        ma_periods = [PerfPeriods.SHORT, PerfPeriods.MEDIUM, PerfPeriods.LONG]
+        False if args.no_update else update_hist_eq_data(CONFIG.BENCHMARK_SYMBOL, CONFIG.NSE_DATA_DIR),
+        CONFIG.CHART_MODE,
+        writer
     )
 
-    summaries.append(stock_data.summary)
-    perf_reports.append(stock_data.perf_reports)
+    for i, symbol in enumerate(STOCK_SYMBOLS, start = 1):
+        print(f"\n#{i} {symbol}")
+
+        if symbol == CONFIG.BENCHMARK_SYMBOL:
+            stock_data = benchmark_data
+        else:
+            is_data_updated = False if args.no_update else update_hist_eq_data(symbol, CONFIG.NSE_DATA_DIR)
+
+            stock_data = StockData(
+                symbol, 
+                CONFIG.NSE_DATA_DIR, 
+                CONFIG.COMPANY_DATA_DIR,
+                CONFIG.IMAGES_OUT_DIR,
+                is_data_updated,
+                CONFIG.CHART_MODE,
+                writer
+            )
+
+        stock_data.create_features(
+            performance_periods = list(PerfPeriods),
+            ma_periods = [PerfPeriods.SHORT, PerfPeriods.MEDIUM, PerfPeriods.LONG],
+            sp_ma_periods = [list(range(1, 16)), list(range(5, 101, 5))],
+            projection_horizons = [PerfPeriods.SHORT, PerfPeriods.MEDIUM, PerfPeriods.LONG],
+            risk_windows = [PerfPeriods.MEDIUM, PerfPeriods.LONG],
+            benchmark_returns = benchmark_data.daily_returns,
+            random_state = CONFIG.RANDOM_STATE,
+            max_workers = CONFIG.FEATURE_WORKERS
+        )
+        templates.create_stock_report(
+            CONFIG.STOCK_REPORT_TEMPLATE, 
+            CONFIG.PAGES_OUT_DIR, 
+            stock_data,
+            ma_periods = [PerfPeriods.SHORT, PerfPeriods.MEDIUM, PerfPeriods.LONG],
+            benchmark_symbol = CONFIG.BENCHMARK_SYMBOL,
+            writer = writer
+        )
 
-    stock_data.raw_data['Symbol'] = symbol
-    stock_dfs.append(stock_data.raw_data)
+        templates.save_interactive_bundle(CONFIG.INTERACTIVE_DATA_DIR, stock_data, writer)
 
-templates.create_index(
-    CONFIG.INDEX_TEMPLATE, 
-    CONFIG.INDEX_PATH, 
-    summaries,
-    perf_reports,
-    stock_dfs,
-    [PerfPeriods.VERY_SHORT, PerfPeriods.MEDIUM, PerfPeriods.VERY_LONG]
-)
\ No newline at end of file
+        summaries.append(stock_data.summary)
+        perf_reports.append(stock_data.perf_reports)
+        seasonality.append(stock_data.seasonality)
+
+        stock_data.raw_data['Symbol'] = symbol
+        stock_dfs.append(stock_data.raw_data)
+        screener.update(stock_data.raw_data)
+        data_issues.append(stock_data.data_issues)
+
+    if args.out_of_core:
+        stock_dfs.flush()
+
+    screener.save(CONFIG.NSE_DATA_DIR.joinpath(LATEST_FEATURES_FILE), writer)
+    writer.write_parquet(CONFIG.NSE_DATA_DIR.joinpath(DATA_ISSUES_FILE), concat_issues(data_issues))
+
+    templates.create_index(
+        CONFIG.INDEX_TEMPLATE, 
+        CONFIG.INDEX_PATH, 
+        summaries,
+        perf_reports,
+        seasonality,
+        stock_dfs,
+        [PerfPeriods.VERY_SHORT, PerfPeriods.MEDIUM, PerfPeriods.VERY_LONG],
+        writer,
+        benchmark_symbol = CONFIG.BENCHMARK_SYMBOL
+    )
+    templates.save_interactive_manifest(CONFIG.INTERACTIVE_DATA_DIR, summaries, writer)
\ No newline at end of file
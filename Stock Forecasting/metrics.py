@@ -1,28 +1,51 @@
-import warnings
-
+import numpy as np
 import pandas as pd
-from scipy.stats import spearmanr, ConstantInputWarning
+from scipy.stats import rankdata
+
+def moving_average_matrix(
+    ordered_data: np.ndarray,
+    windows: list[int],
+    decimals: int = 8
+) -> np.ndarray:
+    values = np.asarray(ordered_data, dtype = np.float64)
+    cum_sums = np.concatenate(([0.0], np.cumsum(values - values[0])))
+
+    ends = np.arange(1, values.size + 1)[:, np.newaxis]
+    starts = np.maximum(ends - np.asarray(windows)[np.newaxis, :], 0)
+
+    return np.round(
+        ((cum_sums[ends] - cum_sums[starts]) / (ends - starts)) + values[0],
+        decimals
+    )
 
-warnings.filterwarnings(
-    action = "ignore",
-    category = ConstantInputWarning
-)
+def spearman_by_row(
+    values: np.ndarray,
+    reference: list[int] | np.ndarray
+) -> np.ndarray:
+    value_ranks = rankdata(values, axis = 1)
+    value_ranks -= value_ranks.mean(axis = 1, keepdims = True)
+
+    ref_ranks = rankdata(reference)
+    ref_ranks -= ref_ranks.mean()
+
+    with np.errstate(invalid = "ignore", divide = "ignore"):
+        return (value_ranks @ ref_ranks) / np.sqrt(
+            (value_ranks ** 2).sum(axis = 1) * (ref_ranks ** 2).sum()
+        )
+
+def ma_spearman_scores(
+    ma_matrix: np.ndarray,
+    windows: list[int] | tuple[int, ...],
+    short_window_default: float = 0.0
+) -> np.ndarray:
+    return np.nan_to_num(-spearman_by_row(ma_matrix, windows), nan = short_window_default)
 
 def spearman_over_ma(
     ordered_data: pd.Series,
     windows: list[int],
     short_window_default: float = 0.0
  ) -> pd.Series:
-    ma_df = pd.DataFrame()
-
-    for win in windows:
-        ma_df[f'{win} MA'] = ordered_data.rolling(window = win, min_periods = 1).mean()
-    
-    sp_ma_df = ma_df.apply(
-        spearmanr, 
-        axis = "columns", 
-        args = (windows,), 
-        result_type = "expand"
-    ).iloc[:, 0].mul(-1).fillna(short_window_default)
-
-    return sp_ma_df
\ No newline at end of file
+    return pd.Series(
+        ma_spearman_scores(moving_average_matrix(ordered_data.to_numpy(), windows), windows, short_window_default),
+        index = ordered_data.index
+    )
\ No newline at end of file
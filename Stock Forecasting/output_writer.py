@@ -0,0 +1,145 @@
+import os
+import threading
+from io import BytesIO
+from pathlib import Path
+from queue import Queue
+from uuid import uuid4
+
+import pandas as pd
+from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+
+class OutputWriter:
+    def __init__(self, background: bool = True, max_pending: int = 64) -> None:
+        self.background = background
+        self.generation = uuid4().hex[:8]
+        self._staged: list[tuple[Path, Path]] = []
+        self._removed: list[Path] = []
+        self._error: BaseException | None = None
+        self._queue: Queue[tuple[Path, bytes] | None] = Queue(maxsize = max_pending)
+        self._thread: threading.Thread | None = None
+
+        if background:
+            self._thread = threading.Thread(target = self._drain, name = "output-writer", daemon = True)
+            self._thread.start()
+
+    def __enter__(self) -> "OutputWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.discard()
+        finally:
+            self.close()
+
+    def _drain(self):
+        while (item := self._queue.get()) is not None:
+            temp_path, data = item
+
+            try:
+                if self._error is None:
+                    temp_path.write_bytes(data)
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+        self._queue.task_done()
+
+    def _raise_pending_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _temp_path(self, path: Path) -> Path:
+        path.parent.mkdir(exist_ok = True, parents = True)
+        return path.with_name(f".{path.name}.{self.generation}.tmp")
+
+    def stage(self, path: Path) -> Path:
+        temp_path = self._temp_path(path)
+        self._staged.append((temp_path, path))
+        return temp_path
+
+    def write_bytes(self, path: Path, data: bytes):
+        self._raise_pending_error()
+
+        if self.background:
+            self._queue.put((self.stage(path), data))
+        else:
+            temp_path = self._temp_path(path)
+            temp_path.write_bytes(data)
+            os.replace(temp_path, path)
+
+    def remove(self, path: Path):
+        if self.background:
+            self._removed.append(path)
+        else:
+            path.unlink(missing_ok = True)
+
+    def write_text(self, path: Path, text: str):
+        self.write_bytes(path, text.encode('utf-8'))
+
+    def savefig(self, path: Path, figure: Figure | None = None, **kwargs):
+        buffer = BytesIO()
+        (figure if figure is not None else plt.gcf()).savefig(
+            buffer, format = path.suffix.removeprefix("."), **kwargs
+        )
+        self.write_bytes(path, buffer.getvalue())
+
+    def write_parquet(self, path: Path, df: pd.DataFrame, **kwargs):
+        buffer = BytesIO()
+        df.to_parquet(buffer, **kwargs)
+        self.write_bytes(path, buffer.getvalue())
+
+    def remove_stale(self, root: Path, recursive: bool = True) -> int:
+        # Temporary files left behind by an interrupted run are never committed.
+        stale_paths = [
+            temp_path for temp_path in (root.rglob if recursive else root.glob)(".*.tmp")
+            if not temp_path.name.endswith(f".{self.generation}.tmp")
+        ]
+
+        for temp_path in stale_paths:
+            temp_path.unlink(missing_ok = True)
+
+        return len(stale_paths)
+
+    def flush(self):
+        if self.background:
+            self._queue.join()
+
+        self._raise_pending_error()
+
+    def commit(self):
+        self.flush()
+
+        # Each file is replaced atomically, but a crash part way through
+        # leaves a mix of old and new files until the next run completes.
+        for temp_path, path in self._staged:
+            os.replace(temp_path, path)
+
+        for path in self._removed:
+            path.unlink(missing_ok = True)
+
+        print(f"> Committed {len(self._staged)} output files in generation {self.generation}")
+        self._staged = []
+        self._removed = []
+
+    def discard(self):
+        if self.background:
+            self._queue.join()
+
+        for temp_path, _ in self._staged:
+            temp_path.unlink(missing_ok = True)
+
+        self._staged = []
+        self._removed = []
+        self._error = None
+
+    def close(self):
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
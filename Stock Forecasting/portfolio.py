@@ -0,0 +1,329 @@
+from argparse import ArgumentParser
+from math import sqrt
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from risk import (
+    TRADING_DAYS, rolling_volatility, rolling_sharpe, rolling_sortino, rolling_max_drawdown
+)
+from utility import Config, PerfPeriods
+
+def load_prices(
+    all_consolidated_path: Path,
+    symbols: list[str]
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    stock_dfs = pd.read_parquet(
+        all_consolidated_path,
+        columns = ['Date', 'Symbol', 'Prev Close', 'Close'],
+        filters = [('Symbol', 'in', symbols)]
+    )
+    stock_dfs['Returns'] = (stock_dfs['Close'] / stock_dfs['Prev Close']) - 1
+
+    closes, returns = (
+        stock_dfs.pivot(index = 'Date', columns = 'Symbol', values = col).sort_index().reindex(columns = symbols)
+        for col in ['Close', 'Returns']
+    )
+    return closes.ffill(), returns
+
+def load_transactions(path: Path) -> pd.DataFrame:
+    transactions = pd.read_csv(path)
+
+    if 'Date' in transactions.columns:
+        transactions['Date'] = pd.to_datetime(transactions['Date'])
+
+    return transactions
+
+def price_index(returns: pd.DataFrame) -> pd.DataFrame:
+    return (1 + returns.fillna(0)).cumprod().where(returns.notna().cummax())
+
+def trade_units(
+    transactions: pd.DataFrame,
+    closes: pd.DataFrame,
+    prices: pd.DataFrame
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    dates = closes.index
+    cols = closes.columns.get_indexer(transactions['Symbol'])
+
+    if 'Date' in transactions.columns:
+        trade_dates = transactions['Date'].to_numpy()
+        rows = dates.searchsorted(trade_dates, side = 'left')
+        is_outside = (trade_dates < dates[0].to_datetime64()) | (rows >= len(dates))
+
+        if is_outside.any():
+            raise ValueError(
+                f"Transactions dated outside {dates[0].date()} to {dates[-1].date()}:\n"
+                f"{transactions[is_outside].to_string()}"
+            )
+    else:
+        # Holdings without dates are held from the first session every symbol traded.
+        rows = np.full(len(transactions), prices.notna().all(axis = 1).to_numpy().argmax())
+
+    # Units of the split-adjusted price index that the traded shares were worth
+    # at that session's Close, so a later split or bonus scales the holding.
+    shares_per_unit = closes.to_numpy()[rows, cols] / prices.to_numpy()[rows, cols]
+
+    if np.isnan(shares_per_unit).any():
+        raise ValueError(
+            f"Transactions on sessions without a price:\n{transactions[np.isnan(shares_per_unit)].to_string()}"
+        )
+
+    return rows, cols, transactions['Quantity'].to_numpy(dtype = np.float64) * shares_per_unit
+
+def holding_units(
+    transactions: pd.DataFrame,
+    closes: pd.DataFrame,
+    prices: pd.DataFrame
+) -> pd.DataFrame:
+    rows, cols, units = trade_units(transactions, closes, prices)
+
+    held = np.zeros(closes.shape)
+    np.add.at(held, (rows, cols), units)
+
+    return pd.DataFrame(np.cumsum(held, axis = 0), index = closes.index, columns = closes.columns)
+
+def cost_basis(
+    transactions: pd.DataFrame,
+    closes: pd.DataFrame,
+    prices: pd.DataFrame
+) -> pd.DataFrame:
+    rows, cols, units = trade_units(transactions, closes, prices)
+    quantities = transactions['Quantity'].to_numpy(dtype = np.float64)
+    trade_prices = (
+        transactions['Price'].to_numpy(dtype = np.float64)
+        if 'Price' in transactions.columns else closes.to_numpy()[rows, cols]
+    )
+
+    held = np.zeros(closes.shape[1])
+    cost = np.zeros(closes.shape[1])
+    realised = np.zeros(closes.shape[1])
+
+    # Sales release the average cost of the units sold.
+    for i in np.argsort(rows, kind = 'stable'):
+        col = cols[i]
+
+        if units[i] >= 0:
+            cost[col] += quantities[i] * trade_prices[i]
+        else:
+            sold_cost = cost[col] * min(-units[i] / held[col], 1) if held[col] > 0 else 0.0
+            realised[col] += -quantities[i] * trade_prices[i] - sold_cost
+            cost[col] -= sold_cost
+
+        held[col] += units[i]
+
+    return pd.DataFrame({'Cost': cost, 'Realised Gain': realised}, index = closes.columns)
+
+class Portfolio:
+    def __init__(self, transactions: pd.DataFrame, closes: pd.DataFrame, returns: pd.DataFrame) -> None:
+        # Transactions after the last session are held back until data covers them.
+        is_pending = (
+            transactions['Date'] > closes.index[-1]
+            if 'Date' in transactions.columns else pd.Series(False, index = transactions.index)
+        )
+        self.pending = transactions[is_pending]
+        transactions = transactions[~is_pending]
+
+        self.returns = returns
+        self.prices = price_index(returns)
+        self.units = holding_units(transactions, closes, self.prices)
+        self.costs = cost_basis(transactions, closes, self.prices)
+        self.values = (self.units * self.prices).fillna(0)
+
+        prev_values = self.values.shift(1)
+        prev_total = prev_values.sum(axis = 1)
+        self.gains = (self.units.shift(1) * self.prices.diff()).fillna(0)
+        self.contributions = self.gains.div(prev_total.where(prev_total > 0), axis = 0)
+
+        is_invested = (self.values.sum(axis = 1) > 0).cummax().to_numpy()
+        self.daily_returns = self.contributions.sum(axis = 1)[is_invested]
+        self.nav = (1 + self.daily_returns).cumprod() * 100
+
+    @property
+    def weights(self) -> pd.DataFrame:
+        return self.values.div(self.values.sum(axis = 1), axis = 0)
+
+    def drawdown(self) -> pd.Series:
+        return ((self.nav / self.nav.cummax()) - 1) * 100
+
+    def rolling_risk(self, window: int) -> pd.DataFrame:
+        return pd.DataFrame({
+            f'% Rolling Volatility {window} days': rolling_volatility(self.daily_returns, window) * 100,
+            f'Rolling Sharpe {window} days': rolling_sharpe(self.daily_returns, window),
+            f'Rolling Sortino {window} days': rolling_sortino(self.daily_returns, window),
+            f'% Rolling Max Drawdown {window} days': rolling_max_drawdown(self.nav.to_numpy(), window)
+        }, index = self.nav.index)
+
+    def holdings_report(self) -> pd.DataFrame:
+        return pd.DataFrame({
+            'Weight': self.weights.iloc[-1],
+            'Value': self.values.iloc[-1],
+            'Cost': self.costs['Cost'],
+            'Unrealised Gain': self.values.iloc[-1] - self.costs['Cost'],
+            'Realised Gain': self.costs['Realised Gain'],
+            'Gain': self.gains.sum(),
+            'Contribution': self.contributions.sum()
+        })
+
+    def summary(self) -> pd.Series:
+        drawdown = self.drawdown()
+        return pd.Series({
+            'Start Date': self.nav.index[0].date(),
+            'NAV': self.nav.iloc[-1],
+            'Net Return': (self.nav.iloc[-1] / 100) - 1,
+            'Annualized Volatility': self.daily_returns.std() * sqrt(TRADING_DAYS),
+            'Sharpe Ratio': self.daily_returns.mean() / self.daily_returns.std() * sqrt(TRADING_DAYS),
+            'Max Drawdown': drawdown.min() / 100,
+            'Current Drawdown': drawdown.iloc[-1] / 100
+        })
+
+def expected_returns_and_covariance(returns: pd.DataFrame, window: int) -> tuple[pd.Series, pd.DataFrame]:
+    window_returns = returns.iloc[-window:].dropna()
+    return window_returns.mean() * TRADING_DAYS, window_returns.cov() * TRADING_DAYS
+
+def _budget_solution(
+    expected_returns: np.ndarray,
+    covariance: np.ndarray,
+    risk_aversion: float,
+    free: np.ndarray
+) -> tuple[np.ndarray, float]:
+    cov = covariance[np.ix_(free, free)]
+    inv_ones = np.linalg.solve(cov, np.ones(free.sum()))
+    inv_returns = np.linalg.solve(cov, expected_returns[free])
+    shift = (inv_returns.sum() - risk_aversion) / inv_ones.sum()
+
+    weights = np.zeros(len(expected_returns))
+    weights[free] = (inv_returns - shift * inv_ones) / risk_aversion
+    return weights, shift
+
+def _budget_weights(
+    expected_returns: np.ndarray,
+    covariance: np.ndarray,
+    risk_aversion: float,
+    long_only: bool,
+    tolerance: float = 1e-10
+) -> np.ndarray:
+    num_assets = len(expected_returns)
+    free = np.ones(num_assets, dtype = bool)
+    weights, _ = _budget_solution(expected_returns, covariance, risk_aversion, free)
+
+    if not long_only or weights.min() >= 0:
+        return weights
+
+    # Primal active set: from the equal weight portfolio, step towards the
+    # optimum over the free assets and hold an asset at zero when its weight
+    # would turn negative. An asset held at zero is freed again while its KKT
+    # multiplier is negative, i.e. buying it would still improve the objective.
+    weights = np.full(num_assets, 1 / num_assets)
+
+    while True:
+        target, shift = _budget_solution(expected_returns, covariance, risk_aversion, free)
+        step = target - weights
+
+        if np.abs(step).max() > tolerance:
+            is_blocking = free & (step < 0)
+            step_sizes = np.full(num_assets, np.inf)
+            step_sizes[is_blocking] = -weights[is_blocking] / step[is_blocking]
+            blocking = step_sizes.argmin()
+
+            if step_sizes[blocking] >= 1:
+                weights = target
+            else:
+                weights = weights + step_sizes[blocking] * step
+                weights[blocking] = 0
+                free[blocking] = False
+
+            continue
+
+        multipliers = risk_aversion * (covariance @ weights) - expected_returns + shift
+        multipliers[free] = 0
+
+        if multipliers.min() >= -tolerance:
+            return weights
+
+        free[multipliers.argmin()] = True
+
+def min_variance_weights(covariance: pd.DataFrame, long_only: bool = True) -> pd.Series:
+    return pd.Series(
+        _budget_weights(np.zeros(len(covariance)), covariance.to_numpy(), 1.0, long_only),
+        index = covariance.index
+    )
+
+def mean_variance_weights(
+    expected_returns: pd.Series,
+    covariance: pd.DataFrame,
+    risk_aversion: float,
+    long_only: bool = True
+) -> pd.Series:
+    return pd.Series(
+        _budget_weights(expected_returns.to_numpy(), covariance.to_numpy(), risk_aversion, long_only),
+        index = covariance.index
+    )
+
+def random_weights(num_candidates: int, num_assets: int, random_state: int | None = None) -> np.ndarray:
+    return np.random.default_rng(random_state).dirichlet(np.ones(num_assets), num_candidates)
+
+def evaluate_weights(
+    weights: np.ndarray,
+    expected_returns: pd.Series,
+    covariance: pd.DataFrame
+) -> pd.DataFrame:
+    weights = np.atleast_2d(weights)
+    portfolio_returns = weights @ expected_returns.to_numpy()
+    volatility = np.sqrt(np.einsum('ij,jk,ik->i', weights, covariance.to_numpy(), weights))
+
+    return pd.DataFrame({
+        'Expected Return': portfolio_returns,
+        'Volatility': volatility,
+        'Sharpe Ratio': portfolio_returns / volatility
+    })
+
+if __name__ == "__main__":
+    parser = ArgumentParser(prog = "Portfolio Analytics")
+    parser.add_argument("transactions", type = Path)
+    parser.add_argument("-w", "--window", type = int, default = PerfPeriods.LONG)
+    parser.add_argument("-r", "--risk-aversion", type = float, default = 5)
+    parser.add_argument("-n", "--candidates", type = int, default = 10000)
+    parser.add_argument("-o", "--out", type = Path, default = None)
+    args = parser.parse_args()
+
+    CONFIG = Config(Path("config.json"))
+
+    transactions = load_transactions(args.transactions)
+    symbols = sorted(transactions['Symbol'].unique())
+    closes, returns = load_prices(CONFIG.NSE_DATA_DIR.joinpath("all_consolidated.parquet"), symbols)
+
+    portfolio = Portfolio(transactions, closes, returns)
+    if not portfolio.pending.empty:
+        print(f"> Deferred {len(portfolio.pending)} transactions dated after {closes.index[-1].date()}.")
+    print(f"> Portfolio of {len(symbols)} symbols over {len(portfolio.nav)} sessions:")
+    print(portfolio.summary().to_string())
+    print(portfolio.holdings_report().round(4).to_string())
+
+    expected_returns, covariance = expected_returns_and_covariance(returns, args.window)
+    optimised = pd.DataFrame({
+        'Current': portfolio.weights.iloc[-1],
+        'Min Variance': min_variance_weights(covariance),
+        'Mean Variance': mean_variance_weights(expected_returns, covariance, args.risk_aversion)
+    })
+    print(f"> Weights from last {args.window} days of returns:")
+    print(optimised.round(4).to_string())
+    print(evaluate_weights(
+        optimised.T.to_numpy(), expected_returns, covariance
+    ).set_index(optimised.columns).round(4).to_string())
+
+    start_time = perf_counter()
+    candidates = random_weights(args.candidates, len(symbols), CONFIG.RANDOM_STATE)
+    evaluated = evaluate_weights(candidates, expected_returns, covariance)
+    best = evaluated['Sharpe Ratio'].idxmax()
+    print(f"> Evaluated {args.candidates} candidate weightings in {(perf_counter() - start_time) * 1000:.1f}ms.")
+    print(pd.Series(candidates[best], index = symbols).round(4).to_string())
+    print(evaluated.loc[best].round(4).to_string())
+
+    if args.out is not None:
+        pd.concat([
+            portfolio.nav.rename('NAV'),
+            portfolio.drawdown().rename('% Drawdown'),
+            portfolio.rolling_risk(args.window)
+        ], axis = 1).to_csv(args.out)
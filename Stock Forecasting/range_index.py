@@ -0,0 +1,171 @@
+import numpy as np
+
+class PrefixSum:
+    def __init__(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype = np.float64)
+        is_valid = ~np.isnan(values)
+
+        self._sums = np.concatenate(([0.0], np.cumsum(np.where(is_valid, values, 0.0))))
+        self._counts = np.concatenate(([0], np.cumsum(is_valid)))
+
+    def sum(self, start: int, end: int) -> float:
+        return self._sums[end] - self._sums[start]
+
+    def count(self, start: int, end: int) -> int:
+        return self._counts[end] - self._counts[start]
+
+    def mean(self, start: int, end: int) -> float:
+        count = self.count(start, end)
+        return self.sum(start, end) / count if count else np.nan
+
+class PrefixMoments:
+    def __init__(self, x: np.ndarray, y: np.ndarray | None = None) -> None:
+        x = np.asarray(x, dtype = np.float64)
+        y = x if y is None else np.asarray(y, dtype = np.float64)
+        is_valid = ~(np.isnan(x) | np.isnan(y))
+
+        # Sums are taken about the overall means, so the sums of products stay
+        # close to the variance and subtracting them does not cancel it away.
+        x_deviations = np.where(is_valid, x - (x[is_valid].mean() if is_valid.any() else 0.0), np.nan)
+        y_deviations = np.where(is_valid, y - (y[is_valid].mean() if is_valid.any() else 0.0), np.nan)
+
+        self._x_sums = PrefixSum(x_deviations)
+        self._y_sums = PrefixSum(y_deviations)
+        self._product_sums = PrefixSum(x_deviations * y_deviations)
+
+    def count(self, start: int, end: int) -> int:
+        return self._x_sums.count(start, end)
+
+    def covariance(self, start: int, end: int, ddof: int = 1) -> float:
+        count = self.count(start, end)
+
+        if count <= ddof:
+            return np.nan
+
+        return (
+            self._product_sums.sum(start, end) -
+            self._x_sums.sum(start, end) * self._y_sums.sum(start, end) / count
+        ) / (count - ddof)
+
+    def variance(self, start: int, end: int, ddof: int = 1) -> float:
+        return max(self.covariance(start, end, ddof), 0.0)
+
+class SparseTable:
+    def __init__(self, values: np.ndarray, func: np.ufunc) -> None:
+        self._func = func
+        self._levels = [np.asarray(values, dtype = np.float64)]
+        width = 1
+
+        while 2 * width <= self._levels[0].size:
+            prev = self._levels[-1]
+            self._levels.append(func(prev[:-width], prev[width:]))
+            width *= 2
+
+    def query(self, start: int, end: int) -> float:
+        level = int(end - start).bit_length() - 1
+        return self._func(
+            self._levels[level][start],
+            self._levels[level][end - (1 << level)]
+        )
+
+class DrawdownIndex:
+    def __init__(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype = np.float64)
+        self._highs = [values]
+        self._lows = [values]
+        self._drawdowns = [np.zeros_like(values)]
+
+        # Level k holds the aligned blocks of 2 ** k values, each merged from
+        # the two blocks below it.
+        while self._highs[-1].size >= 2:
+            size = self._highs[-1].size // 2 * 2
+            highs, lows, drawdowns = self._highs[-1][:size], self._lows[-1][:size], self._drawdowns[-1][:size]
+
+            self._highs.append(np.fmax(highs[0::2], highs[1::2]))
+            self._lows.append(np.fmin(lows[0::2], lows[1::2]))
+            self._drawdowns.append(np.fmin(
+                np.fmin(drawdowns[0::2], drawdowns[1::2]),
+                (lows[1::2] / highs[0::2]) - 1
+            ))
+
+    def query(self, start: int, end: int) -> float:
+        start, end = int(start), int(end)
+        high = np.nan
+        drawdown = 0.0
+
+        while start < end:
+            # The largest aligned block starting here that fits in the range.
+            level = (end - start).bit_length() - 1
+
+            if start:
+                level = min(level, (start & -start).bit_length() - 1)
+
+            block = start >> level
+
+            drawdown = np.fmin(
+                np.fmin(drawdown, self._drawdowns[level][block]),
+                (self._lows[level][block] / high) - 1
+            )
+            high = np.fmax(high, self._highs[level][block])
+            start += 1 << level
+
+        return drawdown
+
+class WaveletMatrix:
+    def __init__(self, values: np.ndarray) -> None:
+        self._uniques, codes = np.unique(np.asarray(values), return_inverse = True)
+        self._num_bits = max(1, int(self._uniques.size - 1).bit_length())
+        self._zero_counts = []
+        self._num_zeros = []
+
+        for bit in reversed(range(self._num_bits)):
+            is_one = ((codes >> bit) & 1).astype(bool)
+            self._zero_counts.append(np.concatenate(([0], np.cumsum(~is_one))))
+            self._num_zeros.append(self._zero_counts[-1][-1])
+            codes = np.concatenate((codes[~is_one], codes[is_one]))
+
+    def kth_smallest(self, start: int, end: int, k: int):
+        code = 0
+
+        for level, bit in enumerate(reversed(range(self._num_bits))):
+            zeros_before_start = self._zero_counts[level][start]
+            zeros_before_end = self._zero_counts[level][end]
+            zeros = zeros_before_end - zeros_before_start
+
+            if k < zeros:
+                start, end = zeros_before_start, zeros_before_end
+            else:
+                k -= zeros
+                code |= 1 << bit
+                start = self._num_zeros[level] + start - zeros_before_start
+                end = self._num_zeros[level] + end - zeros_before_end
+
+        return self._uniques[code]
+
+    def median(self, start: int, end: int) -> float:
+        size = end - start
+        upper = self.kth_smallest(start, end, size // 2)
+
+        if size % 2:
+            return upper
+        return (self.kth_smallest(start, end, size // 2 - 1) + upper) / 2
+
+class FenwickTree:
+    def __init__(self, size: int) -> None:
+        self._tree = [0] * (size + 1)
+
+    def add(self, index: int, delta: int = 1):
+        index += 1
+
+        while index < len(self._tree):
+            self._tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, end: int) -> int:
+        total = 0
+
+        while end > 0:
+            total += self._tree[end]
+            end -= end & -end
+
+        return total
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+from utility import PerfPeriods
+
+RS_HORIZONS = {
+    PerfPeriods.SHORT: 1,
+    PerfPeriods.MEDIUM: 1,
+    PerfPeriods.LONG: 2
+}
+
+def log_growth(returns: pd.DataFrame) -> pd.DataFrame:
+    growth = np.log1p(returns).fillna(0).cumsum()
+    return growth.where(returns.notna().cummax())
+
+def rs_scores(returns: pd.DataFrame, horizons: dict[int, float] = RS_HORIZONS) -> pd.DataFrame:
+    growth = log_growth(returns)
+    weighted_ranks = [
+        (growth - growth.shift(horizon)).rank(axis = 1, pct = True) * weight
+        for horizon, weight in horizons.items()
+    ]
+    return sum(weighted_ranks) / sum(horizons.values())
+
+def rs_ranks(scores: pd.DataFrame) -> pd.DataFrame:
+    return scores.rank(axis = 1, pct = True).mul(100)
+
+def rs_lines(returns: pd.DataFrame, benchmark_symbol: str) -> pd.DataFrame:
+    growth = log_growth(returns)
+    relative = growth.sub(growth[benchmark_symbol], axis = 0)
+    return np.exp(relative - relative.bfill().iloc[0]) * 100
+
+def rank_movers(ranks: pd.DataFrame, lookback: int) -> pd.DataFrame:
+    movers = pd.DataFrame({
+        'RS Rank': ranks.iloc[-1],
+        'Previous RS Rank': ranks.iloc[-1 - lookback]
+    }).dropna()
+    movers['Change'] = movers['RS Rank'] - movers['Previous RS Rank']
+    return movers.sort_values('Change', ascending = False)
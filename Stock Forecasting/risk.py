@@ -0,0 +1,71 @@
+from math import sqrt
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+
+def rolling_volatility(returns: pd.Series, window: int) -> pd.Series:
+    return returns.rolling(window = window, min_periods = 2).std() * sqrt(TRADING_DAYS)
+
+def rolling_downside_deviation(returns: pd.Series, window: int) -> pd.Series:
+    return np.sqrt(
+        returns.clip(upper = 0).pow(2).rolling(window = window, min_periods = 2).mean()
+    ) * sqrt(TRADING_DAYS)
+
+def rolling_sharpe(returns: pd.Series, window: int) -> pd.Series:
+    return (
+        returns.rolling(window = window, min_periods = 2).mean() * TRADING_DAYS
+    ) / rolling_volatility(returns, window)
+
+def rolling_sortino(returns: pd.Series, window: int) -> pd.Series:
+    return (
+        returns.rolling(window = window, min_periods = 2).mean() * TRADING_DAYS
+    ) / rolling_downside_deviation(returns, window)
+
+def rolling_beta(returns: pd.Series, benchmark_returns: pd.Series, window: int) -> pd.Series:
+    return returns.rolling(window = window, min_periods = 2).cov(
+        benchmark_returns
+    ) / benchmark_returns.rolling(window = window, min_periods = 2).var()
+
+def _combine_drawdowns(
+    earlier: tuple[float, float, float],
+    later: tuple[float, float, float]
+) -> tuple[float, float, float]:
+    return (
+        max(earlier[0], later[0]),
+        min(earlier[1], later[1]),
+        min(earlier[2], later[2], (later[1] / earlier[0]) - 1)
+    )
+
+def rolling_max_drawdown(prices: np.ndarray, window: int) -> np.ndarray:
+    front: list[tuple[tuple[float, float, float], tuple[float, float, float]]] = []
+    back: list[tuple[float, float, float]] = []
+    back_agg = None
+    max_drawdowns = np.empty(len(prices), dtype = np.float64)
+
+    for i, price in enumerate(prices):
+        item = (price, price, 0.0)
+        back.append(item)
+        back_agg = item if back_agg is None else _combine_drawdowns(back_agg, item)
+
+        if len(front) + len(back) > window:
+            if not front:
+                suffix_agg = None
+
+                while back:
+                    item = back.pop()
+                    suffix_agg = item if suffix_agg is None else _combine_drawdowns(item, suffix_agg)
+                    front.append((item, suffix_agg))
+
+                back_agg = None
+            front.pop()
+
+        if not front:
+            max_drawdowns[i] = back_agg[2]
+        elif back_agg is None:
+            max_drawdowns[i] = front[-1][1][2]
+        else:
+            max_drawdowns[i] = _combine_drawdowns(front[-1][1], back_agg)[2]
+
+    return max_drawdowns * 100
@@ -0,0 +1,58 @@
+from collections import deque
+from math import isnan
+
+import numpy as np
+import pandas as pd
+from pandas.api.indexers import BaseIndexer
+
+def window_starts(num_values: int, window: int) -> np.ndarray:
+    return np.maximum(np.arange(num_values) - window + 1, 0)
+
+def calendar_window_starts(dates: pd.Series, window: pd.Timedelta) -> np.ndarray:
+    dates = dates.to_numpy(dtype = 'datetime64[ns]')
+    return np.searchsorted(dates, dates - np.timedelta64(window) + np.timedelta64(1, 'ns'), side = 'left')
+
+def _as_starts(num_values: int, window: int | np.ndarray) -> np.ndarray:
+    return window_starts(num_values, window) if np.isscalar(window) else np.asarray(window)
+
+def _rolling_extreme(values: np.ndarray, window: int | np.ndarray, is_better) -> np.ndarray:
+    values = np.asarray(values, dtype = np.float64)
+    starts = _as_starts(values.size, window).tolist()
+    result = np.full(values.size, np.nan)
+    candidates = deque()
+    values = values.tolist()
+
+    for i, value in enumerate(values):
+        if not isnan(value):
+            while candidates and not is_better(values[candidates[-1]], value):
+                candidates.pop()
+
+            candidates.append(i)
+
+        while candidates and candidates[0] < starts[i]:
+            candidates.popleft()
+
+        if candidates:
+            result[i] = values[candidates[0]]
+
+    return result
+
+def rolling_max(values: np.ndarray, window: int | np.ndarray) -> np.ndarray:
+    return _rolling_extreme(values, window, lambda kept, new: kept > new)
+
+def rolling_min(values: np.ndarray, window: int | np.ndarray) -> np.ndarray:
+    return _rolling_extreme(values, window, lambda kept, new: kept < new)
+
+class _StartIndexer(BaseIndexer):
+    def get_window_bounds(self, num_values = 0, min_periods = None, center = None, closed = None, step = None):
+        return self.starts, np.arange(1, num_values + 1, dtype = np.int64)
+
+def rolling_quantiles(
+    values: np.ndarray,
+    window: int | np.ndarray,
+    quantiles: list[float],
+    min_periods: int = 1
+) -> np.ndarray:
+    starts = _as_starts(len(values), window).astype(np.int64)
+    windows = pd.Series(values, dtype = np.float64).rolling(_StartIndexer(starts = starts), min_periods = min_periods)
+    return np.array([windows.quantile(quantile).to_numpy() for quantile in quantiles])
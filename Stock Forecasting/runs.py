@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+@dataclass
+class Runs:
+    starts: np.ndarray
+    lengths: np.ndarray
+    values: np.ndarray
+    run_ids: np.ndarray
+    positions: np.ndarray
+
+    def __len__(self) -> int:
+        return self.starts.size
+
+    @property
+    def ends(self) -> np.ndarray:
+        return self.starts + self.lengths - 1
+
+    def current(self) -> int:
+        return len(self) - 1
+
+    def continuation_prob(self, run: int | None = None) -> float:
+        run = self.current() if run is None else run
+        same_value = self.lengths[self.values == self.values[run]]
+        at_least = (same_value >= self.lengths[run]).sum()
+        return (same_value > self.lengths[run]).sum() / at_least if at_least else 0.0
+
+    def longest(self, value = None) -> int:
+        value = self.values[self.current()] if value is None else value
+        candidates = np.flatnonzero(self.values == value)
+        return candidates[
+            np.flatnonzero(self.lengths[candidates] == self.lengths[candidates].max())[-1]
+        ]
+
+    def span(self, run: int, dates: pd.Series) -> tuple[int, pd.Timestamp, pd.Timestamp]:
+        return (
+            self.lengths[run],
+            dates.iloc[self.starts[run]],
+            dates.iloc[self.ends[run]]
+        )
+
+def run_length_encode(data: pd.Series | np.ndarray) -> Runs:
+    values = np.asarray(data)
+    n = values.size
+
+    if n == 0:
+        empty = np.empty(0, dtype = np.int64)
+        return Runs(empty, empty, values, empty, empty)
+
+    is_start = np.empty(n, dtype = bool)
+    is_start[0] = True
+    np.not_equal(values[1:], values[:-1], out = is_start[1:])
+
+    starts = np.flatnonzero(is_start)
+    lengths = np.diff(np.append(starts, n))
+    run_ids = np.cumsum(is_start) - 1
+
+    return Runs(
+        starts,
+        lengths,
+        values[starts],
+        run_ids,
+        np.arange(n) - starts[run_ids] + 1
+    )
@@ -0,0 +1,103 @@
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter
+
+import pandas as pd
+
+from output_writer import OutputWriter
+from utility import Config
+
+LATEST_FEATURES_FILE = "latest_features.parquet"
+DEFAULT_COLUMNS = [
+    'Date',
+    'Close',
+    '% Change from 50 MA',
+    '% Change from 200 MA',
+    'Is Green',
+    'Streak',
+    '% Down from ATH',
+    '% Rolling Returns 200 days'
+]
+
+def sort_key(key: str) -> tuple[str, bool]:
+    for suffix, ascending in ((" desc", False), (" asc", True)):
+        if key.lower().endswith(suffix):
+            return key[:-len(suffix)], ascending
+
+    return key, True
+
+class Screener:
+    def __init__(self, table: pd.DataFrame | None = None) -> None:
+        self.table = table if table is not None else pd.DataFrame(index = pd.Index([], name = 'Symbol'))
+        self._pending: list[pd.DataFrame] = []
+
+    @classmethod
+    def load(cls, path: Path) -> "Screener":
+        return cls(pd.read_parquet(path))
+
+    def update(self, stock_df: pd.DataFrame):
+        self._pending.append(stock_df.iloc[[-1]].set_index('Symbol'))
+
+    def _merge_pending(self):
+        if not self._pending:
+            return
+
+        latest = pd.concat(self._pending)
+        self._pending = []
+
+        if len(self.table):
+            latest = pd.concat([self.table.drop(latest.index, errors = 'ignore'), latest])
+
+        self.table = latest.sort_index()
+
+    def save(self, path: Path, writer: OutputWriter):
+        self._merge_pending()
+        writer.write_parquet(path, self.table)
+
+    def screen(
+        self,
+        where: str | None = None,
+        sort_by: list[str] | None = None,
+        columns: list[str] | None = None,
+        limit: int | None = None
+    ) -> pd.DataFrame:
+        self._merge_pending()
+        result = self.table if where is None else self.table.query(where)
+
+        if sort_by:
+            keys = [sort_key(key) for key in sort_by]
+            result = result.sort_values(
+                [column for column, _ in keys],
+                ascending = [ascending for _, ascending in keys]
+            )
+
+        if columns is not None:
+            result = result[columns]
+
+        return result if limit is None else result.head(limit)
+
+if __name__ == "__main__":
+    parser = ArgumentParser(prog = "Stock Screener")
+    parser.add_argument("where", nargs = "?", default = None)
+    parser.add_argument("-s", "--sort", nargs = "+", default = [])
+    parser.add_argument("-c", "--columns", nargs = "+", default = None)
+    parser.add_argument("-t", "--top", type = int, default = None)
+    parser.add_argument("-l", "--list-columns", action = "store_true")
+    args = parser.parse_args()
+
+    CONFIG = Config(Path("config.json"))
+    screener = Screener.load(CONFIG.NSE_DATA_DIR.joinpath(LATEST_FEATURES_FILE))
+
+    if args.list_columns:
+        print("\n".join(screener.table.columns))
+        parser.exit()
+
+    columns = args.columns
+    if columns is None:
+        columns = [col for col in DEFAULT_COLUMNS if col in screener.table.columns]
+        columns += [col for col, _ in map(sort_key, args.sort) if col not in columns]
+
+    start_time = perf_counter()
+    result = screener.screen(args.where, args.sort, columns, args.top)
+    print(f"> {len(result)} of {len(screener.table)} symbols matched in {(perf_counter() - start_time) * 1000:.1f}ms.")
+    print(result.to_string())
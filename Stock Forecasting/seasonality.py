@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+
+UNIVERSE = "Universe"
+BUCKETS = {
+    'Weekday': ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
+    'Month': [
+        "January", "February", "March", "April", "May", "June",
+        "July", "August", "September", "October", "November", "December"
+    ],
+    'Turn of month': ["Last day", "First day", "Second day", "Third day", "Rest of month"]
+}
+STAT_COLUMNS = ['Mean', 'Median', 'Hit Rate', 'T-Stat', 'Days']
+
+def universe_returns(returns: pd.DataFrame) -> pd.DataFrame:
+    return pd.DataFrame({
+        'Symbol': UNIVERSE,
+        'Date': returns.index,
+        'Return': returns.mean(axis = 1).to_numpy()
+    })
+
+def _turn_of_month(returns: pd.DataFrame, min_gap_sessions: int = 3) -> np.ndarray:
+    symbols = returns['Symbol']
+    month = returns['Date'].dt.to_period('M')
+    days = returns['Date'].to_numpy(dtype = 'datetime64[D]')
+    month_starts = month.dt.start_time.to_numpy(dtype = 'datetime64[D]')
+    month_ends = month.dt.end_time.to_numpy(dtype = 'datetime64[D]')
+    is_first = (symbols != symbols.shift(1)).to_numpy()
+    is_last = (symbols != symbols.shift(-1)).to_numpy()
+
+    # A month is only labelled when its history is complete: the first loaded
+    # row opens it, the last loaded row closes it (no weekday is left in it)
+    # and no gap of missing sessions longer than a holiday break falls in it.
+    missing_before = np.busday_count(np.where(is_first, month_starts, np.roll(days, 1) + 1), days)
+    is_gap = ~is_first & (missing_before >= min_gap_sessions)
+    is_broken = (
+        (is_first & (missing_before > 0)) |
+        (is_last & (np.busday_count(days + 1, month_ends + 1) > 0)) |
+        is_gap |
+        np.append(is_gap[1:], False)
+    )
+    groups = returns.groupby([symbols, month])
+    is_covered = ~pd.Series(is_broken).groupby([symbols, month]).transform('any').to_numpy()
+
+    session = groups.cumcount()
+    sessions_left = groups['Date'].transform('size') - session - 1
+
+    codes = np.select(
+        [sessions_left == 0, session == 0, session == 1, session == 2],
+        [0, 1, 2, 3],
+        4
+    ).astype(np.int8)
+    codes[~is_covered] = -1
+    return codes
+
+# Buckets are int8 codes into BUCKETS, with -1 for a row left unlabelled.
+def calendar_buckets(returns: pd.DataFrame) -> pd.DataFrame:
+    returns = returns.sort_values(['Symbol', 'Date'], kind = 'stable', ignore_index = True)
+    dates = returns['Date']
+
+    return returns.assign(**{
+        'Weekday': dates.dt.dayofweek.to_numpy(dtype = np.int8),
+        'Month': (dates.dt.month - 1).to_numpy(dtype = np.int8),
+        'Turn of month': _turn_of_month(returns)
+    })
+
+def seasonality_stats(returns: pd.DataFrame) -> pd.DataFrame:
+    labelled = calendar_buckets(returns[returns['Return'].notna()])
+    labelled['Symbol'] = labelled['Symbol'].astype('category')
+    labelled['Return Squared'] = labelled['Return'] ** 2
+    labelled['Is Up'] = labelled['Return'] > 0
+    stats = []
+
+    for bucket_type, names in BUCKETS.items():
+        is_labelled = labelled[bucket_type] >= 0
+        bucket_stats = labelled[is_labelled].groupby(['Symbol', bucket_type], observed = True).agg(
+            Days = ('Return', 'count'),
+            Sum = ('Return', 'sum'),
+            **{
+                'Sum of Squares': ('Return Squared', 'sum'),
+                'Up Days': ('Is Up', 'sum')
+            },
+            Median = ('Return', 'median')
+        ).reset_index()
+
+        bucket_stats.insert(1, 'Bucket Type', bucket_type)
+        bucket_stats.insert(2, 'Bucket', np.array(names)[bucket_stats.pop(bucket_type)])
+        stats.append(bucket_stats)
+
+    # Counts, sums and sums of squares give every statistic but the median.
+    stats = pd.concat(stats, ignore_index = True)
+    stats['Symbol'] = stats['Symbol'].astype(str)
+    stats['Mean'] = stats['Sum'] / stats['Days']
+    stats['Hit Rate'] = stats['Up Days'] / stats['Days']
+    variance = (stats['Sum of Squares'] - stats['Sum'] * stats['Mean']) / (stats['Days'] - 1)
+    stats['T-Stat'] = stats['Mean'] / np.sqrt(variance.clip(lower = 0) / stats['Days'])
+
+    return stats.sort_values('Symbol', kind = 'stable', ignore_index = True)[
+        ['Symbol', 'Bucket Type', 'Bucket'] + STAT_COLUMNS
+    ]
+
+def bucket_table(stats: pd.DataFrame, symbol: str, bucket_type: str) -> pd.DataFrame:
+    return stats[(stats['Symbol'] == symbol) & (stats['Bucket Type'] == bucket_type)].set_index('Bucket')[STAT_COLUMNS]
+
+def rank_symbols(stats: pd.DataFrame, bucket_type: str, bucket: str) -> pd.DataFrame:
+    in_bucket = stats[
+        (stats['Symbol'] != UNIVERSE) &
+        (stats['Bucket Type'] == bucket_type) &
+        (stats['Bucket'] == bucket)
+    ]
+    return in_bucket.sort_values('T-Stat', ascending = False, ignore_index = True)
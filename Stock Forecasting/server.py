@@ -0,0 +1,302 @@
+import json
+from argparse import ArgumentParser
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+from threading import Lock
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from data_process import FEATURES, StockData
+from output_writer import OutputWriter
+from store import frame_bytes
+from utility import Config, PerfPeriods
+
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+FEATURE_PARAMS = {
+    'performance_periods': list(PerfPeriods),
+    'ma_periods': [PerfPeriods.SHORT, PerfPeriods.MEDIUM, PerfPeriods.LONG],
+    'sp_ma_periods': [list(range(1, 16)), list(range(5, 101, 5))],
+    'projection_horizons': [PerfPeriods.SHORT, PerfPeriods.MEDIUM, PerfPeriods.LONG],
+    'risk_windows': [PerfPeriods.MEDIUM, PerfPeriods.LONG]
+}
+
+class QueryError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+@dataclass
+class CacheEntry:
+    version: tuple[int, ...]
+    stock_data: StockData | None = None
+    outputs: set[str] = field(default_factory = set)
+    nbytes: int = 0
+    lock: Lock = field(default_factory = Lock)
+
+def held_bytes(obj, seen: set[int] | None = None) -> int:
+    seen = set() if seen is None else seen
+
+    if id(obj) in seen or isinstance(obj, OutputWriter):
+        return 0
+
+    seen.add(id(obj))
+
+    if isinstance(obj, pd.DataFrame):
+        return frame_bytes(obj)
+    elif isinstance(obj, (pd.Series, pd.Index)):
+        return int(obj.memory_usage(deep = True))
+    elif isinstance(obj, np.ndarray):
+        # Views of frame columns are counted again, so the estimate errs high.
+        return obj.nbytes
+    elif isinstance(obj, dict):
+        return sum(held_bytes(value, seen) for value in obj.values())
+    elif isinstance(obj, (list, tuple, set)):
+        return sum(held_bytes(value, seen) for value in obj)
+    elif hasattr(obj, '__dict__'):
+        return held_bytes(vars(obj), seen)
+
+    return 0
+
+def stock_data_bytes(stock_data: StockData) -> int:
+    return held_bytes(stock_data)
+
+class SymbolCache:
+    def __init__(self, config: Config, memory_budget: int, random_state: int | None = None) -> None:
+        self.config = config
+        self.memory_budget = memory_budget
+        self.params = {**FEATURE_PARAMS, 'random_state': random_state}
+        # Every symbol is loaded against the benchmark, so its beta is always available.
+        self.all_outputs = [
+            output
+            for feature in FEATURES.features.values() if not feature.intermediate
+            for output in feature.output_names({**self.params, 'has_benchmark': True})
+        ]
+        self.writer = OutputWriter(background = False)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = Lock()
+
+    def symbols(self) -> list[str]:
+        return self.config.get_all_stock_symbols()
+
+    def _data_path(self, symbol: str) -> Path:
+        return self.config.NSE_DATA_DIR.joinpath(symbol, "consolidated.parquet")
+
+    def _version(self, symbol: str) -> tuple[int, ...]:
+        # Features relative to the benchmark go stale along with it.
+        return tuple(
+            path.stat().st_mtime_ns if path.exists() else 0
+            for path in {self._data_path(symbol), self._data_path(self.config.BENCHMARK_SYMBOL)}
+        )
+
+    def _load(self, symbol: str) -> StockData:
+        stock_data = StockData(
+            symbol,
+            self.config.NSE_DATA_DIR,
+            self.config.COMPANY_DATA_DIR,
+            self.config.IMAGES_OUT_DIR,
+            writer = self.writer
+        )
+
+        if symbol == self.config.BENCHMARK_SYMBOL:
+            benchmark_returns = stock_data.daily_returns
+        else:
+            benchmark_returns = self.query(self.config.BENCHMARK_SYMBOL, [], lambda benchmark: benchmark.daily_returns)
+
+        stock_data.create_features(
+            **self.params,
+            benchmark_returns = benchmark_returns,
+            outputs = [],
+            reports = False
+        )
+        return stock_data
+
+    def _evict(self):
+        total_bytes = sum(entry.nbytes for entry in self._entries.values())
+
+        while len(self._entries) > 1 and total_bytes > self.memory_budget:
+            _, entry = self._entries.popitem(last = False)
+            total_bytes -= entry.nbytes
+
+    def query(self, symbol: str, outputs: list[str] | None, read: Callable[[StockData], object]):
+        if symbol not in self.symbols():
+            raise QueryError(HTTPStatus.NOT_FOUND, f"Unknown symbol '{symbol}'")
+
+        version = self._version(symbol)
+
+        with self._lock:
+            entry = self._entries.get(symbol)
+
+            if entry is None or entry.version != version:
+                entry = CacheEntry(version)
+                self._entries[symbol] = entry
+                self.misses += 1
+            else:
+                self.hits += 1
+
+            self._entries.move_to_end(symbol)
+
+        with entry.lock:
+            if entry.stock_data is None:
+                entry.stock_data = self._load(symbol)
+                # Consolidating a symbol for the first time writes its data file.
+                entry.version = self._version(symbol)
+
+            stock_data = entry.stock_data
+            missing = [
+                output for output in (self.all_outputs if outputs is None else outputs)
+                if output not in entry.outputs and output not in stock_data.raw_data.columns
+            ]
+
+            if missing:
+                try:
+                    stock_data.create_features(**self.params, outputs = missing, reports = False)
+                except ValueError as e:
+                    raise QueryError(HTTPStatus.BAD_REQUEST, str(e))
+
+                entry.outputs.update(missing)
+
+            result = read(stock_data)
+            entry.nbytes = stock_data_bytes(stock_data)
+
+        with self._lock:
+            self._evict()
+
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'Entries': list(self._entries),
+                'Bytes': sum(entry.nbytes for entry in self._entries.values()),
+                'Memory Budget': self.memory_budget,
+                'Hits': self.hits,
+                'Misses': self.misses
+            }
+
+def _date_filter(stock_df: pd.DataFrame, start: str | None, end: str | None) -> pd.Series:
+    is_selected = pd.Series(True, index = stock_df.index)
+
+    if start is not None:
+        is_selected &= stock_df['Date'] >= pd.Timestamp(start)
+
+    if end is not None:
+        is_selected &= stock_df['Date'] <= pd.Timestamp(end)
+
+    return is_selected
+
+def feature_frame(
+    stock_data: StockData,
+    columns: list[str] | None,
+    start: str | None = None,
+    end: str | None = None
+) -> pd.DataFrame:
+    stock_df = stock_data.raw_data
+    columns = list(stock_df.columns) if columns is None else ['Date'] + [c for c in columns if c != 'Date']
+    return stock_df.loc[_date_filter(stock_df, start, end), columns].reset_index(drop = True)
+
+def performance_frame(stock_data: StockData, start: str | None = None, end: str | None = None) -> pd.DataFrame:
+    if start is None and end is None:
+        reports = stock_data.performance_reports(FEATURE_PARAMS['performance_periods'])
+    else:
+        sessions = stock_data.calendar.sessions
+        reports = [stock_data.performance_report_between(
+            sessions[0] if start is None else pd.Timestamp(start),
+            sessions[-1] if end is None else pd.Timestamp(end)
+        )]
+
+    return pd.DataFrame([asdict(report) for report in reports])
+
+def arrow_bytes(df: pd.DataFrame) -> bytes:
+    table = pa.Table.from_pandas(df, preserve_index = False)
+    sink = BytesIO()
+
+    with pa.ipc.new_stream(sink, table.schema) as stream:
+        stream.write_table(table)
+
+    return sink.getvalue()
+
+class QueryHandler(BaseHTTPRequestHandler):
+    cache: SymbolCache
+
+    def _send(self, status: HTTPStatus, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, payload: str, status: HTTPStatus = HTTPStatus.OK):
+        self._send(status, payload.encode("utf-8"), "application/json")
+
+    def _send_frame(self, df: pd.DataFrame, fmt: str):
+        if fmt == "arrow":
+            self._send(HTTPStatus.OK, arrow_bytes(df), ARROW_CONTENT_TYPE)
+        else:
+            self._send_json(df.to_json(orient = "records", date_format = "iso"))
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        fmt = params.get("format", "json")
+
+        try:
+            if fmt not in ("json", "arrow"):
+                raise QueryError(HTTPStatus.BAD_REQUEST, f"Unknown format '{fmt}'")
+
+            match parts:
+                case ["symbols"]:
+                    self._send_json(json.dumps(self.cache.symbols()))
+                case ["symbols", symbol, "summary"]:
+                    summary = self.cache.query(symbol, ['Streak'], lambda stock_data: asdict(stock_data.summary))
+                    self._send_json(pd.Series(summary).to_json(date_format = "iso"))
+                case ["symbols", symbol, "performance"]:
+                    self._send_frame(self.cache.query(
+                        symbol,
+                        [],
+                        lambda stock_data: performance_frame(stock_data, params.get("start"), params.get("end"))
+                    ), fmt)
+                case ["symbols", symbol, "features"]:
+                    columns = params["columns"].split(",") if "columns" in params else None
+                    self._send_frame(self.cache.query(
+                        symbol,
+                        columns,
+                        lambda stock_data: feature_frame(stock_data, columns, params.get("start"), params.get("end"))
+                    ), fmt)
+                case ["cache"]:
+                    self._send_json(json.dumps(self.cache.stats()))
+                case _:
+                    raise QueryError(HTTPStatus.NOT_FOUND, f"Unknown path '{url.path}'")
+        except QueryError as e:
+            self._send_json(json.dumps({'error': str(e)}), e.status)
+        except (KeyError, ValueError) as e:
+            self._send_json(json.dumps({'error': str(e)}), HTTPStatus.BAD_REQUEST)
+
+if __name__ == "__main__":
+    parser = ArgumentParser(prog = "Metrics Server")
+    parser.add_argument("--host", default = "127.0.0.1")
+    parser.add_argument("-p", "--port", type = int, default = 8050)
+    parser.add_argument("-m", "--cache-mb", type = int, default = None)
+    args = parser.parse_args()
+
+    CONFIG = Config(Path("config.json"))
+
+    QueryHandler.cache = SymbolCache(
+        CONFIG,
+        CONFIG.MEMORY_BUDGET if args.cache_mb is None else args.cache_mb * 2 ** 20,
+        CONFIG.RANDOM_STATE
+    )
+
+    with ThreadingHTTPServer((args.host, args.port), QueryHandler) as server:
+        print(f"> Serving metrics for {len(QueryHandler.cache.symbols())} symbols at http://{args.host}:{args.port}")
+        server.serve_forever()
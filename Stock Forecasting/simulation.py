@@ -0,0 +1,136 @@
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utility import Config, PerfPeriods
+
+PROJECTION_PERCENTILES = [5, 25, 50, 75, 95]
+
+def stationary_bootstrap_indices(
+    num_returns: int,
+    num_paths: int,
+    horizon: int,
+    mean_block_size: float,
+    rng: np.random.Generator
+) -> np.ndarray:
+    steps = np.arange(horizon)
+    is_block_start = rng.random((num_paths, horizon)) < (1 / mean_block_size)
+    is_block_start[:, 0] = True
+
+    block_start_step = np.maximum.accumulate(np.where(is_block_start, steps, 0), axis = 1)
+    block_start_index = np.take_along_axis(
+        rng.integers(0, num_returns, size = (num_paths, horizon)),
+        block_start_step,
+        axis = 1
+    )
+
+    return (block_start_index + steps - block_start_step) % num_returns
+
+def bootstrap_paths(
+    daily_returns: np.ndarray,
+    horizon: int,
+    num_paths: int = 10000,
+    mean_block_size: float = 10,
+    memory_cap: int = 256 * 2 ** 20,
+    random_state: int | None = None
+) -> np.ndarray:
+    log_returns = np.log1p(daily_returns[~np.isnan(daily_returns)])
+    rng = np.random.default_rng(random_state)
+
+    max_paths = max(1, memory_cap // (2 * horizon * 8))
+    chunk_size = max(1, memory_cap // (2 * horizon * 3 * 8))
+
+    if num_paths > max_paths:
+        print(f"> Reducing paths from {num_paths} to {max_paths} to stay within the memory cap.")
+        num_paths = max_paths
+
+    growth = np.empty((num_paths, horizon), dtype = np.float64)
+
+    for start in range(0, num_paths, chunk_size):
+        end = min(start + chunk_size, num_paths)
+        growth[start:end] = np.exp(np.cumsum(
+            log_returns[stationary_bootstrap_indices(
+                log_returns.size, end - start, horizon, mean_block_size, rng
+            )],
+            axis = 1
+        ))
+
+    return growth
+
+def project_prices(
+    last_close: float,
+    daily_returns: np.ndarray,
+    horizon: int,
+    percentiles: list[int] = PROJECTION_PERCENTILES,
+    **bootstrap_kwargs
+) -> np.ndarray:
+    return last_close * np.percentile(
+        bootstrap_paths(daily_returns, horizon, **bootstrap_kwargs),
+        percentiles,
+        axis = 0
+    )
+
+def _project_symbol(
+    stock_df: pd.DataFrame,
+    horizons: list[int],
+    **bootstrap_kwargs
+) -> pd.DataFrame:
+    fan = project_prices(
+        stock_df['Close'].iloc[-1],
+        ((stock_df['Close'] / stock_df['Prev Close']) - 1).to_numpy(),
+        max(horizons),
+        **bootstrap_kwargs
+    )
+
+    return pd.DataFrame(
+        fan[:, np.asarray(horizons) - 1].T,
+        index = pd.Index(horizons, name = 'Horizon'),
+        columns = [f"P{p}" for p in PROJECTION_PERCENTILES]
+    )
+
+def project_universe(
+    stock_dfs: dict[str, pd.DataFrame],
+    horizons: list[int],
+    max_workers: int | None = None,
+    **bootstrap_kwargs
+) -> pd.DataFrame:
+    with ProcessPoolExecutor(max_workers = max_workers) as executor:
+        projections = list(executor.map(
+            partial(_project_symbol, horizons = horizons, **bootstrap_kwargs),
+            stock_dfs.values()
+        ))
+
+    return pd.concat(projections, keys = list(stock_dfs), names = ['Symbol'])
+
+if __name__ == "__main__":
+    parser = ArgumentParser(prog = "Monte Carlo Projections")
+    parser.add_argument("-p", "--paths", type = int, default = 10000)
+    parser.add_argument("-b", "--block-size", type = float, default = 10)
+    parser.add_argument("-w", "--workers", type = int, default = None)
+    parser.add_argument("-o", "--out", type = Path, default = None)
+    args = parser.parse_args()
+
+    CONFIG = Config(Path("config.json"))
+
+    projections = project_universe(
+        {
+            symbol: pd.read_parquet(
+                CONFIG.NSE_DATA_DIR.joinpath(symbol, "consolidated.parquet"),
+                columns = ['Prev Close', 'Close']
+            )
+            for symbol in CONFIG.get_all_stock_symbols()
+        },
+        [PerfPeriods.SHORT, PerfPeriods.MEDIUM, PerfPeriods.LONG],
+        args.workers,
+        num_paths = args.paths,
+        mean_block_size = args.block_size,
+        random_state = CONFIG.RANDOM_STATE
+    )
+    print(projections.round(2).to_string())
+
+    if args.out is not None:
+        projections.to_csv(args.out)
@@ -0,0 +1,88 @@
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+def frame_bytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(index = True, deep = True).sum())
+
+class FeatureStore:
+    def __init__(self, root: Path, memory_budget: int) -> None:
+        self.root = root
+        self.memory_budget = memory_budget
+        self._pending: list[pd.DataFrame] = []
+        self._pending_bytes = 0
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors = True)
+        self.root.mkdir(parents = True)
+
+    def _partition_path(self, symbol: str) -> Path:
+        return self.root.joinpath(f"Symbol={symbol}", "part.parquet")
+
+    def append(self, stock_df: pd.DataFrame):
+        self._pending.append(stock_df)
+        self._pending_bytes += frame_bytes(stock_df)
+
+        if self._pending_bytes > self.memory_budget:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            print(f"> Spilling {len(self._pending)} symbols ({self._pending_bytes / 2 ** 20:.1f} MB) to {self.root}")
+
+        for stock_df in self._pending:
+            partition_path = self._partition_path(stock_df['Symbol'].iloc[0])
+            partition_path.parent.mkdir(exist_ok = True, parents = True)
+            stock_df.drop(columns = 'Symbol').to_parquet(partition_path, index = False)
+
+        self._pending = []
+        self._pending_bytes = 0
+
+    def symbols(self) -> list[str]:
+        return sorted(
+            p.name.removeprefix("Symbol=") for p in self.root.glob("Symbol=*") if p.is_dir()
+        )
+
+    def read_symbol(self, symbol: str, columns: list[str] | None = None) -> pd.DataFrame:
+        stock_df = pd.read_parquet(self._partition_path(symbol), columns = columns)
+        stock_df['Symbol'] = symbol
+        return stock_df
+
+    def iter_batches(self, columns: list[str] | None = None) -> Iterator[pd.DataFrame]:
+        batch = []
+        batch_bytes = 0
+
+        for symbol in self.symbols():
+            metadata = pq.read_metadata(self._partition_path(symbol))
+            num_columns = metadata.num_columns if columns is None else len(columns)
+            symbol_bytes = metadata.num_rows * (num_columns + 1) * 8
+
+            if batch and batch_bytes + symbol_bytes > self.memory_budget:
+                yield pd.concat(batch, ignore_index = True)
+                batch = []
+                batch_bytes = 0
+
+            batch.append(self.read_symbol(symbol, [c for c in columns if c != 'Symbol'] if columns else None))
+            batch_bytes += symbol_bytes
+
+        if batch:
+            yield pd.concat(batch, ignore_index = True)
+
+    def consolidate(self, out_path: Path):
+        symbols = self.symbols()
+        schema = pa.unify_schemas(
+            [pq.read_schema(self._partition_path(symbol)) for symbol in symbols],
+            promote_options = "permissive"
+        ).append(pa.field('Symbol', pa.string()))
+
+        with pq.ParquetWriter(out_path, schema) as writer:
+            for symbol in symbols:
+                table = pq.read_table(self._partition_path(symbol))
+                table = table.append_column(
+                    'Symbol', pa.array([symbol] * table.num_rows, type = pa.string())
+                )
+                writer.write_table(table.select(schema.names).cast(schema))
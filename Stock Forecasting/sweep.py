@@ -0,0 +1,129 @@
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import product
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+from scipy.stats import rankdata
+
+from metrics import ma_spearman_scores, moving_average_matrix
+from utility import Config, PerfPeriods
+
+CURRENT_WINDOW_SETS = [tuple(range(1, 16)), tuple(range(5, 101, 5))]
+
+def window_set_name(windows: tuple[int, ...]) -> str:
+    return f"MA-S ({min(windows)}-{max(windows)}-{len(windows)})"
+
+def candidate_window_sets(
+    starts: tuple[int, ...] = (1, 2, 3, 5, 10),
+    stops: tuple[int, ...] = (10, 15, 20, 30, 50, 100, 150, 200),
+    steps: tuple[int, ...] = (1, 2, 5, 10),
+    min_size: int = 5,
+    max_size: int = 40
+) -> list[tuple[int, ...]]:
+    window_sets = set(CURRENT_WINDOW_SETS)
+
+    for start, stop, step in product(starts, stops, steps):
+        windows = tuple(range(start, stop + 1, step))
+
+        if min_size <= len(windows) <= max_size:
+            window_sets.add(windows)
+
+    return sorted(window_sets, key = lambda ws: (min(ws), max(ws), len(ws)))
+
+def window_set_scores(close: np.ndarray, window_sets: list[tuple[int, ...]]) -> list[np.ndarray]:
+    unique_windows = sorted(set().union(*window_sets))
+    window_cols = {win: i for i, win in enumerate(unique_windows)}
+    ma_matrix = moving_average_matrix(close, unique_windows)
+
+    return [
+        ma_spearman_scores(ma_matrix[:, [window_cols[win] for win in windows]], windows)
+        for windows in window_sets
+    ]
+
+def evaluate_symbol(
+    close: np.ndarray,
+    window_sets: list[tuple[int, ...]],
+    horizon: int,
+    strong_threshold: float = 0.3
+) -> pd.DataFrame:
+    fwd_returns = (close[horizon:] / close[:-horizon]) - 1
+    fwd_ranks = rankdata(fwd_returns)
+    results = []
+
+    for windows, scores in zip(window_sets, window_set_scores(close, window_sets)):
+        scores = scores[:-horizon]
+
+        is_strong = scores > strong_threshold
+        is_weak = scores < -strong_threshold
+
+        results.append({
+            'Window Set': window_set_name(windows),
+            'IC': np.corrcoef(rankdata(scores), fwd_ranks)[0, 1] if scores.std() > 0 else np.nan,
+            'Strong Returns': fwd_returns[is_strong].mean() if is_strong.any() else np.nan,
+            'Weak Returns': fwd_returns[is_weak].mean() if is_weak.any() else np.nan,
+            'Strong Hit Rate': (fwd_returns[is_strong] > 0).mean() if is_strong.any() else np.nan
+        })
+
+    return pd.DataFrame(results)
+
+def run_sweep(
+    closes: dict[str, np.ndarray],
+    window_sets: list[tuple[int, ...]],
+    horizon: int,
+    max_workers: int | None = None
+) -> pd.DataFrame:
+    symbols = [sym for sym, close in closes.items() if close.size > horizon + 1]
+
+    with ProcessPoolExecutor(max_workers = max_workers) as executor:
+        symbol_results = list(executor.map(
+            partial(evaluate_symbol, window_sets = window_sets, horizon = horizon),
+            [closes[sym] for sym in symbols]
+        ))
+
+    sweep_df = pd.concat(symbol_results, keys = symbols, names = ['Symbol', None]).reset_index(level = 0)
+    sweep_df['Spread'] = sweep_df['Strong Returns'] - sweep_df['Weak Returns']
+
+    ranked = sweep_df.groupby('Window Set', sort = False).agg(
+        mean_ic = ('IC', 'mean'),
+        ic_std = ('IC', 'std'),
+        mean_spread = ('Spread', 'mean'),
+        strong_hit_rate = ('Strong Hit Rate', 'mean'),
+        num_symbols = ('IC', 'count')
+    )
+    ranked['ic_ir'] = ranked['mean_ic'] / ranked['ic_std']
+
+    return ranked.sort_values('mean_ic', ascending = False).reset_index()
+
+if __name__ == "__main__":
+    parser = ArgumentParser(prog = "MA-S Window Sweep")
+    parser.add_argument("-n", "--horizon", type = int, default = PerfPeriods.SHORT)
+    parser.add_argument("-w", "--workers", type = int, default = None)
+    parser.add_argument("-t", "--top", type = int, default = 10)
+    parser.add_argument("-o", "--out", type = Path, default = None)
+    args = parser.parse_args()
+
+    CONFIG = Config(Path("config.json"))
+
+    closes = {
+        symbol: pd.read_parquet(
+            CONFIG.NSE_DATA_DIR.joinpath(symbol, "consolidated.parquet"),
+            columns = ['Close']
+        )['Close'].to_numpy(dtype = np.float64)
+        for symbol in CONFIG.get_all_stock_symbols()
+    }
+    window_sets = candidate_window_sets()
+
+    start_time = perf_counter()
+    ranked = run_sweep(closes, window_sets, args.horizon, args.workers)
+    print(f"> Evaluated {len(window_sets)} window sets over {len(closes)} symbols for {args.horizon} day returns in {perf_counter() - start_time:.2f}s.")
+    print(ranked.head(args.top).to_string(index = False))
+
+    current = ranked[ranked['Window Set'].isin([window_set_name(ws) for ws in CURRENT_WINDOW_SETS])]
+    print(f"> Current window sets:\n{current.to_string()}")
+
+    if args.out is not None:
+        ranked.to_csv(args.out, index = False)
@@ -1,3 +1,6 @@
+import json
+from collections import defaultdict
+from collections.abc import Iterable
 from datetime import date
 from pathlib import Path
 
@@ -5,21 +8,66 @@ import pandas as pd
 import seaborn as sns
 from matplotlib import pyplot as plt
 
+from chart_data import downsample_indices, save_chart_data
+from correlation import returns_matrix, latest_correlation, mean_pairwise_correlation, top_peers
 from data_process import StockSummary, PerformanceReport, StockData
-from utility import PerfPeriods, PLOT_PERIOD, human_readable_int as hri
+from drawdowns import drawdown_episodes, underwater_summary, worst_episodes
+from output_writer import OutputWriter
+from relative_strength import RS_HORIZONS, rank_movers, rs_lines, rs_ranks, rs_scores
+from seasonality import UNIVERSE, bucket_table, seasonality_stats, rank_symbols, universe_returns
+from simulation import PROJECTION_PERCENTILES
+from store import FeatureStore
+from utility import PerfPeriods, PLOT_PERIOD, PLOT_POINTS, human_readable_int as hri
+
+INDEX_COLUMNS = [
+    'Date',
+    'Symbol',
+    'Prev Close',
+    'Close',
+    'Value',
+    f'MA {PerfPeriods.SHORT} days',
+    f'MA {PerfPeriods.LONG} days',
+    '% Down from ATH'
+]
+
+INTERACTIVE_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Prev Close', 'Close', 'VWAP', 'Volume']
 
 def create_index(
     template_path: Path,
     out_path: Path,
     summaries: list[StockSummary],
     perf_reports: list[list[PerformanceReport]],
-    stock_dfs: list[pd.DataFrame],
+    seasonality: list[pd.DataFrame],
+    stock_dfs: list[pd.DataFrame] | FeatureStore,
     performance_periods: list[int],
-    top_count: int = 5
+    writer: OutputWriter,
+    top_count: int = 5,
+    corr_window: int = PerfPeriods.LONG,
+    peer_count: int = 3,
+    benchmark_symbol: str | None = None,
+    rs_lookback: int = PerfPeriods.SHORT
 ):
     with template_path.open('r', encoding = "utf-8") as f:
         index = f.read()
 
+    all_consolidated_path = out_path.parent.joinpath("data", "NSE", "all_consolidated.parquet")
+    seasonality_path = all_consolidated_path.with_name("seasonality.parquet")
+    episodes_path = all_consolidated_path.with_name("drawdown_episodes.parquet")
+
+    if isinstance(stock_dfs, FeatureStore):
+        stock_dfs.consolidate(writer.stage(all_consolidated_path))
+        stock_batches = stock_dfs.iter_batches(INDEX_COLUMNS)
+    else:
+        stock_dfs = pd.concat(stock_dfs, ignore_index = True)
+        writer.write_parquet(all_consolidated_path, stock_dfs)
+        stock_batches = [stock_dfs[INDEX_COLUMNS]]
+
+    above_MA_pcnt, returns, mean_values, episodes, underwater = _aggregate_index_data(stock_batches, corr_window)
+    seasonality = pd.concat(seasonality + [seasonality_stats(universe_returns(returns))], ignore_index = True)
+    corr, _ = latest_correlation(returns, corr_window)
+    writer.write_parquet(seasonality_path, seasonality)
+    writer.write_parquet(episodes_path, episodes)
+
     stock_summaries = []
     perf_results = {p: [] for p in performance_periods}
     perf_values = {p: [] for p in performance_periods}
@@ -98,31 +146,116 @@ def create_index(
             "\n".join(period_top_values) + 
             "\n</tr>"
         )
+
+    peer_rows = []
+
+    for symbol, peers in top_peers(corr, peer_count).items():
+        peer_cells = [
+            f'<td>{peer} <span class="metric">({peer_corr:.2f})</span></td>' for peer, peer_corr in peers
+        ] + ['<td>-</td>'] * (peer_count - len(peers))
+        peer_rows.append(
+            f'<tr>\n<th scope="row">{symbol}</th>\n' +
+            "\n".join(peer_cells) +
+            "\n</tr>"
+        )
+
+    ranks = rs_ranks(rs_scores(returns))
+    movers = rank_movers(ranks, rs_lookback)
+    rs_count = min(top_count, len(movers) // 2)
+    rs_movers = []
+
+    for i, ((gainer, gain), (decliner, decline)) in enumerate(zip(
+        movers.head(rs_count).iterrows(), movers.tail(rs_count).iloc[::-1].iterrows()
+    ), start = 1):
+        rs_movers.append(
+            f'<tr>\n<th scope="row">#{i}</th>\n' +
+            f'<td>{gainer} <span class="color-green metric">({gain["Previous RS Rank"]:.0f} &rarr; {gain["RS Rank"]:.0f})</span></td>\n' +
+            f'<td>{decliner} <span class="color-red metric">({decline["Previous RS Rank"]:.0f} &rarr; {decline["RS Rank"]:.0f})</span></td>' +
+            "\n</tr>"
+        )
+
+    deep_drawdown = -20
+    underwater_info = (
+        f'<span class="metric">{(underwater["Current Depth"] <= deep_drawdown).sum()}</span> of ' +
+        f'<span class="metric">{len(underwater)}</span> stocks are more than ' +
+        f'<span class="metric color-red">{abs(deep_drawdown)}%</span> below their all time high. ' +
+        f'The median stock is <span class="metric color-red">{abs(underwater["Current Depth"].median()):.2f}%</span> below its all time high ' +
+        f'and has spent <span class="metric">{underwater["Pcnt Underwater"].median():.1%}</span> of its history below it. ' +
+        f'Drawdowns deeper than <span class="metric color-red">10%</span> took a median of ' +
+        f'<span class="metric">{underwater["Median Days to Recover"].median():.0f}</span> trading days to recover from their trough.'
+    )
+
+    current_month = f"{returns.index[-1]:%B}"
+    ranked = rank_symbols(seasonality, 'Month', current_month)
+    seasonal_count = min(top_count, len(ranked) // 2)
+    strongest = ranked.head(seasonal_count)
+    weakest = ranked.tail(seasonal_count).iloc[::-1]
+    seasonal_stocks = []
+
+    for i, (strong, strong_t, weak, weak_t) in enumerate(zip(
+        strongest['Symbol'], strongest['T-Stat'], weakest['Symbol'], weakest['T-Stat']
+    ), start = 1):
+        seasonal_stocks.append(
+            f'<tr>\n<th scope="row">#{i}</th>\n' +
+            f'<td>{strong} ({_t_stat(strong_t)})</td>\n' +
+            f'<td>{weak} ({_t_stat(weak_t)})</td>' +
+            "\n</tr>"
+        )
     
     index = index.format(
         stock_summaries = "\n".join(stock_summaries),
         perf_period_size = "\n".join(perf_period_size),
         top_gainers = "\n".join(top_gainers),
         top_losers = "\n".join(top_losers),
-        top_values = "\n".join(top_values)
+        top_values = "\n".join(top_values),
+        corr_window = corr_window,
+        peer_ranks = "\n".join(f'<th scope="col">Peer #{i}</th>' for i in range(1, peer_count + 1)),
+        peer_rows = "\n".join(peer_rows),
+        seasonality_weekday = _seasonality_rows(bucket_table(seasonality, UNIVERSE, 'Weekday')),
+        seasonality_month = _seasonality_rows(bucket_table(seasonality, UNIVERSE, 'Month')),
+        seasonality_turn_of_month = _seasonality_rows(bucket_table(seasonality, UNIVERSE, 'Turn of month')),
+        seasonality_month_name = current_month,
+        underwater_info = underwater_info,
+        rs_horizons = ", ".join(f"{horizon}" for horizon in RS_HORIZONS),
+        rs_lookback = rs_lookback,
+        rs_movers = "\n".join(rs_movers),
+        open_drawdowns = _episode_rows(worst_episodes(episodes[episodes['Is Open']], top_count), 'Symbol'),
+        worst_drawdowns = _episode_rows(worst_episodes(episodes, top_count), 'Symbol'),
+        seasonal_stocks = "\n".join(seasonal_stocks)
     )
 
-    with out_path.open('w', encoding = 'utf-8') as f:
-        f.write(index)
-    
-    stock_dfs = pd.concat(stock_dfs, ignore_index = True)
-    stock_dfs.to_parquet(out_path.parent.joinpath("data", "NSE", "all_consolidated.parquet"))
+    writer.write_text(out_path, index)
 
     _save_index_plots(
-        stock_dfs,
-        out_path.parent.joinpath("web", "images", "index")
+        above_MA_pcnt,
+        out_path.parent.joinpath("web", "images", "index"),
+        writer
+    )
+
+    _save_correlation_plots(
+        mean_values,
+        returns,
+        corr,
+        corr_window,
+        out_path.parent.joinpath("web", "images", "index"),
+        writer
+    )
+
+    _save_relative_strength_plots(
+        ranks,
+        rs_lines(returns, benchmark_symbol) if benchmark_symbol in returns.columns else None,
+        benchmark_symbol,
+        out_path.parent.joinpath("web", "images"),
+        writer
     )
 
 def create_stock_report(
     template_path: Path,
     page_out_path: Path,
     stock_data: StockData,
-    ma_periods: list[int]
+    ma_periods: list[int],
+    benchmark_symbol: str,
+    writer: OutputWriter
 ):
     with template_path.open('r', encoding = "utf-8") as f:
         report = f.read()
@@ -135,6 +268,11 @@ def create_stock_report(
     perf_lowest_close = ['<th scope="row">Lowest Close Price</th>']
     perf_highest_close = ['<th scope="row">Highest Close Price</th>']
     perf_mean_value = ['<th scope="row">Mean Value Traded</th>']
+    perf_volatility = ['<th scope="row">Annualized Volatility</th>']
+    perf_sharpe_ratio = ['<th scope="row">Sharpe Ratio</th>']
+    perf_sortino_ratio = ['<th scope="row">Sortino Ratio</th>']
+    perf_max_drawdown = ['<th scope="row">Max Drawdown</th>']
+    perf_beta = [f'<th scope="row">Beta vs {benchmark_symbol}</th>']
 
     for perf_report in stock_data.perf_reports:
         perf_period_size.append(f'<th scope="col">{perf_report.period_size} Days</th>')
@@ -152,6 +290,11 @@ def create_stock_report(
         perf_lowest_close.append(f'<td>{perf_report.lowest_close:.2f}</td>')
         perf_highest_close.append(f'<td>{perf_report.hightest_close:.2f}</td>')
         perf_mean_value.append(f'<td>{hri(perf_report.mean_value)}</td>')
+        perf_volatility.append(f'<td>{perf_report.volatility:.2%}</td>')
+        perf_sharpe_ratio.append(f'<td>{perf_report.sharpe_ratio:.2f}</td>')
+        perf_sortino_ratio.append(f'<td>{perf_report.sortino_ratio:.2f}</td>')
+        perf_max_drawdown.append(f'<td><span class="color-red metric">{perf_report.max_drawdown:.2%}</span></td>')
+        perf_beta.append(f'<td>{perf_report.beta:.2f}</td>')
 
     last_candle = "Green" if stock_data.last_candle == 1 else "Red"
 
@@ -162,6 +305,25 @@ def create_stock_report(
             f'<p>Average of last {period} days: <span class="metric">{stock_data.raw_data[col_name].iloc[-1]:.2f}</span></p>'
         )
 
+    projection_percentiles = [f'<th scope="col">P{p}</th>' for p in PROJECTION_PERCENTILES]
+    projections = []
+    for horizon, prices in stock_data.projections.items():
+        projections.append(
+            f'<tr>\n<th scope="row">{horizon} Days</th>\n' +
+            "\n".join(f'<td>{price:.2f}</td>' for price in prices) +
+            "\n</tr>"
+        )
+
+    volume_profiles = []
+    for window_name, (point_of_control, value_area_low, value_area_high) in stock_data.volume_profiles.items():
+        volume_profiles.append(
+            f'<tr>\n<th scope="row">{window_name}</th>\n' + (
+                '<td>-</td>\n<td>-</td>' if pd.isna(point_of_control) else
+                f'<td>{point_of_control:.2f}</td>\n<td>{value_area_low:.2f} - {value_area_high:.2f}</td>'
+            ) +
+            "\n</tr>"
+        )
+
     total_hits_of_last_close = stock_data.raw_data['Total hits of Close'].iloc[-1]
 
     if total_hits_of_last_close > 1:
@@ -190,9 +352,17 @@ def create_stock_report(
         perf_lowest_close = "\n".join(perf_lowest_close),
         perf_highest_close = "\n".join(perf_highest_close),
         perf_mean_value = "\n".join(perf_mean_value),
+        perf_volatility = "\n".join(perf_volatility),
+        perf_sharpe_ratio = "\n".join(perf_sharpe_ratio),
+        perf_sortino_ratio = "\n".join(perf_sortino_ratio),
+        perf_max_drawdown = "\n".join(perf_max_drawdown),
+        perf_beta = "\n".join(perf_beta),
         no_highlights = "" if len(stock_data.highlights) else "no_highlights",
         highlights = "\n".join(stock_data.highlights),
         ma_values = "\n".join(ma_values),
+        projection_percentiles = "\n".join(projection_percentiles),
+        projections = "\n".join(projections),
+        volume_profiles = "\n".join(volume_profiles),
         first_hit_info = first_hit_info,
         is_ATH = "" if total_hits_of_last_close > 1 else "is_ATH",
         total_hits_of_last_close = total_hits_of_last_close,
@@ -210,29 +380,170 @@ def create_stock_report(
         curr_pcnt_down_ath = f"{stock_data.raw_data['% Down from ATH'].iloc[-1]:.2f}%",
         max_pcnt_down_ath = f"{stock_data.raw_data['% Down from ATH'].min():.2f}%",
         ath_hits_1000_days = stock_data.ath_hits_1000_days,
-        last_ath_date = f"{stock_data.last_ath_date:%A, %B %d, %Y}"
+        last_ath_date = f"{stock_data.last_ath_date:%A, %B %d, %Y}",
+        num_drawdown_episodes = len(stock_data.drawdown_episodes),
+        pcnt_underwater = f"{stock_data.drawdown_episodes['Days Underwater'].sum() / stock_data.summary.num_records:.1%}",
+        drawdown_episodes = _episode_rows(worst_episodes(stock_data.drawdown_episodes, 5)),
+        seasonality_weekday = _seasonality_rows(bucket_table(stock_data.seasonality, stock_data.symbol, 'Weekday')),
+        seasonality_month = _seasonality_rows(bucket_table(stock_data.seasonality, stock_data.symbol, 'Month')),
+        seasonality_turn_of_month = _seasonality_rows(
+            bucket_table(stock_data.seasonality, stock_data.symbol, 'Turn of month')
+        ),
+        chart_scripts = "" if not stock_data.charts else f'''<script src="../js/script.js"></script>
+    <script src="../data/charts/{stock_data.symbol}.js"></script>''',
+        charts = _chart_slots(stock_data)
     )
 
-    with page_out_path.joinpath(f"{stock_data.symbol}.html").open('w', encoding = 'utf-8') as f:
-        f.write(report)
+    if stock_data.charts:
+        save_chart_data(
+            page_out_path.parent.joinpath("data", "charts"),
+            stock_data.symbol,
+            stock_data.charts,
+            writer
+        )
+
+    writer.write_text(page_out_path.joinpath(f"{stock_data.symbol}.html"), report)
     
     print(f"> Updated {stock_data.symbol}.html")
 
-def _save_index_plots(
-    all_stocks_df: pd.DataFrame,
-    image_out_path: Path
+def save_interactive_bundle(
+    data_out_path: Path,
+    stock_data: StockData,
+    writer: OutputWriter
 ):
+    writer.write_text(
+        data_out_path.joinpath("data", f"{stock_data.symbol}.csv"),
+        stock_data.raw_data[INTERACTIVE_COLUMNS].to_csv(
+            index = False,
+            float_format = "%.2f",
+            date_format = "%Y-%m-%d"
+        )
+    )
+
+def save_interactive_manifest(
+    data_out_path: Path,
+    summaries: list[StockSummary],
+    writer: OutputWriter
+):
+    manifest = [
+        {
+            "symbol": summary.symbol,
+            "start_date": f"{summary.start_date:%Y-%m-%d}",
+            "end_date": f"{summary.end_date:%Y-%m-%d}",
+            "num_records": summary.num_records,
+            "last_close": float(summary.last_close),
+            "last_change": round(float(summary.last_change), 5)
+        }
+        for summary in summaries
+    ]
+
+    writer.write_text(data_out_path.joinpath("manifest.json"), json.dumps(manifest, indent = 1))
+
+def _aggregate_index_data(
+    stock_batches: Iterable[pd.DataFrame],
+    corr_window: int
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.DataFrame, pd.DataFrame]:
     short = PerfPeriods.SHORT
     long = PerfPeriods.LONG
 
-    all_stocks_df[f'Is above {short} MA'] = all_stocks_df['Close'] >= all_stocks_df[f'MA {short} days']
-    all_stocks_df[f'Is above {long} MA'] = all_stocks_df['Close'] >= all_stocks_df[f'MA {long} days']
+    above_MA_counts = []
+    returns = []
+    recent_values = []
+    episodes = []
+    num_sessions = []
+
+    for stock_df in stock_batches:
+        above_MA_counts.append(pd.DataFrame({
+            'Date': stock_df['Date'],
+            f'Is above {short} MA': stock_df['Close'] >= stock_df[f'MA {short} days'],
+            f'Is above {long} MA': stock_df['Close'] >= stock_df[f'MA {long} days'],
+            'Count': 1
+        }).groupby('Date').sum())
+        returns.append(returns_matrix(stock_df))
+        recent_values.append(stock_df.groupby('Symbol').tail(corr_window)[['Symbol', 'Date', 'Value']])
+        episodes.append(drawdown_episodes(stock_df['Date'], stock_df['% Down from ATH'], stock_df['Symbol']))
+        num_sessions.append(stock_df.groupby('Symbol').size())
+
+    above_MA_counts = pd.concat(above_MA_counts).groupby(level = 0).sum()
+    above_MA_pcnt = above_MA_counts[[f'Is above {short} MA', f'Is above {long} MA']].div(
+        above_MA_counts['Count'], axis = 0
+    ).mul(100).reset_index()
+
+    returns = pd.concat(returns, axis = 1).sort_index()
+
+    # A symbol trades on at most the last corr_window sessions of the universe,
+    # so its last corr_window rows hold every row inside the universe window.
+    recent_values = pd.concat(recent_values, ignore_index = True)
+    mean_values = recent_values[
+        recent_values['Date'] > returns.index[-corr_window:][0]
+    ].groupby('Symbol')['Value'].mean()
+
+    episodes = pd.concat(episodes, ignore_index = True)
+    underwater = underwater_summary(episodes, pd.concat(num_sessions))
+
+    return above_MA_pcnt, returns, mean_values, episodes, underwater
+
+def _t_stat(t_stat: float) -> str:
+    metric_class = 'color-green metric' if t_stat >= 2 else 'color-red metric' if t_stat <= -2 else 'metric'
+    return f'<span class="{metric_class}">{t_stat:.2f}</span>'
+
+def _episode_rows(episodes: pd.DataFrame, label: str | None = None) -> str:
+    rows = []
+
+    for i, (_, episode) in enumerate(episodes.iterrows(), start = 1):
+        recovery = "Ongoing" if episode['Is Open'] else f"{episode['Recovery']:%B %d, %Y}"
+        days_to_recover = "-" if episode['Is Open'] else f"{episode['Days to Recover']:.0f}"
+        rows.append(
+            f'<tr>\n<th scope="row">{episode[label] if label else f"#{i}"}</th>\n' +
+            f'<td>{episode["Peak"]:%B %d, %Y}</td>\n' +
+            f'<td>{episode["Trough"]:%B %d, %Y}</td>\n' +
+            f'<td>{recovery}</td>\n' +
+            f'<td><span class="color-red metric">{episode["Depth"]:.2f}%</span></td>\n' +
+            f'<td>{episode["Days to Trough"]}</td>\n' +
+            f'<td>{days_to_recover}</td>\n' +
+            f'<td>{episode["Days Underwater"]}</td>' +
+            "\n</tr>"
+        )
 
-    above_MA_pcnt = all_stocks_df.groupby(
-        'Date', as_index = False
-    )[[f'Is above {short} MA', f'Is above {long} MA']].agg(
-        lambda x: (sum(x) / len(x)) * 100
-    )
+    return "\n".join(rows)
+
+def _seasonality_rows(table: pd.DataFrame) -> str:
+    rows = []
+
+    for bucket, stats in table.iterrows():
+        change_color = 'color-green' if stats['Mean'] >= 0 else 'color-red'
+        rows.append(
+            f'<tr>\n<th scope="row">{bucket}</th>\n' +
+            f'<td><span class="{change_color} metric">{stats["Mean"]:.3%}</span></td>\n' +
+            f'<td>{stats["Median"]:.3%}</td>\n' +
+            f'<td>{stats["Hit Rate"]:.1%}</td>\n' +
+            f'<td>{_t_stat(stats["T-Stat"])}</td>\n' +
+            f'<td>{stats["Days"]:.0f}</td>' +
+            "\n</tr>"
+        )
+
+    return "\n".join(rows)
+
+# Charts drawn only for some stocks leave an empty slot on the others.
+def _chart_slots(stock_data: StockData) -> dict[str, str]:
+    slots = defaultdict(str)
+
+    for name in stock_data.chart_names:
+        chart_name = f"{stock_data.symbol}_{name}"
+        slots[name] = (
+            f'<div class="plot_img chart" data-chart="{chart_name}"></div>' if chart_name in stock_data.charts
+            else f'<img src="../images/{stock_data.symbol}/{chart_name}.png" class="plot_img">'
+        )
+
+    return slots
+
+def _save_index_plots(
+    above_MA_pcnt: pd.DataFrame,
+    image_out_path: Path,
+    writer: OutputWriter
+):
+    short = PerfPeriods.SHORT
+    long = PerfPeriods.LONG
 
     with sns.axes_style('dark'):
         plt.figure(figsize = (10, 5), dpi = 125)
@@ -260,8 +571,123 @@ def _save_index_plots(
         plt.xlabel("Date", fontsize = 12)
         plt.ylabel("Percentage", fontsize = 12)
         plt.title("Percentage of stocks above their moving averages", fontsize = 14)
-        plt.savefig(
+        writer.savefig(
             image_out_path.joinpath(f"Marketwatch_Pcnt_Stocks_above_MA.png"), 
             bbox_inches = "tight"
         )
-        plt.close()
\ No newline at end of file
+        plt.close()
+
+def _save_correlation_plots(
+    mean_values: pd.Series,
+    returns: pd.DataFrame,
+    corr: pd.DataFrame,
+    corr_window: int,
+    image_out_path: Path,
+    writer: OutputWriter,
+    max_heatmap_symbols: int = 50
+):
+    top_traded = mean_values.nlargest(max_heatmap_symbols).index
+    heatmap_corr = corr.loc[top_traded, top_traded].fillna(0)
+
+    cluster_grid = sns.clustermap(
+        heatmap_corr,
+        method = "average",
+        cmap = "RdYlGn",
+        vmin = -1,
+        vmax = 1,
+        figsize = (12, 12),
+        xticklabels = True,
+        yticklabels = True
+    )
+    cluster_grid.ax_heatmap.set_xlabel("")
+    cluster_grid.ax_heatmap.set_ylabel("")
+    cluster_grid.figure.suptitle(
+        f"Correlation of daily returns over last {corr_window} days", fontsize = 14, y = 1.01
+    )
+    writer.savefig(
+        image_out_path.joinpath(f"Correlation_Clustermap.png"),
+        cluster_grid.figure,
+        dpi = 100,
+        bbox_inches = "tight"
+    )
+    plt.close(cluster_grid.figure)
+
+    mean_corr = mean_pairwise_correlation(returns.iloc[-(PLOT_PERIOD + corr_window):], corr_window)
+
+    with sns.axes_style('dark'):
+        plt.figure(figsize = (10, 5), dpi = 125)
+
+        sns.lineplot(
+            x = mean_corr.index[-PLOT_PERIOD:],
+            y = mean_corr.iloc[-PLOT_PERIOD:],
+            label = f"{corr_window} days ({mean_corr.iloc[-1]:.2f})",
+            c = 'royalblue'
+        )
+
+        plt.legend()
+        plt.xlabel("Date", fontsize = 12)
+        plt.ylabel("Mean correlation", fontsize = 12)
+        plt.title("Mean pairwise correlation of daily returns", fontsize = 14)
+        writer.savefig(
+            image_out_path.joinpath(f"Mean_Pairwise_Correlation.png"),
+            bbox_inches = "tight"
+        )
+        plt.close()
+
+def _save_relative_strength_plots(
+    ranks: pd.DataFrame,
+    lines: pd.DataFrame | None,
+    benchmark_symbol: str | None,
+    image_out_path: Path,
+    writer: OutputWriter
+):
+    for symbol in ranks.columns:
+        symbol_ranks = ranks[symbol].dropna()
+
+        if symbol_ranks.empty:
+            continue
+
+        plot_rows = downsample_indices(len(symbol_ranks), PLOT_POINTS, [symbol_ranks.to_numpy()])
+        has_line = lines is not None and symbol != benchmark_symbol
+
+        with sns.axes_style('dark'):
+            fig, axes = plt.subplots(
+                2 if has_line else 1, 1, figsize = (10, 7 if has_line else 5), dpi = 125,
+                sharex = True, squeeze = False
+            )
+            rank_ax = axes[0, 0]
+
+            rank_ax.axhline(y = 50, linestyle = "dashdot", color = "goldenrod")
+            rank_ax.plot(
+                symbol_ranks.index[plot_rows],
+                symbol_ranks.iloc[plot_rows],
+                label = f"RS rank ({symbol_ranks.iloc[-1]:.0f})",
+                c = 'royalblue'
+            )
+            rank_ax.set_ylim((-1, 101))
+            rank_ax.set_ylabel("Percentile rank", fontsize = 12)
+            rank_ax.legend()
+            rank_ax.set_title(f"{symbol} - Relative strength", fontsize = 14)
+
+            if has_line:
+                symbol_line = lines[symbol].dropna()
+                line_rows = downsample_indices(len(symbol_line), PLOT_POINTS, [symbol_line.to_numpy()])
+                line_ax = axes[1, 0]
+
+                line_ax.axhline(y = 100, linestyle = "dashdot", color = "goldenrod")
+                line_ax.plot(
+                    symbol_line.index[line_rows],
+                    symbol_line.iloc[line_rows],
+                    label = f"vs {benchmark_symbol} ({symbol_line.iloc[-1]:.1f})",
+                    c = 'mediumseagreen'
+                )
+                line_ax.set_ylabel("RS line", fontsize = 12)
+                line_ax.legend()
+
+            axes[-1, 0].set_xlabel("Date", fontsize = 12)
+            writer.savefig(
+                image_out_path.joinpath(symbol, f"{symbol}_Relative_Strength.png"),
+                fig,
+                bbox_inches = "tight"
+            )
+            plt.close(fig)
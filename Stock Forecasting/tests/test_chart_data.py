@@ -0,0 +1,36 @@
+import numpy as np
+
+from chart_data import downsample_indices, lttb_indices
+
+def test_lttb_keeps_ends_and_spikes():
+    values = np.sin(np.linspace(0, 20, 1000))
+    values[377] = 5
+    values[600] = np.nan
+    keep = lttb_indices(values, 100)
+
+    assert keep.size == 100
+    assert keep[0] == 0 and keep[-1] == 999
+    assert (np.diff(keep) > 0).all()
+    assert 377 in keep
+
+def test_lttb_picks_the_largest_triangle():
+    values = np.array([0, 0, 0, 0, 3, 0, 0, -5, 0, 0], dtype = np.float64)
+
+    np.testing.assert_array_equal(lttb_indices(values, 4), [0, 4, 7, 9])
+
+def test_short_series_are_kept():
+    np.testing.assert_array_equal(lttb_indices(np.arange(10), 20), np.arange(10))
+    np.testing.assert_array_equal(downsample_indices(10, 20), np.arange(10))
+
+def test_downsampling_shares_points_across_series():
+    x = np.linspace(0, 10, 2000)
+    small, large = np.sin(x), 1000 * np.cos(x)
+    small[1500] = 3
+    keep = downsample_indices(x.size, 200, [small, large])
+
+    assert keep.size == 200
+    assert 1500 in keep
+    np.testing.assert_array_equal(
+        downsample_indices(x.size, 200),
+        np.unique(np.linspace(0, x.size - 1, 200).round().astype(np.int64))
+    )
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from drawdowns import drawdown_episodes, underwater_summary, worst_episodes
+
+DATES = pd.Series(pd.bdate_range("2024-01-01", periods = 10))
+
+def test_episodes_of_each_symbol():
+    down_from_ath = np.array([0, -5, -10, -10, 0, 0, -3, 0, -20, -15], dtype = np.float64)
+    symbols = pd.Series(['A'] * 6 + ['B'] * 4)
+    episodes = drawdown_episodes(DATES, down_from_ath, symbols)
+
+    assert episodes['Symbol'].tolist() == ['A', 'B', 'B']
+    assert episodes['Peak'].tolist() == [DATES[0], DATES[5], DATES[7]]
+    assert episodes['Trough'].tolist() == [DATES[2], DATES[6], DATES[8]]
+    assert episodes['Depth'].tolist() == [-10, -3, -20]
+    assert episodes['Days to Trough'].tolist() == [2, 1, 1]
+    assert episodes['Days Underwater'].tolist() == [3, 1, 2]
+    assert episodes['Is Open'].tolist() == [False, False, True]
+    assert episodes['Recovery'].iloc[0] == DATES[4]
+    assert pd.isna(episodes['Recovery'].iloc[2])
+    np.testing.assert_array_equal(episodes['Days to Recover'], [2, 1, np.nan])
+
+    assert worst_episodes(episodes, 1)['Depth'].tolist() == [-20]
+
+def test_underwater_summary():
+    episodes = drawdown_episodes(DATES, [0, -5, -12, 0, 0, -4, -2, 0, 0, -1], 'A')
+    summary = underwater_summary(episodes, pd.Series({'A': 10, 'B': 5}))
+
+    assert summary.loc['A', 'Episodes'] == 3
+    assert summary.loc['A', 'Pcnt Underwater'] == 0.5
+    assert summary.loc['A', 'Median Days to Recover'] == 1
+    assert summary.loc['A', 'Current Depth'] == -1
+    assert summary.loc['B'].tolist()[:2] == [0, 0]
@@ -0,0 +1,64 @@
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+from feature_graph import FeatureGraph
+
+GRAPH = FeatureGraph()
+
+class Target:
+    def __init__(self) -> None:
+        self.raw_data = pd.DataFrame({'Close': [1.0, 2.0, 3.0]})
+        self.intermediates = {}
+        self.calls = Counter()
+        self.rendered = []
+
+@GRAPH.feature(outputs = ('Doubled',), inputs = ('Close',))
+def _double(target):
+    target.calls['Doubled'] += 1
+    return {'Doubled': target.raw_data['Close'] * 2}
+
+@GRAPH.feature(outputs = ('Sum', 'Difference'), inputs = ('Close', 'Doubled'))
+def _combine(target):
+    target.calls['Combined'] += 1
+    return {
+        'Sum': target.raw_data['Close'] + target.raw_data['Doubled'],
+        'Difference': target.raw_data['Doubled'] - target.raw_data['Close']
+    }
+
+@GRAPH.feature(outputs = lambda scale: (f'Scaled {scale}',), inputs = ('Sum',), params = ('scale',))
+def _scale(target, scale):
+    target.calls['Scaled'] += 1
+    return {f'Scaled {scale}': target.raw_data['Sum'] * scale}
+
+@GRAPH.report(inputs = ('Difference',))
+def _render(target):
+    target.rendered.append(target.raw_data['Difference'].sum())
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_producers_of_present_outputs_are_skipped(max_workers):
+    target = Target()
+
+    GRAPH.run(target, {'scale': 2}, ['Sum'], max_workers, reports = False)
+    assert target.calls == {'Doubled': 1, 'Combined': 1}
+
+    GRAPH.run(target, {'scale': 2}, ['Sum', 'Scaled 2'], max_workers, reports = False)
+    assert target.calls == {'Doubled': 1, 'Combined': 1, 'Scaled': 1}
+    assert target.raw_data['Scaled 2'].tolist() == [6.0, 12.0, 18.0]
+
+    GRAPH.run(target, {'scale': 3}, None, max_workers)
+    assert target.calls == {'Doubled': 1, 'Combined': 1, 'Scaled': 2}
+    assert target.rendered == [6.0]
+
+def test_partly_present_outputs_are_produced_again():
+    target = Target()
+    GRAPH.run(target, {'scale': 2}, None, reports = False)
+    target.raw_data = target.raw_data.drop(columns = 'Difference')
+
+    GRAPH.run(target, {'scale': 2}, ['Difference'], reports = False)
+    assert target.calls == {'Doubled': 1, 'Combined': 2, 'Scaled': 1}
+
+def test_unknown_output():
+    with pytest.raises(ValueError):
+        GRAPH.run(Target(), {'scale': 2}, ['Missing'], reports = False)
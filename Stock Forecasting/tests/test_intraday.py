@@ -0,0 +1,44 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from intraday import MinuteBarStore, intraday_vwap, resample_bars
+
+def minute_bars(day: str, close: float, volume: int) -> pd.DataFrame:
+    datetimes = pd.date_range(f"{day} 09:15", periods = 30, freq = "min")
+    return pd.DataFrame({
+        'Datetime': datetimes, 'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close, 'Volume': volume
+    })
+
+def test_corrected_file_is_ingested_whatever_its_mtime(tmp_path):
+    minute_dir = tmp_path.joinpath("minute")
+    minute_dir.mkdir()
+    minute_path = minute_dir.joinpath("2024-01-02.csv")
+    minute_bars("2024-01-02", 100, 10).to_csv(minute_path, index = False)
+    store = MinuteBarStore(tmp_path.joinpath("intraday"))
+
+    assert store.ingest(minute_dir) == 1
+    assert store.ingest(minute_dir) == 0
+
+    minute_bars("2024-01-02", 105, 10).to_csv(minute_path, index = False)
+    os.utime(minute_path, (0, 0))
+
+    assert store.ingest(minute_dir) == 1
+    assert (store.read_month("2024-01")['Close'] == 105).all()
+
+def test_resampled_volume_does_not_overflow():
+    bars = minute_bars("2024-01-02", 100, 2 ** 30).astype({'Volume': np.int64})
+    resampled = resample_bars(bars, 15)
+
+    assert resampled['Volume'].tolist() == [15 * 2 ** 30, 15 * 2 ** 30]
+
+def test_session_vwap_restarts_each_session():
+    bars = pd.concat([minute_bars("2024-01-02", 100, 10), minute_bars("2024-01-03", 200, 10)], ignore_index = True)
+    bars.loc[1, 'Volume'] = 30
+    bars.loc[1, ['High', 'Low', 'Close']] = [111, 109, 110]
+    vwap = intraday_vwap(bars)
+
+    assert vwap[0] == 100
+    assert vwap[1] == (100 * 10 + 110 * 30) / 40
+    assert vwap[30] == 200
@@ -0,0 +1,75 @@
+import pandas as pd
+import pytest
+
+from output_writer import OutputWriter
+
+@pytest.mark.parametrize("background", [True, False])
+def test_commit_replaces_files(tmp_path, background):
+    path = tmp_path.joinpath("out", "report.txt")
+    stale_path = tmp_path.joinpath("stale.png")
+    stale_path.write_bytes(b"old")
+
+    with OutputWriter(background = background) as writer:
+        writer.write_text(path, "new")
+        writer.write_parquet(tmp_path.joinpath("data.parquet"), pd.DataFrame({'A': [1, 2]}))
+        writer.remove(stale_path)
+
+        if background:
+            writer.flush()
+            assert not path.exists()
+            assert stale_path.exists()
+
+    assert path.read_text() == "new"
+    assert pd.read_parquet(tmp_path.joinpath("data.parquet"))['A'].tolist() == [1, 2]
+    assert not stale_path.exists()
+    assert list(tmp_path.rglob(".*.tmp")) == []
+
+def test_failed_run_keeps_previous_outputs(tmp_path):
+    path = tmp_path.joinpath("report.txt")
+    path.write_text("old")
+    removed_path = tmp_path.joinpath("chart.png")
+    removed_path.write_bytes(b"old")
+
+    with pytest.raises(RuntimeError):
+        with OutputWriter() as writer:
+            writer.write_text(path, "new")
+            writer.write_text(tmp_path.joinpath("other.txt"), "new")
+            writer.remove(removed_path)
+            raise RuntimeError("Interrupted")
+
+    assert path.read_text() == "old"
+    assert removed_path.exists()
+    assert not tmp_path.joinpath("other.txt").exists()
+    assert list(tmp_path.glob(".*.tmp")) == []
+
+def test_write_errors_surface_before_commit(tmp_path):
+    writer = OutputWriter()
+    target = tmp_path.joinpath("report.txt")
+
+    # A directory in place of the temporary file makes the background write fail.
+    temp_path = writer._temp_path(target)
+    temp_path.mkdir()
+    writer.write_text(target, "new")
+
+    with pytest.raises(OSError):
+        writer.commit()
+
+    temp_path.rmdir()
+    writer.discard()
+    writer.close()
+    assert not target.exists()
+
+def test_remove_stale_keeps_the_current_generation(tmp_path):
+    tmp_path.joinpath("nested").mkdir()
+    stale = [tmp_path.joinpath(".a.txt.deadbeef.tmp"), tmp_path.joinpath("nested", ".b.txt.deadbeef.tmp")]
+
+    for path in stale:
+        path.write_text("")
+
+    writer = OutputWriter(background = False)
+    current = writer.stage(tmp_path.joinpath("c.txt"))
+    current.write_text("")
+
+    assert writer.remove_stale(tmp_path, recursive = False) == 1
+    assert writer.remove_stale(tmp_path) == 1
+    assert current.exists()
@@ -0,0 +1,77 @@
+import shutil
+from math import sqrt
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_process import StockData
+from server import performance_frame
+
+NSE_DATA_DIR = Path(__file__).resolve().parents[2].joinpath("data", "NSE")
+
+@pytest.fixture(scope = "module")
+def stock_data(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp("NSE")
+
+    for symbol in ['TCS', 'NIFTYBEES']:
+        data_dir.joinpath(symbol).mkdir()
+        shutil.copy(NSE_DATA_DIR.joinpath(symbol, "consolidated.parquet"), data_dir.joinpath(symbol))
+
+    benchmark = StockData('NIFTYBEES', data_dir, data_dir, data_dir.joinpath("images"))
+    stock_data = StockData('TCS', data_dir, data_dir, data_dir.joinpath("images"))
+    stock_data.create_features(
+        performance_periods = [],
+        ma_periods = [],
+        sp_ma_periods = [],
+        projection_horizons = [],
+        risk_windows = [],
+        benchmark_returns = benchmark.daily_returns,
+        outputs = [],
+        reports = False
+    )
+    return stock_data, benchmark.daily_returns
+
+def test_reports_match_pandas_on_random_ranges(stock_data):
+    stock_data, benchmark_returns = stock_data
+    stock_df = stock_data.raw_data
+    rng = np.random.default_rng(2)
+
+    for _ in range(25):
+        start_date, end_date = np.sort(rng.choice(stock_df['Date'], 2, replace = False))
+        period = stock_df[(stock_df['Date'] >= start_date) & (stock_df['Date'] <= end_date)]
+        returns = (period['Close'] / period['Prev Close']) - 1
+        joint = pd.DataFrame({
+            'Stock': returns.to_numpy(),
+            'Benchmark': benchmark_returns.reindex(period['Date']).to_numpy()
+        }).dropna()
+        volatility = returns.std() * sqrt(252)
+
+        report = stock_data.performance_report_between(start_date, end_date)
+
+        assert report.period_size == len(period)
+        assert report.start_date == period['Date'].iloc[0].date()
+        assert report.net_returns == pytest.approx((period['Close'].iloc[-1] / period['Prev Close'].iloc[0]) - 1)
+        assert report.median_close == pytest.approx(period['Close'].median())
+        assert report.lowest_close == pytest.approx(period['Close'].min())
+        assert report.hightest_close == pytest.approx(period['Close'].max())
+        assert report.mean_value == pytest.approx(period['Value'].mean())
+        assert report.volatility == pytest.approx(volatility)
+        assert report.sharpe_ratio == pytest.approx(returns.mean() * 252 / volatility)
+        assert report.sortino_ratio == pytest.approx(
+            returns.mean() * 252 / (sqrt((returns.clip(upper = 0) ** 2).mean()) * sqrt(252))
+        )
+        assert report.max_drawdown == pytest.approx(((period['Close'] / period['Close'].cummax()) - 1).min())
+        assert report.beta == pytest.approx(joint['Stock'].cov(joint['Benchmark']) / joint['Benchmark'].var())
+
+def test_performance_frame_between_dates(stock_data):
+    stock_data, _ = stock_data
+    sessions = stock_data.calendar.sessions
+
+    whole = performance_frame(stock_data, end = f"{sessions[-1]:%Y-%m-%d}")
+    assert whole['period_size'].tolist() == [len(sessions)]
+    assert len(performance_frame(stock_data)) > 1
+
+    with pytest.raises(ValueError):
+        performance_frame(stock_data, start = "2100-01-01")
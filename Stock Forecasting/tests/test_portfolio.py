@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio import Portfolio, holding_units, mean_variance_weights, min_variance_weights, price_index
+
+DATES = pd.bdate_range("2024-01-01", periods = 5)
+
+def prices_with_split() -> tuple[pd.DataFrame, pd.DataFrame]:
+    # TCS splits 2:1 before the third session, ITC trades flat at 290.
+    closes = pd.DataFrame({'TCS': [100.0, 110, 55, 60, 66], 'ITC': [290.0] * 5}, index = DATES)
+    prev_closes = pd.DataFrame({'TCS': [100.0, 100, 55, 55, 60], 'ITC': [290.0] * 5}, index = DATES)
+    return closes, (closes / prev_closes) - 1
+
+def test_buy_partial_sell_and_deferred_transaction():
+    closes, returns = prices_with_split()
+    transactions = pd.DataFrame({
+        'Date': pd.to_datetime(["2024-01-01", "2024-01-04", "2024-02-01"]),
+        'Symbol': ['TCS', 'TCS', 'ITC'],
+        'Quantity': [10, -4, 5],
+        'Price': [98.0, 61, 2000]
+    })
+
+    portfolio = Portfolio(transactions, closes, returns)
+    report = portfolio.holdings_report()
+
+    # 10 shares become 20 after the split, 4 are sold and 16 are valued at the last close.
+    assert report.loc['TCS', 'Value'] == pytest.approx(16 * 66)
+    assert report.loc['TCS', 'Cost'] == pytest.approx(980 * 0.8)
+    assert report.loc['TCS', 'Realised Gain'] == pytest.approx((4 * 61) - (980 * 0.2))
+    assert report.loc['ITC', 'Value'] == 0
+    assert portfolio.pending['Symbol'].tolist() == ['ITC']
+
+def test_values_ignore_trade_price():
+    closes, returns = prices_with_split()
+    transactions = pd.DataFrame({
+        'Date': pd.to_datetime(["2024-01-02", "2024-01-03"]),
+        'Symbol': ['TCS', 'ITC'],
+        'Quantity': [5, 5],
+        'Price': [1.0, 2000]
+    })
+
+    units = holding_units(transactions, closes, price_index(returns))
+    values = units * price_index(returns)
+
+    np.testing.assert_allclose(values['TCS'], [0, 5 * 110, 10 * 55, 10 * 60, 10 * 66])
+    np.testing.assert_allclose(values['ITC'], [0, 0, 5 * 290, 5 * 290, 5 * 290])
+
+def test_rejects_transactions_before_the_data():
+    closes, returns = prices_with_split()
+    transactions = pd.DataFrame({
+        'Date': pd.to_datetime(["2023-12-01"]),
+        'Symbol': ['TCS'],
+        'Quantity': [5]
+    })
+
+    with pytest.raises(ValueError):
+        holding_units(transactions, closes, price_index(returns))
+
+def random_problem(seed: int) -> tuple[pd.Series, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    factors = rng.normal(size = (8, 8))
+    covariance = factors @ factors.T / 8 + np.diag(rng.uniform(0.01, 0.1, 8))
+    names = [f"S{i}" for i in range(8)]
+    return pd.Series(rng.normal(0.1, 0.3, 8), index = names), pd.DataFrame(covariance, index = names, columns = names)
+
+@pytest.mark.parametrize("seed", range(5))
+def test_long_only_weights_match_a_generic_solver(seed):
+    optimize = pytest.importorskip("scipy.optimize")
+    expected_returns, covariance = random_problem(seed)
+    mu, cov = expected_returns.to_numpy(), covariance.to_numpy()
+
+    for risk_aversion in (0.5, 5.0):
+        weights = mean_variance_weights(expected_returns, covariance, risk_aversion)
+        objective = lambda w: risk_aversion / 2 * w @ cov @ w - mu @ w
+        reference = optimize.minimize(
+            objective, np.full(8, 1 / 8), method = 'SLSQP', bounds = [(0, None)] * 8,
+            constraints = {'type': 'eq', 'fun': lambda w: w.sum() - 1}, options = {'ftol': 1e-12}
+        )
+
+        assert weights.sum() == pytest.approx(1)
+        assert weights.min() >= 0
+        assert objective(weights.to_numpy()) <= reference.fun + 1e-8
+
+def test_unconstrained_weights_solve_the_budget_problem():
+    expected_returns, covariance = random_problem(0)
+    weights = min_variance_weights(covariance, long_only = False).to_numpy()
+    inv_ones = np.linalg.solve(covariance.to_numpy(), np.ones(8))
+
+    np.testing.assert_allclose(weights, inv_ones / inv_ones.sum())
+    assert min_variance_weights(covariance).min() >= 0
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from range_index import DrawdownIndex, FenwickTree, PrefixMoments, PrefixSum, SparseTable, WaveletMatrix
+
+RNG = np.random.default_rng(4)
+VALUES = 100 * np.exp(np.cumsum(RNG.normal(0, 0.02, 300)))
+RANGES = [tuple(sorted(RNG.choice(VALUES.size + 1, 2, replace = False))) for _ in range(200)]
+
+def test_prefix_sums_skip_nan():
+    values = VALUES.copy()
+    values[::7] = np.nan
+    sums = PrefixSum(values)
+
+    for start, end in RANGES:
+        window = values[start:end]
+        assert sums.sum(start, end) == pytest.approx(np.nansum(window))
+        assert sums.count(start, end) == (~np.isnan(window)).sum()
+        assert sums.mean(start, end) == pytest.approx(np.nanmean(window), nan_ok = True)
+
+def test_prefix_moments_match_pandas():
+    x = pd.Series(VALUES).pct_change().to_numpy()
+    y = x * 0.5 + RNG.normal(0, 0.01, x.size)
+    y[::11] = np.nan
+    moments = PrefixMoments(x, y)
+    x_moments = PrefixMoments(x)
+
+    assert np.isnan(x_moments.variance(5, 6))
+
+    for start, end in RANGES:
+        if end - start < 3:
+            continue
+
+        joint = pd.DataFrame({'x': x[start:end], 'y': y[start:end]}).dropna()
+        assert moments.covariance(start, end) == pytest.approx(joint['x'].cov(joint['y']), nan_ok = True, abs = 1e-15)
+        assert x_moments.variance(start, end) == pytest.approx(pd.Series(x[start:end]).var(), nan_ok = True, abs = 1e-15)
+
+def test_sparse_table_extremes():
+    lows = SparseTable(VALUES, np.fmin)
+    highs = SparseTable(VALUES, np.fmax)
+
+    for start, end in RANGES:
+        assert lows.query(start, end) == VALUES[start:end].min()
+        assert highs.query(start, end) == VALUES[start:end].max()
+
+def test_drawdown_index_matches_brute_force():
+    drawdowns = DrawdownIndex(VALUES)
+
+    for start, end in RANGES:
+        window = VALUES[start:end]
+        assert drawdowns.query(start, end) == pytest.approx(((window / np.maximum.accumulate(window)) - 1).min())
+
+def test_wavelet_matrix_order_statistics():
+    values = RNG.integers(0, 20, 300).astype(np.float64)
+    matrix = WaveletMatrix(values)
+
+    for start, end in RANGES:
+        window = np.sort(values[start:end])
+        k = (end - start) // 3
+        assert matrix.kth_smallest(start, end, k) == window[k]
+        assert matrix.median(start, end) == np.median(window)
+
+def test_fenwick_tree_prefix_sums():
+    counts = RNG.integers(0, 5, 50)
+    tree = FenwickTree(counts.size)
+
+    for index, count in enumerate(counts):
+        tree.add(index, int(count))
+
+    tree.add(10, -int(counts[10]))
+    counts[10] = 0
+
+    assert [tree.prefix_sum(end) for end in range(counts.size + 1)] == [0, *np.cumsum(counts).tolist()]
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from rolling import calendar_window_starts, rolling_max, rolling_min, rolling_quantiles, window_starts
+
+def random_values(size: int = 500) -> np.ndarray:
+    rng = np.random.default_rng(3)
+    values = rng.normal(size = size)
+    values[rng.integers(0, size, size // 20)] = np.nan
+    return values
+
+def brute_force(values: np.ndarray, starts: np.ndarray, func) -> np.ndarray:
+    return np.array([
+        func(values[start:end]) if (~np.isnan(values[start:end])).any() else np.nan
+        for start, end in zip(starts, range(1, values.size + 1))
+    ])
+
+def test_rolling_extremes_match_brute_force():
+    values = random_values()
+    starts = window_starts(values.size, 20)
+
+    np.testing.assert_array_equal(rolling_max(values, 20), brute_force(values, starts, np.nanmax))
+    np.testing.assert_array_equal(rolling_min(values, 20), brute_force(values, starts, np.nanmin))
+
+def test_rolling_quantiles_match_brute_force():
+    values = random_values()
+    dates = pd.Series(pd.bdate_range("2024-01-01", periods = values.size))
+
+    for window in [50, calendar_window_starts(dates, pd.Timedelta(days = 30))]:
+        starts = window_starts(values.size, window) if np.isscalar(window) else window
+        lower, upper = rolling_quantiles(values, window, [0.1, 0.9])
+
+        np.testing.assert_allclose(lower, brute_force(values, starts, lambda v: np.nanquantile(v, 0.1)))
+        np.testing.assert_allclose(upper, brute_force(values, starts, lambda v: np.nanquantile(v, 0.9)))
+
+def test_rolling_quantiles_min_periods():
+    lower, = rolling_quantiles(np.array([1.0, np.nan, 2, 3]), 2, [0.5], min_periods = 2)
+
+    np.testing.assert_array_equal(lower, [np.nan, np.nan, np.nan, 2.5])
+
+def test_calendar_window_starts():
+    dates = pd.Series(pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-05", "2024-01-09"]))
+
+    np.testing.assert_array_equal(calendar_window_starts(dates, pd.Timedelta(days = 4)), [0, 0, 1, 3])
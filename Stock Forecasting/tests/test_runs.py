@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from runs import run_length_encode
+
+def test_runs_of_values():
+    runs = run_length_encode(np.array([1, 1, 0, 0, 0, 1, 0, 0, 0, 0]))
+
+    np.testing.assert_array_equal(runs.starts, [0, 2, 5, 6])
+    np.testing.assert_array_equal(runs.lengths, [2, 3, 1, 4])
+    np.testing.assert_array_equal(runs.ends, [1, 4, 5, 9])
+    np.testing.assert_array_equal(runs.values, [1, 0, 1, 0])
+    np.testing.assert_array_equal(runs.run_ids, [0, 0, 1, 1, 1, 2, 3, 3, 3, 3])
+    np.testing.assert_array_equal(runs.positions, [1, 2, 1, 2, 3, 1, 1, 2, 3, 4])
+
+def test_continuation_and_longest_runs():
+    runs = run_length_encode(np.array([True, True, False, False, False, True, False, False]))
+
+    # Of the 0 runs at least 2 long (3 and 2), only the run of 3 went on.
+    assert runs.continuation_prob() == 0.5
+    assert runs.continuation_prob(0) == 0.0
+    assert runs.longest() == 1
+    assert runs.longest(True) == 0
+
+def test_span_dates():
+    dates = pd.Series(pd.bdate_range("2024-01-01", periods = 5))
+    runs = run_length_encode(pd.Series([3, 3, 3, 4, 4]))
+
+    assert runs.span(0, dates) == (3, dates[0], dates[2])
+
+def test_empty():
+    runs = run_length_encode(np.array([]))
+
+    assert len(runs) == 0
+    assert runs.ends.size == 0
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from seasonality import seasonality_stats
+
+def test_bucket_stats_match_direct_groupby():
+    rng = np.random.default_rng(1)
+    dates = pd.bdate_range("2023-01-02", "2024-12-31")
+    returns = pd.concat([
+        pd.DataFrame({'Symbol': symbol, 'Date': dates, 'Return': rng.normal(0, 0.01, len(dates))})
+        for symbol in ['A', 'B']
+    ], ignore_index = True)
+    returns.loc[5, 'Return'] = np.nan
+
+    stats = seasonality_stats(returns).set_index(['Symbol', 'Bucket Type', 'Bucket'])
+    valid = returns.dropna()
+
+    for (symbol, weekday), group in valid.groupby(['Symbol', valid['Date'].dt.day_name()]):
+        row = stats.loc[(symbol, 'Weekday', weekday)]
+        assert row['Days'] == len(group)
+        assert row['Mean'] == pytest.approx(group['Return'].mean())
+        assert row['Median'] == pytest.approx(group['Return'].median())
+        assert row['Hit Rate'] == pytest.approx((group['Return'] > 0).mean())
+        assert row['T-Stat'] == pytest.approx(group['Return'].mean() / group['Return'].sem())
+
+    assert stats.loc[('A', 'Month', 'March'), 'Days'] == ((valid['Symbol'] == 'A') & (valid['Date'].dt.month == 3)).sum()
+    assert stats.xs('Turn of month', level = 'Bucket Type')['Days'].groupby('Symbol').sum().tolist() == [len(dates) - 1, len(dates)]
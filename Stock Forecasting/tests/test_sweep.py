@@ -0,0 +1,20 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from metrics import spearman_over_ma
+from server import FEATURE_PARAMS
+from sweep import CURRENT_WINDOW_SETS, window_set_scores
+
+NSE_DATA_DIR = Path(__file__).resolve().parents[2].joinpath("data", "NSE")
+
+def test_sweep_reproduces_report_scores():
+    close = pd.read_parquet(NSE_DATA_DIR.joinpath("TCS", "consolidated.parquet"), columns = ['Close'])['Close']
+    # Flat runs make moving averages tie, which is where the two could disagree.
+    close = pd.concat([close, pd.Series([close.iloc[-1]] * 30)], ignore_index = True)
+
+    assert [tuple(windows) for windows in FEATURE_PARAMS['sp_ma_periods']] == CURRENT_WINDOW_SETS
+
+    for windows, scores in zip(CURRENT_WINDOW_SETS, window_set_scores(close.to_numpy(), CURRENT_WINDOW_SETS)):
+        np.testing.assert_array_equal(scores, spearman_over_ma(close, list(windows)).to_numpy())
@@ -0,0 +1,35 @@
+import pandas as pd
+
+from trading_calendar import TradingCalendar
+from validation import validate_history
+
+SESSIONS = pd.bdate_range("2024-01-01", "2024-02-29").drop(pd.to_datetime(["2024-01-22", "2024-01-26"]))
+
+def history(dates: pd.DatetimeIndex) -> pd.DataFrame:
+    return pd.DataFrame({
+        'Date': dates, 'Open': 10.0, 'High': 11.0, 'Low': 9.0, 'Close': 10.0, 'Prev Close': 10.0, 'Volume': 100
+    })
+
+def test_observed_sessions_leave_out_holidays(tmp_path):
+    tmp_path.joinpath("OTHER").mkdir()
+    history(SESSIONS).to_parquet(tmp_path.joinpath("OTHER", "consolidated.parquet"))
+    dates = SESSIONS.drop(SESSIONS[10:13])
+
+    reference = TradingCalendar.observed(tmp_path, dates)
+    gaps = TradingCalendar(dates).gaps(reference)
+
+    assert len(reference) == len(SESSIONS)
+    assert gaps.to_dict('records') == [{'Start': SESSIONS[10], 'End': SESSIONS[12], 'Missing Sessions': 3}]
+
+def test_validation_reports_gaps_against_the_reference():
+    dates = SESSIONS.drop(SESSIONS[30:34])
+    issues = validate_history(history(dates), 'TEST', TradingCalendar(SESSIONS))
+
+    assert issues['Check'].tolist() == ['Calendar gap']
+    assert issues['Detail'].tolist() == [f"4 sessions missing until {SESSIONS[33]:%Y-%m-%d}"]
+
+def test_session_range():
+    calendar = TradingCalendar(SESSIONS)
+
+    assert calendar.session_range("2024-01-20", "2024-01-23") == (15, 16)
+    assert calendar.session_range("2024-03-01", "2024-03-05") == (len(SESSIONS), len(SESSIONS))
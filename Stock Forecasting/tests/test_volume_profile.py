@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from volume_profile import FINE_BINS, VolumeProfile
+
+def test_windows_match_direct_binning():
+    rng = np.random.default_rng(0)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 2000)))
+    volumes = rng.integers(1, 1000, prices.size).astype(np.float64)
+    profile = VolumeProfile(prices, volumes)
+
+    for start, end in [(1979, 2000), (1874, 2000), (0, 2000), (250, 900)]:
+        edges, volume = profile.histogram(start, end)
+        direct_edges = np.linspace(prices[start:end].min(), prices[start:end].max(), profile.num_bins + 1)
+        direct_bins = np.clip(np.searchsorted(direct_edges, prices[start:end], side = 'right') - 1, 0, profile.num_bins - 1)
+        direct_volume = np.bincount(direct_bins, weights = volumes[start:end], minlength = profile.num_bins)
+
+        centres = (edges[:-1] + edges[1:]) / 2
+        fine_width = (prices.max() - prices.min()) / FINE_BINS
+
+        np.testing.assert_allclose(edges, direct_edges)
+        assert volume.sum() == pytest.approx(direct_volume.sum())
+        assert np.average(centres, weights = volume) == pytest.approx(
+            np.average(centres, weights = direct_volume), abs = np.diff(edges)[0] + fine_width
+        )
+
+def test_window_without_volume():
+    profile = VolumeProfile(np.array([10.0, 11, np.nan, 12]), np.array([5.0, 0, 3, 0]))
+
+    assert np.isnan(profile.point_of_control(1, 4))
+    assert 10 <= profile.point_of_control(0, 1) <= 11
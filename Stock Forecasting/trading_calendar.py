@@ -0,0 +1,52 @@
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from runs import run_length_encode
+
+class TradingCalendar:
+    def __init__(self, sessions: Iterable) -> None:
+        sessions = pd.DatetimeIndex(sessions).normalize()
+
+        if not sessions.is_monotonic_increasing:
+            sessions = sessions.sort_values()
+
+        self.sessions = sessions.unique()
+        self._session_days = self.sessions.to_numpy(dtype = 'datetime64[D]')
+
+    # Sessions any saved history traded on, so exchange holidays are left out
+    # without keeping a list of them.
+    @classmethod
+    def observed(cls, stock_data_dir: Path, sessions: Iterable = ()) -> "TradingCalendar":
+        return cls(pd.DatetimeIndex(sessions).append([
+            pd.DatetimeIndex(pd.read_parquet(path, columns = ['Date'])['Date'])
+            for path in stock_data_dir.glob("*/consolidated.parquet")
+        ]))
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def position_on_or_after(self, day) -> int:
+        return int(np.searchsorted(self._session_days, np.datetime64(day, 'D'), side = 'left'))
+
+    def position_on_or_before(self, day) -> int:
+        return int(np.searchsorted(self._session_days, np.datetime64(day, 'D'), side = 'right')) - 1
+
+    def session_range(self, start, end) -> tuple[int, int]:
+        return self.position_on_or_after(start), self.position_on_or_before(end) + 1
+
+    def gaps(self, reference: "TradingCalendar") -> pd.DataFrame:
+        start, end = reference.session_range(self.sessions[0], self.sessions[-1]) if len(self) else (0, 0)
+        expected = reference.sessions[start:end]
+        runs = run_length_encode(
+            ~np.isin(expected.to_numpy(dtype = 'datetime64[D]'), self._session_days)
+        )
+        gap_runs = np.flatnonzero(runs.values)
+
+        return pd.DataFrame({
+            'Start': expected[runs.starts[gap_runs]],
+            'End': expected[runs.ends[gap_runs]],
+            'Missing Sessions': runs.lengths[gap_runs]
+        })
@@ -3,6 +3,8 @@ from enum import IntEnum
 from pathlib import Path
 from math import log, floor
 
+from chart_data import CHART_MODES
+
 class PerfPeriods(IntEnum):
     VERY_SHORT = 5
     SHORT = 15
@@ -11,6 +13,7 @@ class PerfPeriods(IntEnum):
     VERY_LONG = 1000
 
 PLOT_PERIOD = PerfPeriods.VERY_LONG // 2
+PLOT_POINTS = PerfPeriods.VERY_LONG
 
 class Config:
     def __init__(self, config_path: Path) -> None:
@@ -27,6 +30,11 @@ class Config:
             f"{self.COMPANY_DATA_DIR = } | Valid: {self.COMPANY_DATA_DIR.exists() & self.COMPANY_DATA_DIR.is_dir()}"
         )
 
+        self.CACHE_DIR = Path(conf_dict['cache_dir'])
+        print(
+            f"{self.CACHE_DIR = } | Valid: {self.CACHE_DIR.exists() & self.CACHE_DIR.is_dir()}"
+        )
+
         self.INDEX_TEMPLATE = Path(conf_dict['index_template'])
         print(
             f"{self.INDEX_TEMPLATE = } | Valid: {self.INDEX_TEMPLATE.exists() & self.INDEX_TEMPLATE.is_file()}"
@@ -52,6 +60,31 @@ class Config:
             f"{self.IMAGES_OUT_DIR = } | Valid: {self.IMAGES_OUT_DIR.exists() & self.IMAGES_OUT_DIR.is_dir()}"
         )
 
+        self.INTERACTIVE_DATA_DIR = Path(conf_dict['index_path']).joinpath("web", "interactive", "public")
+        print(
+            f"{self.INTERACTIVE_DATA_DIR = } | Valid: {self.INTERACTIVE_DATA_DIR.exists() & self.INTERACTIVE_DATA_DIR.is_dir()}"
+        )
+
+        self.BENCHMARK_SYMBOL = conf_dict['benchmark_symbol']
+        print(
+            f"{self.BENCHMARK_SYMBOL = } | Valid: {self.NSE_DATA_DIR.joinpath(self.BENCHMARK_SYMBOL).is_dir()}"
+        )
+
+        self.MEMORY_BUDGET = int(conf_dict['memory_budget_mb']) * 2 ** 20
+        print(
+            f"{self.MEMORY_BUDGET = } | Valid: {self.MEMORY_BUDGET > 0}"
+        )
+
+        self.CHART_MODE = conf_dict['chart_mode']
+        print(
+            f"{self.CHART_MODE = } | Valid: {self.CHART_MODE in CHART_MODES}"
+        )
+
+        self.FEATURE_WORKERS = int(conf_dict['feature_workers'])
+        print(
+            f"{self.FEATURE_WORKERS = } | Valid: {self.FEATURE_WORKERS > 0}"
+        )
+
         self.RANDOM_STATE = 7
 
     def get_all_stock_symbols(self):
@@ -0,0 +1,118 @@
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+from trading_calendar import TradingCalendar
+
+DATA_ISSUES_FILE = "data_issues.parquet"
+ISSUE_COLUMNS = ['Symbol', 'Date', 'Check', 'Detail']
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+def _issues(symbol: str, checks: list[tuple[pd.Series, str, Iterable[str]]]) -> pd.DataFrame:
+    return pd.DataFrame({
+        'Symbol': symbol,
+        'Date': np.concatenate([dates.to_numpy(dtype = 'datetime64[ns]') for dates, _, _ in checks]),
+        'Check': np.repeat([check for _, check, _ in checks], [len(dates) for dates, _, _ in checks]),
+        'Detail': [detail for _, _, details in checks for detail in details]
+    }, columns = ISSUE_COLUMNS)
+
+def unvalidated_issues(symbol: str) -> pd.DataFrame:
+    return pd.DataFrame({
+        'Symbol': [symbol],
+        'Date': pd.Series([pd.NaT], dtype = 'datetime64[ns]'),
+        'Check': ['Not validated'],
+        'Detail': ['Consolidated history was saved without data issues and its source files are missing']
+    }, columns = ISSUE_COLUMNS)
+
+def concat_issues(issues: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    issues = [df for df in issues if len(df)]
+
+    if not issues:
+        return pd.DataFrame(columns = ISSUE_COLUMNS).astype({'Date': 'datetime64[ns]'})
+
+    return pd.concat(issues, ignore_index = True).sort_values(['Symbol', 'Date'], kind = 'stable', ignore_index = True)
+
+def drop_duplicate_dates(hist_df: pd.DataFrame, symbol: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    hist_df = hist_df.sort_values('Date', kind = 'stable').drop_duplicates(keep = 'first')
+    conflicts = hist_df[hist_df['Date'].duplicated(keep = False)].groupby('Date')
+    differing = conflicts.nunique(dropna = False).gt(1)
+
+    issues = _issues(symbol, [(
+        differing.index.to_series(),
+        'Duplicate date',
+        [
+            f"{count} records differing in {', '.join(differing.columns[row])}"
+            for count, row in zip(conflicts.size(), differing.to_numpy())
+        ]
+    )])
+
+    return hist_df.drop_duplicates('Date', keep = 'first').reset_index(drop = True), issues
+
+def validate_history(
+    hist_df: pd.DataFrame,
+    symbol: str,
+    reference: TradingCalendar,
+    split_multipliers: Iterable[float] = (),
+    tolerance: float = 0.005,
+    min_gap_sessions: int = 3
+) -> pd.DataFrame:
+    dates = hist_df['Date']
+    prices = hist_df[PRICE_COLUMNS]
+    high, low, close = hist_df['High'], hist_df['Low'], hist_df['Close']
+    checks = []
+
+    is_missing = (prices.isna() | (prices <= 0)).to_numpy()
+    has_missing = is_missing.any(axis = 1)
+    checks.append((
+        dates[has_missing], 'Missing price',
+        (', '.join(np.array(PRICE_COLUMNS)[row]) for row in is_missing[has_missing])
+    ))
+
+    is_inverted = high < low
+    checks.append((
+        dates[is_inverted], 'High below Low',
+        (f"High {h} < Low {l}" for h, l in zip(high[is_inverted], low[is_inverted]))
+    ))
+
+    for col in ['Open', 'Close']:
+        is_outside = ~is_inverted & ((hist_df[col] > high) | (hist_df[col] < low))
+        checks.append((
+            dates[is_outside], f'{col} outside range',
+            (
+                f"{col} {price} outside {l} - {h}"
+                for price, l, h in zip(hist_df[col][is_outside], low[is_outside], high[is_outside])
+            )
+        ))
+
+    is_untraded = hist_df['Volume'] == 0
+    checks.append((dates[is_untraded], 'Zero volume', ["No shares traded"] * is_untraded.sum()))
+
+    # Prev Close is adjusted by the exchange on the ex-date of a split or
+    # bonus, so a jump by one of the known multipliers is expected.
+    prior_close = close.shift(1)
+    log_ratio = np.log(hist_df['Prev Close'] / prior_close).to_numpy()
+    split_log_ratios = -np.log(np.append(np.asarray(list(split_multipliers), dtype = np.float64), 1.0))
+    is_mismatch = (np.abs(log_ratio[:, None] - split_log_ratios[None, :]) > tolerance).all(axis = 1)
+    is_mismatch &= ~np.isnan(log_ratio)
+    checks.append((
+        dates[is_mismatch], 'Prev Close mismatch',
+        (
+            f"Prev Close {prev} vs prior Close {prior} ({np.exp(ratio):.4f}x)"
+            for prev, prior, ratio in zip(
+                hist_df['Prev Close'][is_mismatch], prior_close[is_mismatch], log_ratio[is_mismatch]
+            )
+        )
+    ))
+
+    gaps = TradingCalendar(dates).gaps(reference)
+    gaps = gaps[gaps['Missing Sessions'] >= min_gap_sessions]
+    checks.append((
+        gaps['Start'], 'Calendar gap',
+        (f"{n} sessions missing until {end:%Y-%m-%d}" for n, end in zip(gaps['Missing Sessions'], gaps['End']))
+    ))
+
+    return _issues(symbol, checks).sort_values('Date', kind = 'stable', ignore_index = True)
+
+def summarize_issues(issues: pd.DataFrame) -> str:
+    return ", ".join(f"{count} {check}" for check, count in issues['Check'].value_counts(sort = False).items())
@@ -0,0 +1,82 @@
+import numpy as np
+
+from range_index import SparseTable
+
+PROFILE_WINDOWS = {"1 Month": 21, "6 Months": 126, "All time": None}
+PROFILE_BINS = 100
+FINE_BINS = 1000
+
+class VolumeProfile:
+    def __init__(
+        self,
+        prices: np.ndarray,
+        volumes: np.ndarray,
+        num_bins: int = PROFILE_BINS,
+        fine_bins: int = FINE_BINS
+    ) -> None:
+        prices = np.asarray(prices, dtype = np.float64)
+        volumes = np.nan_to_num(np.asarray(volumes, dtype = np.float64))
+        is_valid = ~np.isnan(prices)
+        self.num_bins = num_bins
+
+        self._lows = SparseTable(prices, np.fmin)
+        self._highs = SparseTable(prices, np.fmax)
+
+        # Volume is accumulated over time in fine bins spanning the whole
+        # history, so a window's volume is the difference of two prefix rows.
+        low, high = (prices[is_valid].min(), prices[is_valid].max()) if is_valid.any() else (0.0, 1.0)
+        self._fine_edges = np.linspace(low, high if high > low else low + 1, fine_bins + 1)
+        bins = np.clip(np.searchsorted(self._fine_edges, prices[is_valid], side = 'right') - 1, 0, fine_bins - 1)
+
+        self._cumulative_volume = np.zeros((prices.size + 1, fine_bins))
+        self._cumulative_volume[np.flatnonzero(is_valid) + 1, bins] = volumes[is_valid]
+        np.cumsum(self._cumulative_volume, axis = 0, out = self._cumulative_volume)
+
+    # Each window is binned between its own lowest and highest price, so a bin
+    # spans 1 / num_bins of the window's price range rather than of the whole
+    # history. The fine bins are split across the window's bins assuming their
+    # volume is spread evenly, and those holding the window's extremes are kept
+    # whole in its first and last bins.
+    def histogram(self, start: int, end: int) -> tuple[np.ndarray, np.ndarray]:
+        low, high = (self._lows.query(start, end), self._highs.query(start, end)) if end > start else (np.nan, np.nan)
+
+        if np.isnan(low):
+            low, high = 0.0, 1.0
+
+        edges = np.linspace(low, high if high > low else low + 1, self.num_bins + 1)
+        fine_volume = self._cumulative_volume[end] - self._cumulative_volume[start]
+        cumulative = np.interp(edges[1:-1], self._fine_edges, np.concatenate(([0.0], np.cumsum(fine_volume))))
+
+        return edges, np.diff(np.concatenate(([0.0], cumulative, [fine_volume.sum()])))
+
+    def point_of_control(self, start: int, end: int) -> float:
+        edges, volume = self.histogram(start, end)
+
+        if not volume.any():
+            return np.nan
+
+        poc = int(np.argmax(volume))
+        return (edges[poc] + edges[poc + 1]) / 2
+
+    def value_area(self, start: int, end: int, coverage: float = 0.7) -> tuple[float, float]:
+        edges, volume = self.histogram(start, end)
+
+        if not volume.any():
+            return np.nan, np.nan
+
+        target = volume.sum() * coverage
+        low = high = int(np.argmax(volume))
+        covered = volume[low]
+
+        while covered < target:
+            below = volume[low - 1] if low > 0 else -1
+            above = volume[high + 1] if high < volume.size - 1 else -1
+
+            if above >= below:
+                high += 1
+                covered += above
+            else:
+                low -= 1
+                covered += below
+
+        return edges[low], edges[high + 1]
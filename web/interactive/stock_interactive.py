@@ -13,12 +13,90 @@ def _():
 
 @app.cell
 def _(mo):
-    STOCK_SYMBOLS = [
-        'ADANIPOWER', 'BHARTIARTL', 'BSOFT', 'DEEPAKFERT', 'DLF', 'GOKULAGRO', 'GOLDBEES', 'HAL', 'HDFCBANK', 'HDFCSML250', 'ICICIBANK', 'INDIGO', 'INDIGOPNTS', 'INFY', 'IRCTC', 'ITBEES', 'ITC', 'JSWSTEEL', 'JUBLFOOD', 'JUNIORBEES', 'LIQUIDCASE', 'MARUTI', 'MID150BEES', 'MON100', 'NH', 'NIFTYBEES', 'PAGEIND', 'RBA', 'SILVERBEES', 'TANLA', 'TCS', 'TMPV', 'VEDL', 'WAAREEENER'
-    ]
+    import sys
+    from functools import lru_cache
+    from math import sqrt
+
+    import numpy as np
+    import pandas as pd
+    from matplotlib import pyplot as plt
+
+    sys.path.append(str(mo.notebook_dir().parents[1] / "Stock Forecasting"))
+    from volume_profile import VolumeProfile
+
+    DATA_DIR = mo.notebook_location() / "public"
+    TRADING_DAYS = 252
+    return DATA_DIR, TRADING_DAYS, VolumeProfile, lru_cache, np, pd, plt, sqrt
+
+
+@app.cell
+def _(DATA_DIR, pd):
+    manifest = pd.read_json(str(DATA_DIR / "manifest.json")).set_index("symbol")
+    return (manifest,)
+
+
+@app.cell
+def _(DATA_DIR, TRADING_DAYS, VolumeProfile, lru_cache, np, pd, sqrt):
+    @lru_cache(maxsize = 16)
+    def load_symbol(symbol):
+        return pd.read_csv(str(DATA_DIR / "data" / f"{symbol}.csv"), parse_dates = ["Date"])
+
+    @lru_cache(maxsize = 16)
+    def load_volume_profile(symbol):
+        stock_df = load_symbol(symbol)
+        return VolumeProfile(stock_df["VWAP"].to_numpy(), stock_df["Volume"].to_numpy())
+
+    def volume_profile(symbol, start, end):
+        dates = load_symbol(symbol)["Date"]
+        return load_volume_profile(symbol).histogram(
+            dates.searchsorted(pd.Timestamp(start), side = "left"),
+            dates.searchsorted(pd.Timestamp(end), side = "right")
+        )
+
+    @lru_cache(maxsize = 64)
+    def compute_view(symbol, start, end, ma_periods, window):
+        stock_df = load_symbol(symbol)
+        returns = (stock_df["Close"] / stock_df["Prev Close"]) - 1
+        view = stock_df[["Date", "Close"]].copy()
+
+        for period in ma_periods:
+            view[f"MA {period} days"] = stock_df["Close"].rolling(window = period, min_periods = 1).mean()
+
+        view[f"% Net Returns {window} days"] = (
+            (stock_df["Close"] / stock_df["Prev Close"].shift(window - 1)) - 1
+        ) * 100
+        view[f"% Rolling Volatility {window} days"] = (
+            returns.rolling(window = window, min_periods = 2).std() * sqrt(TRADING_DAYS) * 100
+        )
+
+        in_range = (view["Date"] >= pd.Timestamp(start)) & (view["Date"] <= pd.Timestamp(end))
+        view = view[in_range].reset_index(drop = True)
+        view["% Down from High"] = ((view["Close"] / view["Close"].cummax()) - 1) * 100
+        period_returns = returns[in_range].to_numpy()
+        summary = pd.DataFrame({
+            "Metric": [
+                "Trading days", "Net return", "Annualized volatility",
+                "Max drawdown", "Highest Close", "Lowest Close"
+            ],
+            "Value": [
+                f"{len(view)}",
+                f"{(view['Close'].iloc[-1] / view['Close'].iloc[0]) - 1:.2%}" if len(view) else "-",
+                f"{np.nanstd(period_returns, ddof = 1) * sqrt(TRADING_DAYS):.2%}" if len(view) > 1 else "-",
+                f"{view['% Down from High'].min() / 100:.2%}" if len(view) else "-",
+                f"{view['Close'].max():.2f}",
+                f"{view['Close'].min():.2f}"
+            ]
+        })
+        return view, summary
+
+    return compute_view, volume_profile
+
+
+@app.cell
+def _(manifest, mo):
     symbol = mo.ui.dropdown(
-        STOCK_SYMBOLS,
-        value = STOCK_SYMBOLS[0],
+        list(manifest.index),
+        value = manifest.index[0],
         label = "Select symbol"
     )
     symbol
@@ -26,22 +104,105 @@ def _(mo):
 
 
 @app.cell
-def _(mo, symbol):
+def _(manifest, mo, pd, symbol):
+    symbol_info = manifest.loc[symbol.value]
+    end_date = pd.Timestamp(symbol_info["end_date"]).date()
+    date_range = mo.ui.date_range(
+        start = pd.Timestamp(symbol_info["start_date"]).date(),
+        stop = end_date,
+        value = (max(pd.Timestamp(symbol_info["start_date"]), pd.Timestamp(end_date) - pd.DateOffset(years = 2)).date(), end_date),
+        label = "Date range"
+    )
+    ma_periods = mo.ui.multiselect(
+        ["5", "15", "50", "200", "1000"],
+        value = ["15", "50", "200"],
+        label = "Moving averages"
+    )
+    window = mo.ui.slider(
+        5, 1000, value = 200, step = 5, show_value = True, label = "Rolling window"
+    )
+    mo.hstack([date_range, ma_periods, window], justify = "start")
+    return date_range, ma_periods, symbol_info, window
+
+
+@app.cell
+def _(mo, symbol, symbol_info):
+    change_color = "mediumseagreen" if symbol_info["last_change"] >= 0 else "indianred"
     mo.md(f"""
     # {symbol.value}
+    **{symbol_info["last_close"]}** <span style="color: {change_color}">**({symbol_info["last_change"]:.2%})**</span> as of {symbol_info["end_date"]} from {symbol_info["num_records"]} records
     """)
     return
 
 
 @app.cell
-def _(mo, symbol):
-    mo.image(src = f"../images/{symbol.value}/{symbol.value}_Max_Period_of_No_Return.png")
+def _(compute_view, date_range, ma_periods, symbol, window):
+    view, summary = compute_view(
+        symbol.value,
+        date_range.value[0],
+        date_range.value[1],
+        tuple(sorted(int(p) for p in ma_periods.value)),
+        window.value
+    )
+    return summary, view
+
+
+@app.cell
+def _(ma_periods, mo, plt, summary, symbol, view, window):
+    def _line_plot(columns, y_label, title):
+        fig, ax = plt.subplots(figsize = (10, 4), dpi = 100)
+
+        for col_name in columns:
+            ax.plot(view["Date"], view[col_name], label = col_name, linewidth = 1.25)
+
+        ax.grid(alpha = 0.3)
+        ax.legend(fontsize = "small")
+        ax.set_ylabel(y_label)
+        ax.set_title(f"{symbol.value} - {title}")
+        plt.close(fig)
+        return fig
+
+    mo.vstack([
+        mo.hstack([
+            _line_plot(
+                ["Close"] + [f"MA {p} days" for p in sorted(int(p) for p in ma_periods.value)],
+                "Close Price",
+                "Close price and moving averages"
+            ),
+            mo.ui.table(summary, selection = None, label = "Summary over the selected range")
+        ], widths = [3, 1]),
+        mo.hstack([
+            _line_plot(
+                [f"% Net Returns {window.value} days", f"% Rolling Volatility {window.value} days"],
+                "Percentage",
+                f"{window.value} days rolling returns and volatility"
+            ),
+            _line_plot(["% Down from High"], "Percentage", "Drawdown from the high within the range")
+        ])
+    ])
     return
 
 
 @app.cell
-def _(mo, symbol):
-    mo.image(src = f"../images/{symbol.value}/{symbol.value}_Volume_by_VWAP.png")
+def _(date_range, mo, np, plt, symbol, symbol_info, volume_profile):
+    _edges, _volume = volume_profile(symbol.value, date_range.value[0], date_range.value[1])
+    _traded = np.flatnonzero(_volume)
+    _traded = slice(_traded[0], _traded[-1] + 1) if _traded.size else slice(0, 0)
+
+    _fig, _ax = plt.subplots(figsize = (10, 4), dpi = 100)
+    _ax.bar(((_edges[:-1] + _edges[1:]) / 2)[_traded], _volume[_traded], width = np.diff(_edges)[0])
+    _ax.axvline(symbol_info["last_close"], linestyle = "dashdot", color = "goldenrod", label = "Last Close")
+    _ax.grid(alpha = 0.3)
+    _ax.legend(fontsize = "small")
+    _ax.set_xlabel("VWAP")
+    _ax.set_ylabel("Volume")
+    _ax.set_title(f"{symbol.value} - Volume by VWAP within the range")
+    plt.close(_fig)
+
+    mo.hstack([
+        _fig,
+        mo.image(src = f"../images/{symbol.value}/{symbol.value}_Max_Period_of_No_Return.png")
+    ])
     return
 
 
@@ -14,4 +14,196 @@ function filterSymbols() {
             }
         }
     }
-}
\ No newline at end of file
+}
+
+const SVG_NS = "http://www.w3.org/2000/svg";
+const CHART_SIZE = { width: 900, height: 450, top: 40, right: 20, bottom: 70, left: 70 };
+const MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"];
+const chartData = {};
+
+function registerChartData(data) {
+    chartData[data.symbol] = data.charts;
+
+    for (const container of document.querySelectorAll("[data-chart]")) {
+        let chart = data.charts[container.dataset.chart];
+        if (chart) {
+            renderChart(container, chart);
+        }
+    }
+}
+
+function svgElement(tag, attrs, text) {
+    let element = document.createElementNS(SVG_NS, tag);
+    for (const [key, value] of Object.entries(attrs)) {
+        element.setAttribute(key, value);
+    }
+    if (text !== undefined) {
+        element.textContent = text;
+    }
+    return element;
+}
+
+function niceTicks(min, max, count) {
+    let step = Math.pow(10, Math.floor(Math.log10((max - min) / count)));
+    let error = (max - min) / count / step;
+    step *= error >= 5 ? 5 : error >= 2 ? 2 : 1;
+
+    let ticks = [];
+    for (let tick = Math.ceil(min / step) * step; tick <= max + step * 1e-9; tick += step) {
+        ticks.push(+tick.toFixed(10));
+    }
+    return ticks;
+}
+
+function formatX(chart, value) {
+    if (chart.x_type === "date") {
+        let d = new Date(value * 86400000);
+        return `${d.getUTCDate()} ${MONTHS[d.getUTCMonth()]} ${d.getUTCFullYear()}`;
+    }
+    if (chart.x_type === "category") {
+        return chart.x[value];
+    }
+    return value;
+}
+
+function linePath(xs, ys, scaleX, scaleY) {
+    let path = "";
+    let isDrawing = false;
+
+    for (let i = 0; i < xs.length; i++) {
+        if (ys[i] === null) {
+            isDrawing = false;
+            continue;
+        }
+        path += `${isDrawing ? "L" : "M"}${scaleX(xs[i]).toFixed(1)},${scaleY(ys[i]).toFixed(1)}`;
+        isDrawing = true;
+    }
+    return path;
+}
+
+function renderChart(container, chart) {
+    const { width, height, top, right, bottom, left } = CHART_SIZE;
+    let xs = chart.x_type === "category" ? chart.x.map((_, i) => i) : chart.x;
+    let yValues = chart.series.flatMap((s) => s.y)
+        .concat((chart.hlines || []).map((h) => h.y))
+        .concat((chart.bands || []).flatMap((b) => b.lower.concat(b.upper)))
+        .filter((y) => y !== null);
+
+    let [yMin, yMax] = chart.y_range || [Math.min(...yValues), Math.max(...yValues)];
+    if (!chart.y_range) {
+        let pad = (yMax - yMin || Math.abs(yMax) || 1) * 0.05;
+        yMin -= pad;
+        yMax += pad;
+    }
+    let xMin = xs[0];
+    let xMax = xs[xs.length - 1] === xMin ? xMin + 1 : xs[xs.length - 1];
+
+    let scaleX = (x) => left + ((x - xMin) / (xMax - xMin)) * (width - left - right);
+    let scaleY = (y) => height - bottom - ((y - yMin) / (yMax - yMin)) * (height - top - bottom);
+
+    let svg = svgElement("svg", { viewBox: `0 0 ${width} ${height}`, class: "chart-svg" });
+    svg.appendChild(svgElement("rect", {
+        x: left, y: top, width: width - left - right, height: height - top - bottom, class: "chart-area"
+    }));
+
+    for (const tick of niceTicks(yMin, yMax, 6)) {
+        svg.appendChild(svgElement("line", {
+            x1: left, x2: width - right, y1: scaleY(tick), y2: scaleY(tick), class: "chart-grid"
+        }));
+        svg.appendChild(svgElement("text", {
+            x: left - 6, y: scaleY(tick) + 4, "text-anchor": "end", class: "chart-tick"
+        }, tick));
+    }
+
+    let xTickCount = chart.x_type === "category" ? xs.length : Math.min(6, xs.length);
+    for (let i = 0; i < xTickCount; i++) {
+        let x = xs[Math.round((i * (xs.length - 1)) / Math.max(xTickCount - 1, 1))];
+        svg.appendChild(svgElement("line", {
+            x1: scaleX(x), x2: scaleX(x), y1: top, y2: height - bottom, class: "chart-grid"
+        }));
+        svg.appendChild(svgElement("text", {
+            x: scaleX(x), y: height - bottom + 14, "text-anchor": "end",
+            transform: `rotate(-30 ${scaleX(x)} ${height - bottom + 14})`, class: "chart-tick"
+        }, formatX(chart, x)));
+    }
+
+    for (const band of chart.bands || []) {
+        let upper = linePath(xs, band.upper, scaleX, scaleY);
+        let lower = linePath(xs.slice().reverse(), band.lower.slice().reverse(), scaleX, scaleY);
+        svg.appendChild(svgElement("path", {
+            d: `${upper}L${lower.slice(1)}Z`, fill: band.color, "fill-opacity": band.opacity
+        }));
+    }
+
+    for (const hline of chart.hlines || []) {
+        svg.appendChild(svgElement("line", {
+            x1: left, x2: width - right, y1: scaleY(hline.y), y2: scaleY(hline.y),
+            stroke: hline.color, class: "chart-hline"
+        }));
+    }
+
+    for (const vline of chart.vlines || []) {
+        svg.appendChild(svgElement("line", {
+            x1: scaleX(vline), x2: scaleX(vline), y1: top, y2: height - bottom, class: "chart-vline"
+        }));
+    }
+
+    for (const series of chart.series) {
+        svg.appendChild(svgElement("path", {
+            d: linePath(xs, series.y, scaleX, scaleY), stroke: series.color, class: "chart-line"
+        }));
+    }
+
+    let legendItems = chart.series.map((s) => [s.label, s.color, "chart-line"])
+        .concat((chart.bands || []).map((b) => [b.label, b.color, "chart-band"]))
+        .concat((chart.hlines || []).filter((h) => h.label).map((h) => [h.label, h.color, "chart-hline"]));
+    legendItems.forEach(([label, color, cls], i) => {
+        let y = top + 16 + i * 18;
+        svg.appendChild(svgElement("line", {
+            x1: left + 10, x2: left + 34, y1: y - 4, y2: y - 4, stroke: color, class: cls
+        }));
+        svg.appendChild(svgElement("text", { x: left + 40, y: y, class: "chart-legend" }, label));
+    });
+
+    svg.appendChild(svgElement("text", {
+        x: width / 2, y: 24, "text-anchor": "middle", class: "chart-title"
+    }, chart.title));
+    svg.appendChild(svgElement("text", {
+        x: (left + width - right) / 2, y: height - 6, "text-anchor": "middle", class: "chart-label"
+    }, chart.x_label));
+    svg.appendChild(svgElement("text", {
+        x: 0, y: 0, "text-anchor": "middle", class: "chart-label",
+        transform: `translate(16 ${(top + height - bottom) / 2}) rotate(-90)`
+    }, chart.y_label));
+
+    let cursor = svgElement("line", { y1: top, y2: height - bottom, class: "chart-cursor", visibility: "hidden" });
+    let readout = svgElement("text", { x: width - right - 8, y: top + 16, "text-anchor": "end", class: "chart-legend" });
+    svg.append(cursor, readout);
+
+    svg.addEventListener("mousemove", (event) => {
+        let point = svg.createSVGPoint();
+        point.x = event.clientX;
+        point.y = event.clientY;
+        let x = point.matrixTransform(svg.getScreenCTM().inverse()).x;
+        let i = 0;
+        while (i < xs.length - 1 && scaleX(xs[i + 1]) <= x) {
+            i++;
+        }
+        if (i < xs.length - 1 && x - scaleX(xs[i]) > scaleX(xs[i + 1]) - x) {
+            i++;
+        }
+        cursor.setAttribute("x1", scaleX(xs[i]));
+        cursor.setAttribute("x2", scaleX(xs[i]));
+        cursor.setAttribute("visibility", "visible");
+        readout.textContent = `${formatX(chart, xs[i])}: ` + chart.series
+            .filter((s) => s.y[i] !== null)
+            .map((s) => `${s.label.split(" (")[0]} ${s.y[i]}`)
+            .join(" | ");
+    });
+    svg.addEventListener("mouseleave", () => {
+        cursor.setAttribute("visibility", "hidden");
+        readout.textContent = "";
+    });
+
+    container.replaceChildren(svg);
+}